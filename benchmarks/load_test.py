@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Linear Regression Project - Prueba de carga del servicio de predicción
+
+Lanza peticiones GET /predict concurrentes contra serve.py (conexiones
+keep-alive, sólo biblioteca estándar) y muestra el QPS y las latencias
+p50/p99 medidas por el cliente, junto con los contadores de /metrics
+del servidor (tamaño medio de los micro-lotes incluido).
+
+Uso:
+    python serve.py model.json &
+    python benchmarks/load_test.py [--host 127.0.0.1] [--port 8000]
+                                   [--concurrency 64] [--requests 20000]
+                                   [--output resultados.json]
+"""
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+
+def parse_args(args):
+    """Interpretar los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Prueba de carga de serve.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--concurrency", type=int, default=64, help="Conexiones simultáneas")
+    parser.add_argument("--requests", type=int, default=20000, help="Peticiones en total")
+    parser.add_argument("--output", help="Guardar el resultado en JSON")
+    return parser.parse_args(args)
+
+
+async def request(reader, writer, host, path):
+    """Enviar un GET por una conexión abierta y devolver el JSON de la respuesta."""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = 0
+    for line in head.decode("latin-1").split("\r\n"):
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    status = int(head.split(b" ", 2)[1])
+    body = await reader.readexactly(length)
+    return status, json.loads(body)
+
+
+async def worker(host, port, count, latencies, errors):
+    """Una conexión que envía count peticiones seguidas."""
+    reader, writer = await asyncio.open_connection(host, port)
+    rng = random.Random()
+    try:
+        for _ in range(count):
+            # Kilometrajes redondeados, como en las consultas reales
+            km = rng.randrange(0, 300) * 1000
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, host, f"/predict?km={km}")
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def run(options):
+    """Ejecutar la prueba y devolver el informe."""
+    latencies = []
+    errors = []
+    per_worker = [options.requests // options.concurrency + (1 if k < options.requests % options.concurrency else 0)
+                  for k in range(options.concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(options.host, options.port, count, latencies, errors)
+                           for count in per_worker if count))
+    elapsed = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(options.host, options.port)
+    _, server_metrics = await request(reader, writer, options.host, "/metrics")
+    writer.close()
+
+    latencies.sort()
+
+    def percentile(q):
+        return latencies[min(len(latencies) - 1, int(q * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "concurrency": options.concurrency,
+        "elapsed_s": elapsed,
+        "qps": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "server": server_metrics,
+    }
+
+
+def main(args):
+    """Función principal de la prueba de carga."""
+    options = parse_args(args[1:])
+    try:
+        report = asyncio.run(run(options))
+    except OSError as e:
+        print(f"❌ No se pudo conectar con http://{options.host}:{options.port}: {e}")
+        return 1
+
+    server = report["server"]
+    print(f"⚡ {report['requests']} peticiones en {report['elapsed_s']:.2f} s "
+          f"con {report['concurrency']} conexiones ({report['errors']} errores)")
+    print(f"   Cliente:  {report['qps']:.0f} QPS | p50 {report['p50_ms']:.2f} ms | p99 {report['p99_ms']:.2f} ms")
+    print(f"   Servidor: p50 {server['p50_ms']:.2f} ms | p99 {server['p99_ms']:.2f} ms | "
+          f"{server['batches']} micro-lotes de {server['mean_batch_size']:.1f} valores de media")
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+        print(f"✅ Resultados guardados en {options.output}")
+    return 0 if report["errors"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
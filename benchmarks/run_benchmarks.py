@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Linear Regression Project - Benchmarks
+
+Mide el tiempo, el rendimiento (filas/s) y el pico de memoria de las
+operaciones principales para varios tamaños de datos generados con
+generate_linear_data:
+
+    load_csv_data (motores "python" y "fast"), LinearRegression.fit,
+    predict, mse, score y las funciones de src.metrics
+
+Cada operación se repite varias veces y se guarda el mejor tiempo; el
+pico de memoria se mide aparte con tracemalloc, porque el rastreo
+ralentiza la ejecución. Los resultados se escriben en JSON para poder
+comparar entre commits.
+
+Uso:
+    python benchmarks/run_benchmarks.py [--sizes 1e3,1e4,...] [--repeat N]
+                                        [--output resultados.json]
+                                        [--compare anterior.json]
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+parent_dir = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+from src import metrics
+from src.data_utils import generate_linear_data, load_csv_data, write_linear_data
+from src.linear_regression import LinearRegression
+from src._backend import load_numpy
+
+DEFAULT_SIZES = "1e3,1e4,1e5,1e6"
+
+# Datos idénticos en cada ejecución para que las comparaciones sean justas
+SEED = 42
+
+# Una variación mayor que esto respecto a --compare se marca como regresión
+DEFAULT_THRESHOLD = 1.10
+
+
+def parse_args(args):
+    """Interpretar los argumentos de la línea de comandos."""
+    parser = argparse.ArgumentParser(description="Benchmarks de ft_linear_regression")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Tamaños separados por comas, p. ej. 1e3,1e8 (por defecto {DEFAULT_SIZES})")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Repeticiones por operación; se guarda el mejor tiempo")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="Archivo JSON de resultados")
+    parser.add_argument("--compare", metavar="ARCHIVO",
+                        help="JSON de una ejecución anterior con el que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Cociente de tiempos a partir del cual se marca una regresión")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="No medir el pico de memoria (más rápido)")
+    return parser.parse_args(args)
+
+
+def parse_sizes(text):
+    """Convertir "1e3,1e4" en [1000, 10000]."""
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+
+def measure(operation, repeat, track_memory):
+    """
+    Medir una operación.
+
+    Returns:
+        dict: seconds (mejor de repeat) y peak_bytes (o None)
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if track_memory:
+        tracemalloc.start()
+        try:
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": peak}
+
+
+def benchmark_size(n, repeat, track_memory, workdir):
+    """Ejecutar todas las operaciones para un tamaño de datos."""
+    X, y = generate_linear_data(n_samples=n, noise=0.1, slope=-0.02, intercept=9000.0, seed=SEED)
+    csv_path = os.path.join(workdir, f"data_{n}.csv")
+    write_linear_data(csv_path, n, noise=0.1, slope=-0.02, intercept=9000.0, seed=SEED)
+
+    model = LinearRegression()
+    model.fit(X, y)
+    predictions = model.predict(X)
+
+    operations = [
+        ("load_csv_data", lambda: load_csv_data(csv_path)),
+    ]
+    if load_numpy() is not None:
+        operations.append(("load_csv_data_fast", lambda: load_csv_data(csv_path, engine="fast")))
+    operations += [
+        ("fit", lambda: LinearRegression().fit(X, y)),
+        ("predict", lambda: model.predict(X)),
+        ("mse", lambda: model.mse(X, y)),
+        ("score", lambda: model.score(X, y)),
+        ("mean_squared_error", lambda: metrics.mean_squared_error(y, predictions)),
+        ("root_mean_squared_error", lambda: metrics.root_mean_squared_error(y, predictions)),
+        ("mean_absolute_error", lambda: metrics.mean_absolute_error(y, predictions)),
+        ("r_squared", lambda: metrics.r_squared(y, predictions)),
+        ("compute_all", lambda: metrics.compute_all(y, predictions)),
+    ]
+
+    results = []
+    for name, operation in operations:
+        result = measure(operation, repeat, track_memory)
+        result["operation"] = name
+        result["size"] = n
+        result["rows_per_second"] = n / result["seconds"] if result["seconds"] > 0 else None
+        results.append(result)
+        peak = "-" if result["peak_bytes"] is None else f"{result['peak_bytes'] / 1e6:.1f} MB"
+        print(f"   {name:<25} {result['seconds'] * 1000:10.3f} ms  "
+              f"{result['rows_per_second'] or 0:14,.0f} filas/s  pico {peak}")
+
+    os.remove(csv_path)
+    return results
+
+
+def environment():
+    """Describir el entorno para poder interpretar los resultados."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=parent_dir,
+                                capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        commit = None
+    np = load_numpy()
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__ if np is not None else None,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(previous_file, results, threshold=DEFAULT_THRESHOLD):
+    """Mostrar la variación de tiempo respecto a una ejecución anterior."""
+    with open(previous_file) as file:
+        previous = json.load(file)
+    before = {(r["operation"], r["size"]): r["seconds"] for r in previous["results"]}
+
+    print(f"\n📊 Comparación con {previous_file} (commit {previous['environment'].get('commit')}):")
+    regressions = 0
+    for result in results:
+        old = before.get((result["operation"], result["size"]))
+        if not old:
+            continue
+        ratio = result["seconds"] / old
+        mark = ""
+        if ratio > threshold:
+            mark = " ⚠️  más lento"
+            regressions += 1
+        print(f"   {result['operation']:<25} n={result['size']:<10} x{ratio:.2f}{mark}")
+    return regressions
+
+
+def main(args):
+    """Función principal de los benchmarks."""
+    options = parse_args(args[1:])
+    sizes = parse_sizes(options.sizes)
+
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for n in sizes:
+            print(f"⏱️  n = {n:,}")
+            results += benchmark_size(n, options.repeat, not options.no_memory, workdir)
+
+    report = {"environment": environment(), "results": results}
+    with open(options.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"✅ Resultados guardados en {options.output}")
+
+    if options.compare is not None:
+        regressions = compare(options.compare, results, options.threshold)
+        if regressions:
+            print(f"⚠️  {regressions} operación(es) más lentas que en la ejecución anterior")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -6,52 +6,313 @@ Este archivo sirve como punto de entrada principal para el proyecto
 de regresión lineal.
 """
 import sys
+import argparse
+
+
+def parse_args(args):
+    """Interpretar los argumentos de la línea de comandos (args incluye el nombre del programa)."""
+    parser = argparse.ArgumentParser(prog=args[0] if args else "main.py",
+                                     description="Regresión lineal sobre un CSV de km/precio")
+    parser.add_argument("csv_file", nargs="?", help="Archivo CSV con cabecera y columnas km,precio")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Entrenar en paralelo con N procesos sin cargar el CSV en memoria")
+    parser.add_argument("--gradient-descent", action="store_true",
+                        help="Entrenar con descenso de gradiente en lugar de mínimos cuadrados")
+    parser.add_argument("--robust", choices=("huber", "ransac", "theil-sen"),
+                        help="Entrenar con un estimador robusto a valores atípicos")
+    parser.add_argument("--multivariate", action="store_true",
+                        help="Regresión múltiple: la última columna es la dependiente y el resto variables")
+    parser.add_argument("--solver", choices=("cholesky", "qr"), default="cholesky",
+                        help="Método de resolución de la regresión múltiple")
+    parser.add_argument("--to-binary", metavar="ARCHIVO",
+                        help="Convertir el CSV al formato binario .lrbin y terminar")
+    parser.add_argument("--generate", type=int, metavar="N",
+                        help="Generar N filas sintéticas en el archivo indicado (.csv o .lrbin) y terminar")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Semilla para --generate, --cv y --bootstrap")
+    parser.add_argument("--cv", type=int, metavar="K",
+                        help="Validación cruzada K-fold: tabla de MSE, RMSE, MAE y R² por fold")
+    parser.add_argument("--bootstrap", type=int, metavar="B",
+                        help="Intervalos de confianza del 95%% de m y b con B remuestreos bootstrap")
+    parser.add_argument("--batch", nargs="+", metavar="ENTRADA",
+                        help="Entrenar un modelo por archivo (directorios, patrones glob o CSV) "
+                             "repartiéndolos entre --workers procesos; sin gráficos")
+    parser.add_argument("--summary", metavar="ARCHIVO", default="batch_summary.csv",
+                        help="Resumen de --batch (.csv o .json)")
+    parser.add_argument("--cache", nargs="?", const=".lr_cache", metavar="CARPETA",
+                        help="Reutilizar ajustes anteriores del mismo CSV (sin cambios: al instante; "
+                             "con filas añadidas: sólo se procesan las nuevas)")
+    parser.add_argument("--save-model", metavar="ARCHIVO",
+                        help="Guardar el modelo entrenado para usarlo con predict.py")
+    parser.add_argument("--quiet", action="store_true",
+                        help="Mostrar sólo avisos y errores de la librería")
+    return parser.parse_args(args[1:])
+
+
+def save_model(model, data_file, model_file):
+    """Guardar el modelo junto con la huella de los datos de entrenamiento."""
+    from src.data_utils import file_sha256
+    
+    try:
+        model.data_hash = file_sha256(data_file)
+        model.save(model_file)
+    except OSError as e:
+        print(f"❌ No se pudo guardar el modelo: {e}")
+
+
+def main_parallel(csv_file, workers, model_file=None):
+    """Entrenar repartiendo el archivo entre varios procesos."""
+    from src.parallel import parallel_fit_csv
+    
+    print(f"📁 Archivo especificado: {csv_file}")
+    try:
+        model = parallel_fit_csv(csv_file, workers=workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo entrenar el modelo: {e}")
+        return
+    
+    print(f"   Número de muestras: {model.stats.n}")
+    print(f"   📝 Ecuación: y = {model.slope:.4f}x + {model.intercept:.4f}")
+    print(f"   📊 MSE de entrenamiento: {model.training_mse():.4f} | R²: {model.training_score():.4f}")
+    if model.slope >= 0:
+        print("\033[91m⚠️  Advertencia: La pendiente del modelo no es descendente (m >= 0).\033[0m")
+    else:
+        print("\033[92m✅ La pendiente del modelo es descendente (m < 0).\033[0m")
+    if model_file is not None:
+        save_model(model, csv_file, model_file)
+    print("✅ Pipeline completo ejecutado!")
+
+
+def main_batch(inputs, workers, summary_file):
+    """Entrenar un modelo por archivo y guardar todos los resultados en un resumen."""
+    from src.batch import fit_many, write_summary
+    
+    try:
+        results, elapsed = fit_many(inputs, workers=workers)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return
+    
+    for result in results:
+        name = result["file"]
+        if result["error"] is not None:
+            print(f"   ❌ {name}: {result['error']} ({result['seconds']:.3f} s)")
+        else:
+            print(f"   ✅ {name}: y = {result['slope']:.4f}x + {result['intercept']:.4f} | "
+                  f"R² {result['r2']:.4f} | {result['n_samples']} filas en {result['seconds']:.3f} s")
+    
+    busy = sum(result["seconds"] for result in results)
+    failed = sum(1 for result in results if result["error"] is not None)
+    print(f"⏱️  {len(results)} archivo(s) en {elapsed:.3f} s de reloj "
+          f"({busy:.3f} s sumando cada archivo){f', {failed} con errores' if failed else ''}")
+    try:
+        write_summary(results, summary_file)
+    except OSError as e:
+        print(f"❌ No se pudo guardar el resumen: {e}")
+        return
+    print(f"💾 Resumen guardado en {summary_file}")
+
+
+def main_cached(csv_file, cache_dir, workers=None, model_file=None):
+    """Entrenar con la caché de ajustes: sólo se procesa lo que ha cambiado."""
+    import time
+    from src.fit_cache import FitCache
+    
+    print(f"📁 Archivo especificado: {csv_file}")
+    start = time.perf_counter()
+    try:
+        model, status = FitCache(cache_dir).fit(csv_file, workers=workers)
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo entrenar el modelo: {e}")
+        return
+    
+    labels = {"hit": "sin cambios, recuperado de la caché", "append": "sólo filas nuevas",
+              "miss": "entrenado desde cero"}
+    print(f"🗄️  Caché ({cache_dir}): {labels[status]} en {time.perf_counter() - start:.3f} s")
+    print(f"   Número de muestras: {model.stats.n}")
+    print(f"   📝 Ecuación: y = {model.slope:.4f}x + {model.intercept:.4f}")
+    print(f"   📊 MSE de entrenamiento: {model.training_mse():.4f} | R²: {model.training_score():.4f}")
+    if model_file is not None:
+        # La huella ya la ha calculado la caché
+        try:
+            model.save(model_file)
+        except OSError as e:
+            print(f"❌ No se pudo guardar el modelo: {e}")
+    print("✅ Pipeline completo ejecutado!")
+
+
+def main_multivariate(csv_file, solver):
+    """Entrenar una regresión múltiple leyendo el CSV por bloques."""
+    from src.data_utils import iter_csv_matrix_chunks, read_csv_header
+    from src.multivariate import MultipleLinearRegression
+    
+    print(f"📁 Archivo especificado: {csv_file}")
+    try:
+        names = read_csv_header(csv_file)
+        model = MultipleLinearRegression(solver=solver, feature_names=names[:-1])
+        model.fit_chunks(iter_csv_matrix_chunks(csv_file))
+    except (OSError, ValueError) as e:
+        print(f"❌ No se pudo entrenar el modelo: {e}")
+        return
+    
+    print(f"   Número de muestras: {model.n_samples}")
+    terms = " ".join(f"{coef:+.4f}·{name}" for coef, name in zip(model.coefficients, model.feature_names))
+    print(f"   📝 Ecuación: {names[-1]} = {terms} {model.intercept:+.4f}")
+    print(f"   📊 MSE de entrenamiento: {model.training_mse():.4f} | R²: {model.training_score():.4f}")
+    print("✅ Pipeline completo ejecutado!")
+
+
+def build_model(options):
+    """Crear el modelo elegido con --gradient-descent o --robust (por defecto, mínimos cuadrados)."""
+    if options.gradient_descent:
+        from src.gradient_descent import GradientDescentRegression
+        return GradientDescentRegression()
+    if options.robust is not None:
+        from src import robust
+        estimators = {"huber": robust.HuberRegression, "ransac": robust.RANSACRegression,
+                      "theil-sen": robust.TheilSenRegression}
+        return estimators[options.robust]()
+    from src import LinearRegression
+    return LinearRegression()
+
 
 def main(args):
     """Función principal del programa."""
     print("=== Linear Regression Project ===")
     print("🚀 Inicializando proyecto...")
     
+    options = parse_args(args)
+    
+    # La librería es silenciosa por defecto; el programa muestra su progreso
+    import logging
+    from src.log_utils import configure_logging
+    configure_logging(logging.WARNING if options.quiet else logging.INFO)
+    
+    if options.batch is not None:
+        main_batch(options.batch, options.workers, options.summary)
+        return
+    
     # Verificar que se pasó el archivo CSV como argumento
-    if len(args) < 2:
+    if options.csv_file is None:
         print("❌ Error: Debes especificar un archivo CSV")
-        print("💡 Uso: python main.py <archivo_csv>")
+        print("💡 Uso: python main.py <archivo_csv|archivo.lrbin> [--workers N] [--to-binary ARCHIVO]")
         print("📄 Ejemplo: python main.py data/data.csv")
         return
     
+    if options.generate is not None:
+        from src.data_utils import write_linear_data
+        try:
+            # Misma forma que data/data.csv: kilometrajes de 20 000 a 250 000 km
+            # (±5 % del rango de perturbación, unos 11 500 km por cada lado) y
+            # precio bajando de ~8 000 a ~3 200 (recta y ≈ 8500 - 0.021·km)
+            write_linear_data(options.csv_file, options.generate, noise=0.1, slope=-0.021,
+                              intercept=8500.0, seed=options.seed, x_range=(20000.0, 250000.0))
+        except (OSError, ValueError) as e:
+            print(f"❌ No se pudieron generar los datos: {e}")
+            return
+        print(f"✅ {options.generate} filas generadas en {options.csv_file}")
+        return
+    
+    if options.to_binary is not None:
+        from src.data_utils import convert_csv_to_binary
+        try:
+            n_rows = convert_csv_to_binary(options.csv_file, options.to_binary)
+        except (OSError, ValueError) as e:
+            print(f"❌ No se pudo convertir el archivo: {e}")
+            return
+        print(f"✅ {n_rows} filas convertidas a {options.to_binary}")
+        return
+    
+    if options.multivariate:
+        main_multivariate(options.csv_file, options.solver)
+        return
+    
+    if options.cache is not None:
+        main_cached(options.csv_file, options.cache, options.workers, options.save_model)
+        return
+    
+    if options.workers is not None:
+        main_parallel(options.csv_file, options.workers, options.save_model)
+        return
+    
     # Importar funciones necesarias
-    from src import load_csv_data, split_data, LinearRegression
-    from src.plot_utils import plot_regression
+    from src import Dataset
     
-    print("📊 Cargando datos desde CSV...")
-    print(f"📁 Archivo especificado: {args[1]}")
+    print(f"📁 Archivo especificado: {options.csv_file}")
     
-    # Cargar datos desde archivo CSV
-    X, y = load_csv_data(args[1])
+    if options.csv_file.endswith(".lrbin"):
+        # Formato binario: se mapea en memoria sin parsear nada
+        print("📊 Cargando datos desde archivo binario...")
+        try:
+            data = Dataset.from_binary(options.csv_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error al cargar datos: {e}")
+            data = Dataset()
+    else:
+        print("📊 Cargando datos desde CSV...")
+        # Cargar datos desde archivo CSV en columnas de doubles (no listas)
+        data = Dataset.from_csv(options.csv_file, engine="fast")
+    X, y = data.columns()
     
     if len(X) > 0 and len(y) > 0:
         print(f"✅ Datos cargados exitosamente: {len(X)} muestras")
-        print(f"📊 X (KM)(primeros 5): {X[:5]}")
-        print(f"📈 y (€)(primeros 5): {y[:5]}")
+        print(f"📊 X (KM)(primeros 5): {X[:5].tolist()}")
+        print(f"📈 y (€)(primeros 5): {y[:5].tolist()}")
         
         # Crear y entrenar modelo
         print("\n🤖 Creando modelo de regresión lineal...")
-        model = LinearRegression()
+        model = build_model(options)
         print("🔧 Entrenando modelo...")
-        model.fit(X, y)
+        model.fit(data)
+        if options.gradient_descent:
+            # Comparar con la solución exacta, que sale de los mismos estadísticos
+            exact_slope, exact_intercept = model.stats.coefficients()
+            print(f"⏱️  Descenso de gradiente: {model.n_iterations} iteraciones en {model.training_time:.3f} s "
+                  f"({model.iterations_per_second:.0f} it/s)")
+            print(f"   θ0 = {model.theta0:.6f}, θ1 = {model.theta1:.6f} (escala normalizada)")
+            print(f"   Diferencia con mínimos cuadrados: Δm = {model.slope - exact_slope:.3e}, "
+                  f"Δb = {model.intercept - exact_intercept:.3e}")
+        if options.robust is not None:
+            exact_slope, exact_intercept = model.stats.coefficients()
+            print(f"⏱️  {type(model).__name__}: {model.training_time:.3f} s")
+            print(f"   Diferencia con mínimos cuadrados: Δm = {model.slope - exact_slope:.3e}, "
+                  f"Δb = {model.intercept - exact_intercept:.3e}")
+        # Métricas de entrenamiento a partir de los estadísticos del ajuste
+        print(f"📊 MSE de entrenamiento: {model.training_mse():.4f} | R²: {model.training_score():.4f}")
         # Comprobación de pendiente descendente
         if model.slope is not None and model.slope >= 0:
             print("\033[91m⚠️  Advertencia: La pendiente del modelo no es descendente (m >= 0).\033[0m")
         else:
             print("\033[92m✅ La pendiente del modelo es descendente (m < 0).\033[0m")
+        if options.cv is not None:
+            from src.model_selection import cross_validate
+            try:
+                result = cross_validate(X, y, n_splits=options.cv, seed=options.seed)
+            except ValueError as e:
+                print(f"❌ No se pudo hacer la validación cruzada: {e}")
+            else:
+                print(f"\n🔁 Validación cruzada {options.cv}-fold ({result.elapsed:.3f} s):")
+                print(result.table())
+        if options.bootstrap is not None:
+            from src.bootstrap import bootstrap_coefficients
+            try:
+                result = bootstrap_coefficients(X, y, n_resamples=options.bootstrap, seed=options.seed)
+            except ValueError as e:
+                print(f"❌ No se pudo calcular el bootstrap: {e}")
+            else:
+                print("\n🎲 Intervalos de confianza bootstrap:")
+                print(result.summary())
+        if options.save_model is not None:
+            save_model(model, options.csv_file, options.save_model)
         # Hacer predicciones sobre todos los datos
-        predictions = model.predict(X)
+        predictions = model.predict(data)
         print("✅ Pipeline completo ejecutado!")
         # Guardar gráfico de regresión con el nombre del CSV
         import os
-        csv_filename = os.path.basename(args[1])
+        from src.plot_utils import plot_dataset
+        csv_filename = os.path.basename(options.csv_file)
         png_filename = os.path.splitext(csv_filename)[0] + ".png"
-        plot_regression(X, y, predictions, filename=png_filename)
+        plot_dataset(data, predictions, png_filename)
         print(f"✅ Gráfico guardado en graphics/{png_filename}")
         # Abrir el archivo PNG generado con el visor predeterminado
         try:
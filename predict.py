@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Linear Regression Project - Predicción
+
+Predice el precio de un vehículo a partir de su kilometraje usando un
+modelo guardado con `python main.py <csv> --save-model <archivo>`.
+Sólo importa el modelo: ni matplotlib ni las utilidades de datos, para
+que arranque rápido cuando se llama desde scripts o por lotes.
+
+Uso:
+    python predict.py <modelo.json> [km ...]
+
+Sin kilometrajes en la línea de comandos se piden por la entrada
+estándar, uno por línea. Las predicciones se guardan en una caché LRU
+(PREDICT_CACHE_SIZE), así que los kilometrajes repetidos no se recalculan.
+"""
+import sys
+
+# Kilometrajes distintos recordados por la caché de predict_one
+PREDICT_CACHE_SIZE = 4096
+
+
+def main(args):
+    """Función principal del programa de predicción."""
+    if len(args) < 2:
+        print("❌ Error: Debes especificar un archivo de modelo")
+        print("💡 Uso: python predict.py <modelo.json> [km ...]")
+        return 1
+    
+    from src.linear_regression import LinearRegression
+    
+    try:
+        model = LinearRegression.load(args[1]).enable_cache(PREDICT_CACHE_SIZE)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ No se pudo cargar el modelo: {e}")
+        return 1
+    
+    values = args[2:]
+    interactive = not values
+    if interactive:
+        values = (line.strip() for line in sys.stdin)
+    
+    for value in values:
+        if not value:
+            continue
+        try:
+            km = float(value)
+        except ValueError:
+            print(f"⚠️  Kilometraje no válido: '{value}'")
+            continue
+        price = model.predict_one(km)
+        print(f"{km:g} km → {price:.2f} €")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Linear Regression Project - Servicio de predicción
+
+Sirve por HTTP un modelo guardado con
+`python main.py <csv> --save-model <archivo>` (ver src/serving.py).
+
+Uso:
+    python serve.py <modelo.json> [--host 127.0.0.1] [--port 8000]
+                    [--max-batch 1024] [--max-delay-ms 2]
+
+Ejemplos:
+    curl "http://127.0.0.1:8000/predict?km=150000"
+    curl -d '{"km": [50000, 150000]}' http://127.0.0.1:8000/predict
+    curl http://127.0.0.1:8000/metrics
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+
+def parse_args(args):
+    """Interpretar los argumentos de la línea de comandos (args incluye el nombre del programa)."""
+    parser = argparse.ArgumentParser(prog=args[0] if args else "serve.py",
+                                     description="Servicio HTTP de predicción km → precio")
+    parser.add_argument("model_file", help="Modelo guardado con --save-model")
+    parser.add_argument("--host", default="127.0.0.1", help="Dirección en la que escuchar")
+    parser.add_argument("--port", type=int, default=8000, help="Puerto en el que escuchar")
+    parser.add_argument("--max-batch", type=int, default=1024,
+                        help="Valores máximos por llamada a predict")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0,
+                        help="Espera máxima para completar un micro-lote")
+    return parser.parse_args(args[1:])
+
+
+def main(args):
+    """Función principal del servicio."""
+    options = parse_args(args)
+
+    from src.linear_regression import LinearRegression
+    from src.log_utils import configure_logging
+    from src.serving import PredictionServer
+
+    configure_logging(logging.INFO)
+    # Las predicciones no se registran una a una
+    logging.getLogger("src.linear_regression").setLevel(logging.WARNING)
+
+    try:
+        model = LinearRegression.load(options.model_file)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ No se pudo cargar el modelo: {e}")
+        return 1
+
+    server = PredictionServer(model, max_batch_size=options.max_batch,
+                              max_delay=options.max_delay_ms / 1000)
+    try:
+        asyncio.run(server.serve_forever(options.host, options.port))
+    except KeyboardInterrupt:
+        print("\n👋 Servicio detenido")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
@@ -2,31 +2,79 @@
 Linear Regression Package
 
 Módulo principal para implementación de regresión lineal desde cero.
+
+Los nombres públicos se importan bajo demanda (PEP 562): `import src`
+no carga ningún submódulo, y cada uno se importa la primera vez que se
+accede a alguno de sus nombres. Así, por ejemplo, predecir con un modelo
+guardado no paga el coste de importar las utilidades de datos.
 """
 
-from .linear_regression import LinearRegression
-from .metrics import (
-    mean_squared_error,
-    root_mean_squared_error, 
-    mean_absolute_error,
-    r_squared
-)
-from .data_utils import (
-    generate_linear_data,
-    load_csv_data,
-    split_data
-)
+import importlib
+import logging
+
+# El paquete no muestra mensajes salvo que se llame a configure_logging
+logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __version__ = "1.0.0"
 __author__ = "Iker"
 
-__all__ = [
-    "LinearRegression",
-    "mean_squared_error",
-    "root_mean_squared_error",
-    "mean_absolute_error", 
-    "r_squared",
-    "generate_linear_data",
-    "load_csv_data",
-    "split_data"
-]
+# Nombre público -> submódulo que lo define
+_EXPORTS = {
+    "BaseRegression": "linear_regression",
+    "LinearRegression": "linear_regression",
+    "RegressionStats": "linear_regression",
+    "PredictionCache": "linear_regression",
+    "mean_squared_error": "metrics",
+    "root_mean_squared_error": "metrics",
+    "mean_absolute_error": "metrics",
+    "r_squared": "metrics",
+    "compute_all": "metrics",
+    "MetricsAccumulator": "metrics",
+    "generate_linear_data": "data_utils",
+    "iter_linear_data": "data_utils",
+    "write_linear_data": "data_utils",
+    "load_csv_data": "data_utils",
+    "Dataset": "data_utils",
+    "iter_csv_chunks": "data_utils",
+    "iter_csv_matrix_chunks": "data_utils",
+    "read_csv_header": "data_utils",
+    "convert_csv_to_binary": "data_utils",
+    "load_binary_data": "data_utils",
+    "split_data": "data_utils",
+    "split_indices": "data_utils",
+    "IndexedView": "data_utils",
+    "hash_split_mask": "data_utils",
+    "iter_csv_split_chunks": "data_utils",
+    "GradientDescentRegression": "gradient_descent",
+    "MultipleLinearRegression": "multivariate",
+    "parallel_fit_csv": "parallel",
+    "cross_validate": "model_selection",
+    "repeated_holdout": "model_selection",
+    "k_fold_indices": "model_selection",
+    "bootstrap_coefficients": "bootstrap",
+    "bootstrap_chunks": "bootstrap",
+    "configure_logging": "log_utils",
+    "PredictionServer": "serving",
+    "fit_many": "batch",
+    "FitCache": "fit_cache",
+    "HuberRegression": "robust",
+    "RANSACRegression": "robust",
+    "TheilSenRegression": "robust",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    """Importar el submódulo que define name la primera vez que se usa."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Guardarlo para que los siguientes accesos no pasen por aquí
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
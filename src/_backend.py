@@ -0,0 +1,85 @@
+"""
+Selección del backend numérico.
+
+numpy es una dependencia opcional: si está instalada se usa para las
+rutas vectorizadas y, si no, el código recurre a las implementaciones
+en Python puro. numpy se importa bajo demanda para no penalizar el
+arranque cuando sólo se trabaja con unos pocos valores.
+"""
+
+import sys
+
+# Poner a False para forzar siempre la ruta en Python puro
+USE_NUMPY = True
+
+# Por debajo de este tamaño convertir a ndarray cuesta más de lo que se gana
+NUMPY_MIN_SIZE = 512
+
+_numpy = None
+_numpy_checked = False
+
+
+def load_numpy():
+    """
+    Importar numpy bajo demanda.
+
+    Returns:
+        module or None: El módulo numpy, o None si no está disponible
+    """
+    global _numpy, _numpy_checked
+    if not USE_NUMPY:
+        return None
+    if not _numpy_checked:
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+        _numpy = numpy
+        _numpy_checked = True
+    return _numpy
+
+
+def is_ndarray(obj):
+    """Indicar si obj es un ndarray sin obligar a importar numpy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def is_dataset(obj):
+    """Indicar si obj es un data_utils.Dataset sin obligar a importar data_utils."""
+    for name in ("src.data_utils", "data_utils"):
+        module = sys.modules.get(name)
+        if module is not None and isinstance(obj, module.Dataset):
+            return True
+    return False
+
+
+def numpy_for(*arrays):
+    """
+    Decidir si conviene procesar los datos con numpy.
+
+    Se usa numpy si alguno de los argumentos ya es un ndarray o si el
+    primero es lo bastante grande como para amortizar la conversión.
+
+    Returns:
+        module or None: numpy si debe usarse la ruta vectorizada
+    """
+    for arr in arrays:
+        if is_ndarray(arr):
+            return load_numpy()
+    if arrays and len(arrays[0]) >= NUMPY_MIN_SIZE:
+        return load_numpy()
+    return None
+
+
+def as_float_array(np, data):
+    """
+    Ver los datos como ndarray float64 de una dimensión.
+
+    No copia si data ya es un ndarray float64 o un buffer de doubles
+    (array('d'), memoryview).
+    """
+    arr = np.asarray(data, dtype=np.float64)
+    if arr.ndim != 1:
+        raise ValueError("Se esperaba un vector de una dimensión")
+    return arr
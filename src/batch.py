@@ -0,0 +1,162 @@
+"""
+Entrenamiento por lotes: un LinearRegression por archivo.
+
+Pensado para ajustar un modelo por segmento de vehículo sin lanzar
+main.py una vez por archivo. Los archivos (un directorio, un patrón glob
+o una lista) se reparten entre varios procesos; cada uno lee su archivo
+por bloques con el motor rápido, entrena con partial_fit y devuelve los
+parámetros, las métricas de entrenamiento y el tiempo empleado. Un
+archivo con errores no detiene el lote: su error queda en el resumen.
+"""
+
+import glob
+import json
+import logging
+import os
+import time
+
+try:
+    from ._backend import load_numpy
+    from .data_utils import iter_csv_chunks, load_binary_data
+    from .linear_regression import LinearRegression
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy
+    from data_utils import iter_csv_chunks, load_binary_data
+    from linear_regression import LinearRegression
+
+logger = logging.getLogger(__name__)
+
+# Extensiones que se recogen al pasar un directorio
+BATCH_EXTENSIONS = (".csv", ".lrbin")
+
+# Filas por bloque al leer cada archivo
+BATCH_CHUNK_SIZE = 1 << 20
+
+SUMMARY_FIELDS = ("file", "n_samples", "slope", "intercept", "mse", "r2", "seconds", "error")
+
+
+def expand_inputs(inputs):
+    """
+    Convertir directorios y patrones glob en una lista de archivos.
+
+    Args:
+        inputs (str or list): Directorios, patrones glob o archivos
+
+    Returns:
+        list: Rutas sin repetir, en orden alfabético dentro de cada entrada
+    """
+    if isinstance(inputs, str):
+        inputs = [inputs]
+    paths = []
+    for entry in inputs:
+        if os.path.isdir(entry):
+            found = [os.path.join(entry, name) for name in os.listdir(entry)
+                     if name.endswith(BATCH_EXTENSIONS)]
+        elif glob.has_magic(entry):
+            found = glob.glob(entry)
+        else:
+            found = [entry]
+        for path in sorted(found):
+            if path not in paths:
+                paths.append(path)
+    return paths
+
+
+def fit_file(filepath):
+    """
+    Entrenar un modelo con un archivo (en un proceso trabajador).
+
+    Returns:
+        dict: file, n_samples, slope, intercept, mse, r2, seconds y error
+            (None si todo fue bien; los demás campos son None si no)
+    """
+    start = time.perf_counter()
+    result = dict.fromkeys(SUMMARY_FIELDS)
+    result["file"] = filepath
+    try:
+        model = LinearRegression()
+        if filepath.endswith(".lrbin"):
+            model.fit(*load_binary_data(filepath))
+        else:
+            as_numpy = load_numpy() is not None
+            for X_chunk, y_chunk in iter_csv_chunks(filepath, BATCH_CHUNK_SIZE, as_numpy=as_numpy, engine="fast"):
+                model.partial_fit(X_chunk, y_chunk)
+            if not model.is_fitted:
+                raise ValueError("No se puede ajustar una recta: hacen falta 2 puntos con X distintos")
+        result.update(n_samples=model.stats.n, slope=model.slope, intercept=model.intercept,
+                      mse=model.training_mse(), r2=model.training_score())
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def fit_many(inputs, workers=None):
+    """
+    Entrenar un LinearRegression por archivo repartiendo los archivos entre procesos.
+
+    Args:
+        inputs (str or list): Directorios, patrones glob o archivos
+        workers (int): Número de procesos (por defecto, todos los núcleos)
+
+    Returns:
+        tuple: (resultados de fit_file en el orden de los archivos, segundos totales)
+
+    Raises:
+        ValueError: Si no hay ningún archivo que entrenar
+    """
+    start = time.perf_counter()
+    paths = expand_inputs(inputs)
+    if not paths:
+        raise ValueError(f"No se encontraron archivos en {inputs}")
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers debe ser al menos 1")
+
+    logger.info("📦 Entrenando %d modelo(s) con %d proceso(s)...", len(paths), min(workers, len(paths)))
+    if workers == 1 or len(paths) == 1:
+        results = [fit_file(path) for path in paths]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        def size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+
+        # Los archivos grandes primero: así ningún proceso se queda con uno grande al final
+        order = sorted(paths, key=size, reverse=True)
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            futures = {path: executor.submit(fit_file, path) for path in order}
+            results = [futures[path].result() for path in paths]
+
+    elapsed = time.perf_counter() - start
+    failed = sum(1 for result in results if result["error"] is not None)
+    logger.info("✅ %d modelo(s) entrenados en %.3f s (%d con errores)", len(results) - failed, elapsed, failed)
+    return results, elapsed
+
+
+def write_summary(results, filepath):
+    """
+    Guardar los resultados de un lote en un único archivo.
+
+    El formato depende de la extensión: .json (lista de objetos) o CSV
+    con una fila por archivo y las columnas de SUMMARY_FIELDS.
+
+    Args:
+        results (list): Resultados de fit_many
+        filepath (str): Archivo de resumen
+    """
+    if filepath.endswith(".json"):
+        with open(filepath, 'w') as file:
+            json.dump(results, file, indent=2)
+    else:
+        import csv
+        with open(filepath, 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=SUMMARY_FIELDS)
+            writer.writeheader()
+            for result in results:
+                writer.writerow({name: "" if result[name] is None else result[name] for name in SUMMARY_FIELDS})
+    logger.info("💾 Resumen de %d modelo(s) guardado en %s", len(results), filepath)
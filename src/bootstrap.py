@@ -0,0 +1,308 @@
+"""
+Intervalos de confianza bootstrap para la pendiente y la intersección.
+
+Cada remuestreo se describe con pesos sobre las filas originales (cuántas
+veces aparece cada una) y su recta sale de cinco sumas ponderadas:
+Σw, Σw·x, Σw·y, Σw·x² y Σw·x·y. Así no se copia ningún conjunto de
+datos remuestreado:
+
+- "index": remuestreo clásico con reemplazamiento. Los índices de un lote
+  de remuestreos se generan de una vez como una matriz y las sumas se
+  calculan de forma vectorizada.
+- "poisson": cada fila recibe un peso Poisson(1) independiente. No
+  necesita conocer n de antemano, así que sirve también para datos por
+  bloques (bootstrap_chunks): las sumas de todos los remuestreos se
+  acumulan bloque a bloque con un producto de matrices.
+
+Los lotes de remuestreos se reparten entre varios procesos. Los datos se
+centran antes de sumar para evitar cancelaciones con kilometrajes grandes.
+"""
+
+import logging
+import os
+import time
+
+try:
+    from ._backend import load_numpy, as_float_array
+    from .linear_regression import RegressionStats
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy, as_float_array
+    from linear_regression import RegressionStats
+
+logger = logging.getLogger(__name__)
+
+METHODS = ("index", "poisson")
+
+# Elementos (remuestreos × filas) por lote: limita la memoria de las matrices temporales
+BATCH_ELEMENTS = 1 << 22
+
+# Por debajo de este trabajo total (remuestreos × filas) no compensa crear procesos
+MIN_PARALLEL_WORK = 1 << 24
+
+
+class BootstrapResult:
+    """
+    Resultado de un bootstrap.
+
+    Attributes:
+        slope (float): Pendiente con todos los datos
+        intercept (float): Intersección con todos los datos
+        slope_interval (tuple): Intervalo percentil de la pendiente
+        intercept_interval (tuple): Intervalo percentil de la intersección
+        slopes (list): Pendiente de cada remuestreo válido
+        intercepts (list): Intersección de cada remuestreo válido
+        confidence (float): Nivel de confianza
+        method (str): "index" o "poisson"
+        elapsed (float): Segundos empleados
+    """
+
+    def __init__(self, slope, intercept, slopes, intercepts, confidence, method, elapsed):
+        """Calcular los intervalos a partir de las rectas remuestreadas."""
+        self.slope = slope
+        self.intercept = intercept
+        self.slopes = slopes
+        self.intercepts = intercepts
+        self.confidence = confidence
+        self.method = method
+        self.elapsed = elapsed
+        alpha = (1 - confidence) / 2
+        self.slope_interval = (_percentile(slopes, alpha), _percentile(slopes, 1 - alpha))
+        self.intercept_interval = (_percentile(intercepts, alpha), _percentile(intercepts, 1 - alpha))
+
+    @property
+    def n_resamples(self):
+        """Número de remuestreos válidos."""
+        return len(self.slopes)
+
+    def summary(self):
+        """Texto con los intervalos y el tiempo empleado."""
+        level = int(round(self.confidence * 100))
+        return "\n".join([
+            f"   📈 Pendiente (m): {self.slope:.6f}  IC {level}%: "
+            f"[{self.slope_interval[0]:.6f}, {self.slope_interval[1]:.6f}]",
+            f"   📍 Intersección (b): {self.intercept:.4f}  IC {level}%: "
+            f"[{self.intercept_interval[0]:.4f}, {self.intercept_interval[1]:.4f}]",
+            f"   🎲 {self.n_resamples} remuestreos ({self.method}) en {self.elapsed:.3f} s",
+        ])
+
+
+def _percentile(values, q):
+    """Percentil con interpolación lineal (igual que numpy.percentile)."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("No hay remuestreos válidos")
+    position = q * (len(ordered) - 1)
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _lines_from_sums(np, w, sx, sy, sxx, sxy):
+    """Rectas (en coordenadas centradas) de varios remuestreos a partir de sus sumas."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = (w * sxy - sx * sy) / (w * sxx - sx * sx)
+        intercepts = (sy - slopes * sx) / w
+    return slopes, intercepts
+
+
+def _bootstrap_batch(xc, yc, n_resamples, method, seed):
+    """
+    Calcular las rectas de n_resamples remuestreos (en un proceso trabajador).
+
+    Args:
+        xc, yc (ndarray): Datos centrados
+        n_resamples (int): Remuestreos de este lote
+        method (str): "index" o "poisson"
+        seed (SeedSequence): Semilla independiente del lote
+
+    Returns:
+        tuple: (pendientes, intersecciones centradas) como ndarrays
+    """
+    np = load_numpy()
+    rng = np.random.default_rng(seed)
+    n = len(xc)
+    batch = max(1, BATCH_ELEMENTS // n)
+    slopes = []
+    intercepts = []
+    if method == "poisson":
+        features = np.column_stack([np.ones(n), xc, yc, xc * xc, xc * yc])
+    for start in range(0, n_resamples, batch):
+        count = min(batch, n_resamples - start)
+        if method == "index":
+            indices = rng.integers(0, n, size=(count, n))
+            xs = xc[indices]
+            ys = yc[indices]
+            sums = (float(n), xs.sum(axis=1), ys.sum(axis=1),
+                    np.einsum('ij,ij->i', xs, xs), np.einsum('ij,ij->i', xs, ys))
+        else:
+            weights = rng.poisson(1.0, size=(count, n)).astype(np.float64)
+            sums = (weights @ features).T
+        batch_slopes, batch_intercepts = _lines_from_sums(np, *sums)
+        slopes.append(batch_slopes)
+        intercepts.append(batch_intercepts)
+    return np.concatenate(slopes), np.concatenate(intercepts)
+
+
+def _bootstrap_pure(xc, yc, n_resamples, method, seed):
+    """Versión en Python puro (sin numpy) de _bootstrap_batch."""
+    import math
+    import random
+
+    rng = random.Random(seed)
+    n = len(xc)
+    slopes = []
+    intercepts = []
+    for _ in range(n_resamples):
+        w = sx = sy = sxx = sxy = 0.0
+        if method == "index":
+            rows = ((xc[i], yc[i], 1) for i in (rng.randrange(n) for _ in range(n)))
+        else:
+            rows = ((x_val, y_val, _poisson1(rng, math.exp(-1.0))) for x_val, y_val in zip(xc, yc))
+        for x_val, y_val, weight in rows:
+            if weight:
+                w += weight
+                sx += weight * x_val
+                sy += weight * y_val
+                sxx += weight * x_val * x_val
+                sxy += weight * x_val * y_val
+        denominator = w * sxx - sx * sx
+        if w == 0 or denominator == 0:
+            continue
+        slope = (w * sxy - sx * sy) / denominator
+        slopes.append(slope)
+        intercepts.append((sy - slope * sx) / w)
+    return slopes, intercepts
+
+
+def _poisson1(rng, limit):
+    """Muestra de una Poisson(1) (método de Knuth)."""
+    k = 0
+    product = rng.random()
+    while product > limit:
+        k += 1
+        product *= rng.random()
+    return k
+
+
+def bootstrap_coefficients(X, y, n_resamples=2000, confidence=0.95, method="index", seed=None, workers=None):
+    """
+    Intervalos de confianza bootstrap de la pendiente y la intersección.
+
+    Args:
+        X (list or array): Variables independientes
+        y (list or array): Variables dependientes
+        n_resamples (int): Número de remuestreos
+        confidence (float): Nivel de confianza de los intervalos percentil
+        method (str): "index" (con reemplazamiento) o "poisson" (pesos Poisson(1))
+        seed (int): Semilla para obtener siempre los mismos intervalos
+        workers (int): Procesos a usar (por defecto, todos los núcleos)
+
+    Returns:
+        BootstrapResult: Rectas remuestreadas e intervalos
+    """
+    if method not in METHODS:
+        raise ValueError(f"method debe ser uno de {METHODS}")
+    if n_resamples < 1:
+        raise ValueError("n_resamples debe ser al menos 1")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence debe estar entre 0 y 1")
+
+    start_time = time.perf_counter()
+    stats = RegressionStats.from_data(X, y)
+    slope, intercept = stats.coefficients()
+    logger.info("🎲 Bootstrap de %d remuestreos (%s)...", n_resamples, method)
+
+    np = load_numpy()
+    if np is None:
+        xc = [x_val - stats.mean_x for x_val in X]
+        yc = [y_val - stats.mean_y for y_val in y]
+        slopes, centered = _bootstrap_pure(xc, yc, n_resamples, method, seed)
+    else:
+        xc = as_float_array(np, X) - stats.mean_x
+        yc = as_float_array(np, y) - stats.mean_y
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if n_resamples * len(xc) < MIN_PARALLEL_WORK:
+            workers = 1
+        workers = min(workers, n_resamples)
+        # Un lote por proceso, cada uno con su propio flujo aleatorio
+        sizes = [n_resamples // workers + (1 if k < n_resamples % workers else 0) for k in range(workers)]
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_bootstrap_batch, xc, yc, size, method, batch_seed)
+                           for size, batch_seed in zip(sizes, seeds)]
+                parts = [future.result() for future in futures]
+        else:
+            parts = [_bootstrap_batch(xc, yc, sizes[0], method, seeds[0])]
+        slopes = np.concatenate([part[0] for part in parts])
+        centered = np.concatenate([part[1] for part in parts])
+        valid = np.isfinite(slopes) & np.isfinite(centered)
+        slopes = slopes[valid].tolist()
+        centered = centered[valid].tolist()
+
+    # Deshacer el centrado: y = ȳ + c + m·(x - x̄)
+    intercepts = [stats.mean_y + c - m * stats.mean_x for m, c in zip(slopes, centered)]
+    result = BootstrapResult(slope, intercept, slopes, intercepts, confidence, method,
+                             time.perf_counter() - start_time)
+    logger.info("✅ Bootstrap completado en %.3f s", result.elapsed)
+    return result
+
+
+def bootstrap_chunks(chunks, n_resamples=1000, confidence=0.95, seed=None):
+    """
+    Bootstrap Poisson en una sola pasada sobre datos por bloques.
+
+    Cada fila recibe un peso Poisson(1) por remuestreo y las cinco sumas
+    de todos los remuestreos se acumulan bloque a bloque, así que la
+    memoria es O(n_resamples × tamaño de bloque) y no depende del total
+    de filas. Los datos se desplazan por las medias del primer bloque.
+
+    Args:
+        chunks (iterable): Pares (X_chunk, y_chunk), p. ej. iter_csv_chunks(ruta)
+        n_resamples (int): Número de remuestreos
+        confidence (float): Nivel de confianza
+        seed (int): Semilla del generador
+
+    Returns:
+        BootstrapResult: Rectas remuestreadas e intervalos
+    """
+    np = load_numpy()
+    if np is None:
+        raise ImportError("bootstrap_chunks necesita numpy")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence debe estar entre 0 y 1")
+
+    start_time = time.perf_counter()
+    logger.info("🎲 Bootstrap Poisson por bloques de %d remuestreos...", n_resamples)
+    rng = np.random.default_rng(seed)
+    stats = RegressionStats()
+    sums = np.zeros((n_resamples, 5))
+    shift = None
+    for X_chunk, y_chunk in chunks:
+        if len(X_chunk) == 0:
+            continue
+        X_chunk = as_float_array(np, X_chunk)
+        y_chunk = as_float_array(np, y_chunk)
+        stats.update(X_chunk, y_chunk)
+        if shift is None:
+            shift = (float(X_chunk.mean()), float(y_chunk.mean()))
+        xc = X_chunk - shift[0]
+        yc = y_chunk - shift[1]
+        features = np.column_stack([np.ones(len(xc)), xc, yc, xc * xc, xc * yc])
+        # Sub-bloques para acotar la matriz de pesos
+        step = max(1, BATCH_ELEMENTS // n_resamples)
+        for start in range(0, len(xc), step):
+            weights = rng.poisson(1.0, size=(n_resamples, min(step, len(xc) - start))).astype(np.float64)
+            sums += weights @ features[start:start + step]
+
+    slope, intercept = stats.coefficients()
+    slopes, centered = _lines_from_sums(np, *sums.T)
+    valid = np.isfinite(slopes) & np.isfinite(centered)
+    slopes = slopes[valid].tolist()
+    intercepts = [shift[1] + c - m * shift[0] for m, c in zip(slopes, centered[valid].tolist())]
+    result = BootstrapResult(slope, intercept, slopes, intercepts, confidence, "poisson",
+                             time.perf_counter() - start_time)
+    logger.info("✅ Bootstrap completado en %.3f s", result.elapsed)
+    return result
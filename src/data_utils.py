@@ -5,7 +5,32 @@ Este módulo contiene funciones auxiliares para cargar, generar
 y manipular datasets para el proyecto.
 """
 
-def generate_linear_data(n_samples=100, noise=0.1, slope=2.0, intercept=1.0):
+import logging
+import os
+import struct
+import sys
+
+try:
+    from ._backend import load_numpy, is_ndarray
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy, is_ndarray
+
+logger = logging.getLogger(__name__)
+
+# Formato binario columnar: cabecera + columna X (float64) + columna y (float64)
+BINARY_MAGIC = b"LRBIN\x00\x00\x00"
+BINARY_VERSION = 1
+# magic, versión, tamaño de cabecera, número de filas, longitud de los nombres
+_BINARY_HEADER = struct.Struct("<8sIIQI")
+# Las columnas empiezan alineadas para que memmap pueda verlas sin copiar
+_BINARY_ALIGNMENT = 64
+
+# Motores de lectura de CSV: línea a línea en Python o por bloques con numpy
+CSV_ENGINES = ("python", "fast")
+# Tamaño de lectura del motor rápido
+FAST_BLOCK_BYTES = 8 * 1024 * 1024
+
+def generate_linear_data(n_samples=100, noise=0.1, slope=2.0, intercept=1.0, seed=None):
     """
     Generar datos sintéticos con relación lineal.
     
@@ -14,16 +39,20 @@ def generate_linear_data(n_samples=100, noise=0.1, slope=2.0, intercept=1.0):
         noise (float): Nivel de ruido en los datos
         slope (float): Pendiente real de la línea
         intercept (float): Intersección real con el eje Y
+        seed (int): Semilla para obtener siempre los mismos datos
         
     Returns:
         tuple: (X, y) datos generados
     """
     import random
     
-    print(f"📊 Generando {n_samples} muestras sintéticas...")
-    print(f"   📈 Pendiente: {slope}")
-    print(f"   📍 Intersección: {intercept}")
-    print(f"   🔊 Nivel de ruido: {noise}")
+    if seed is not None:
+        random = random.Random(seed)
+    
+    logger.info("📊 Generando %s muestras sintéticas...", n_samples)
+    logger.info("   📈 Pendiente: %s", slope)
+    logger.info("   📍 Intersección: %s", intercept)
+    logger.info("   🔊 Nivel de ruido: %s", noise)
     
     X = []
     y = []
@@ -43,167 +72,1263 @@ def generate_linear_data(n_samples=100, noise=0.1, slope=2.0, intercept=1.0):
         X.append(x_val)
         y.append(y_val)
     
-    print(f"✅ Datos generados exitosamente")
-    print(f"   📊 Rango X: [{min(X):.2f}, {max(X):.2f}]")
-    print(f"   📈 Rango y: [{min(y):.2f}, {max(y):.2f}]")
+    logger.info("✅ Datos generados exitosamente")
+    if logger.isEnabledFor(logging.INFO) and n_samples > 0:
+        logger.info("   📊 Rango X: [%.2f, %.2f]", min(X), max(X))
+        logger.info("   📈 Rango y: [%.2f, %.2f]", min(y), max(y))
     
     return X, y
 
-def load_csv_data(filepath):
+def iter_linear_data(n_samples, noise=0.1, slope=2.0, intercept=1.0, seed=None, chunk_size=1 << 20,
+                     x_range=(0.0, 100.0)):
+    """
+    Generar datos sintéticos por bloques, con la misma distribución que
+    generate_linear_data.
+    
+    Con numpy cada bloque se genera de forma vectorizada con un
+    numpy.random.Generator; sin numpy se usa random.Random. Con la misma
+    semilla (y el mismo backend) los datos son siempre los mismos, sea
+    cual sea chunk_size. Sólo se mantiene en memoria el bloque actual.
+    
+    Args:
+        n_samples (int): Número de muestras a generar
+        noise (float): Nivel de ruido (proporcional a |y|)
+        slope (float): Pendiente real de la línea
+        intercept (float): Intersección real con el eje Y
+        seed (int): Semilla del generador
+        chunk_size (int): Filas por bloque
+        x_range (tuple): (mínimo, máximo) de la rejilla de X. Cada valor se
+            perturba un ±5 % del rango (como en generate_linear_data con el
+            rango por defecto), así que los extremos pueden salirse de él
+        
+    Yields:
+        tuple: (X_chunk, y_chunk) como ndarrays (o array('d') sin numpy)
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    x_low, x_high = x_range
+    if x_high <= x_low:
+        raise ValueError("x_range debe ser (mínimo, máximo) con mínimo < máximo")
+    step = (x_high - x_low) / n_samples if n_samples > 0 else 0.0
+    jitter = (x_high - x_low) * 0.05
+    
+    np = load_numpy()
+    if np is not None:
+        # Un flujo por variable: el resultado no depende del tamaño de bloque
+        x_rng, noise_rng = [np.random.Generator(np.random.PCG64(s))
+                            for s in np.random.SeedSequence(seed).spawn(2)]
+        for start in range(0, n_samples, chunk_size):
+            count = min(chunk_size, n_samples - start)
+            # X repartido en x_range con una perturbación de ±jitter
+            X_chunk = np.arange(start, start + count, dtype=np.float64)
+            X_chunk *= step
+            X_chunk += x_rng.uniform(-jitter, jitter, count)
+            X_chunk += x_low
+            y_chunk = X_chunk * slope
+            y_chunk += intercept
+            # Ruido proporcional al valor sin ruido
+            y_chunk += noise_rng.uniform(-noise, noise, count) * np.abs(y_chunk)
+            yield X_chunk, y_chunk
+        return
+    
+    import random
+    from array import array
+    
+    x_rng = random.Random(seed)
+    noise_rng = random.Random(x_rng.getrandbits(64))
+    for start in range(0, n_samples, chunk_size):
+        X_chunk = array('d')
+        y_chunk = array('d')
+        for i in range(start, min(start + chunk_size, n_samples)):
+            x_val = i * step + x_rng.uniform(-jitter, jitter) + x_low
+            y_perfect = slope * x_val + intercept
+            X_chunk.append(x_val)
+            y_chunk.append(y_perfect + noise_rng.uniform(-noise, noise) * abs(y_perfect))
+        yield X_chunk, y_chunk
+
+def write_linear_data(filepath, n_samples, noise=0.1, slope=2.0, intercept=1.0, seed=None,
+                      chunk_size=1 << 20, decimals=None, x_range=(0.0, 100.0)):
+    """
+    Generar datos sintéticos y escribirlos directamente en disco.
+    
+    El formato depende de la extensión: .lrbin para el formato binario
+    columnar (ver load_binary_data) y CSV km,price para cualquier otra.
+    Los datos se generan con iter_linear_data y se escriben bloque a
+    bloque, así que se pueden crear archivos de cientos de millones de
+    filas con memoria constante. El archivo se escribe en un temporal y
+    se renombra al terminar.
+    
+    Args:
+        filepath (str): Ruta del archivo a generar
+        n_samples (int): Número de muestras
+        noise (float): Nivel de ruido (proporcional a |y|)
+        slope (float): Pendiente real de la línea
+        intercept (float): Intersección real con el eje Y
+        seed (int): Semilla del generador
+        chunk_size (int): Filas por bloque
+        decimals (int): Decimales en el CSV (por defecto, precisión completa)
+        x_range (tuple): (mínimo, máximo) de la rejilla de X (ver iter_linear_data)
+        
+    Returns:
+        int: Número de filas escritas
+    """
+    column_names = ["km", "price"]
+    binary = filepath.endswith(".lrbin")
+    logger.info("📊 Escribiendo %s muestras sintéticas en %s...", n_samples, filepath)
+    
+    tmp_path = filepath + ".tmp"
+    try:
+        if binary:
+            with open(tmp_path, 'wb') as out:
+                header = _binary_header_bytes(n_samples, column_names)
+                out.write(header)
+                # Se conoce n de antemano: cada columna va directamente a su sitio
+                x_offset = len(header)
+                y_offset = x_offset + 8 * n_samples
+                row = 0
+                for X_chunk, y_chunk in iter_linear_data(n_samples, noise, slope, intercept, seed, chunk_size, x_range):
+                    for offset, column in ((x_offset, X_chunk), (y_offset, y_chunk)):
+                        if hasattr(column, 'dtype'):
+                            column = column.astype("<f8", copy=False)
+                        elif sys.byteorder != "little":
+                            column = _swapped(column)
+                        out.seek(offset + 8 * row)
+                        column.tofile(out)
+                    row += len(X_chunk)
+        else:
+            row_format = "%r,%r" if decimals is None else f"%.{int(decimals)}f,%.{int(decimals)}f"
+            with open(tmp_path, 'w') as out:
+                out.write(",".join(column_names) + "\n")
+                for X_chunk, y_chunk in iter_linear_data(n_samples, noise, slope, intercept, seed, chunk_size, x_range):
+                    out.write("\n".join(map(row_format.__mod__, zip(X_chunk.tolist(), y_chunk.tolist()))))
+                    out.write("\n")
+        os.replace(tmp_path, filepath)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    
+    logger.info("✅ %d filas guardadas en %s", n_samples, filepath)
+    return n_samples
+
+def _swapped(column):
+    """Copia de un array('d') con los bytes invertidos (máquinas big-endian)."""
+    from array import array
+    
+    swapped = array('d', column)
+    swapped.byteswap()
+    return swapped
+
+def _parse_csv_line(line):
+    """
+    Validar y convertir una línea de datos del CSV.
+    
+    Args:
+        line (str): Línea leída del archivo
+        
+    Returns:
+        tuple: ((x, y) o None si no es válida, número de columnas, mensaje de error o None)
+    """
+    # Dividir por coma y limpiar espacios
+    values = [val.strip() for val in line.strip().split(',')]
+    
+    # Verificar número de columnas
+    if len(values) < 2:
+        return None, len(values), f"Solo {len(values)} valor(es) encontrado(s), se necesitan al menos 2"
+    
+    try:
+        # Primera columna = X (variable independiente)
+        x_val = float(values[0])
+        
+        # Segunda columna = y (variable dependiente)  
+        y_val = float(values[1])
+    except ValueError as ve:
+        return None, len(values), f"Error de conversión a número: '{values[0]}', '{values[1]}' - {ve}"
+    
+    return (x_val, y_val), len(values), None
+
+def _report_bad_line(line_num, error):
+    """Mostrar el aviso de una línea inválida."""
+    logger.warning("⚠️  Línea %s: %s. Saltando línea.", line_num, error)
+
+def _warn_extra_columns(n_columns):
+    """Avisar de que sólo se usan las dos primeras columnas."""
+    logger.warning("\033[91mℹ️  Advertencia: CSV tiene %s columnas, usando solo las primeras 2\033[0m", n_columns)
+
+def _report_format_errors(skipped_lines, total_data_lines, processed_lines, n_columns=2):
+    """Mostrar el resumen del modo estricto cuando hay líneas inválidas."""
+    logger.error("❌ ERROR: Formato de datos inadecuado")
+    logger.error("   📋 Se encontraron %s línea(s) con errores de formato", skipped_lines)
+    logger.error("   📊 Líneas totales procesadas: %s", total_data_lines)
+    logger.error("   ✅ Líneas válidas encontradas: %s", processed_lines)
+    logger.error("   🚫 Líneas con errores: %s", skipped_lines)
+    logger.error("   💡 Formato requerido: Todas las líneas deben tener exactamente %d números", n_columns)
+    logger.error("   📝 Ejemplo correcto: 150000,4000")
+
+def _report_no_data():
+    """Mostrar el error de archivo sin datos válidos."""
+    logger.error("❌ ERROR: No se encontraron datos válidos")
+    logger.error("   📋 El archivo debe contener al menos una línea con 2 números")
+    logger.error("   💡 Formato esperado: numero1,numero2")
+
+def _iter_line_blocks(file, block_bytes):
+    """
+    Leer un archivo binario en bloques que terminan en fin de línea.
+    
+    Yields:
+        bytes: Bloque de líneas completas (el último puede no acabar en salto de línea)
+    """
+    pending = b''
+    while True:
+        data = file.read(block_bytes)
+        if not data:
+            if pending:
+                yield pending
+            return
+        data = pending + data
+        cut = data.rfind(b'\n') + 1
+        pending = data[cut:]
+        if cut > 0:
+            yield data[:cut]
+
+def _parse_block_fast(np, data):
+    """
+    Convertir un bloque de líneas "x,y" de una sola vez con numpy.
+    
+    La estructura se valida de forma vectorizada (exactamente una coma
+    entre cada par de saltos de línea y ningún campo vacío o sólo con
+    espacios) y los números se convierten con np.fromstring, que se
+    detiene ante el primer valor no numérico. Si algo no cuadra se
+    devuelve None para que el bloque se procese con _parse_block_strict
+    y los errores salgan con su número de línea.
+    
+    Returns:
+        tuple or None: (X, y, número de líneas) o None si el bloque no es trivial
+    """
+    import warnings
+    
+    if not data.endswith(b'\n'):
+        data += b'\n'
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n')
+        if b'\r' in data:
+            # \r suelto: es un salto de línea para el motor "python"
+            return None
+    buf = np.frombuffer(data, dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 0x0A)
+    commas = np.flatnonzero(buf == 0x2C)
+    n_lines = len(newlines)
+    # La coma i debe caer entre el salto de línea i-1 y el i
+    if (len(commas) != n_lines or not (commas < newlines).all()
+            or not (commas[1:] > newlines[:-1]).all()):
+        return None
+    
+    # fromstring lee un campo sólo con espacios como -1 o se lo salta:
+    # cada campo necesita al menos un carácter que no sea blanco
+    separators = np.empty(2 * n_lines, dtype=np.intp)
+    separators[0::2] = commas
+    separators[1::2] = newlines
+    starts = np.empty_like(separators)
+    starts[0] = 0
+    starts[1:] = separators[:-1] + 1
+    blank = np.zeros(256, dtype=bool)
+    blank[list(b' \t\x0b\x0c\n,')] = True
+    if not np.logical_or.reduceat(~blank[buf], starts).all():
+        return None
+    
+    with warnings.catch_warnings():
+        # numpy avisa (en lugar de fallar) si encuentra un valor no numérico
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            # Los saltos de línea pasan a ser separadores: x0,y0,x1,y1,...
+            values = np.fromstring(data.replace(b'\n', b','), sep=',')
+        except (DeprecationWarning, ValueError):
+            return None
+    if len(values) != 2 * n_lines:
+        return None
+    return values[0::2].copy(), values[1::2].copy(), n_lines
+
+def _parse_block_strict(data):
+    """
+    Validar y convertir un bloque de líneas una a una.
+    
+    Los errores se devuelven con el número de línea relativo al bloque
+    (la primera línea es la 1) para que quien llama los reporte con la
+    numeración del archivo.
+    
+    Returns:
+        dict: X, y (array('d')), lines, processed, skipped, errors y max_columns
+    """
+    from array import array
+    
+    text = data.decode('utf-8')
+    if '\r' in text:
+        # Saltos de línea universales, como al leer en modo texto
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines = text.split('\n')
+    if text.endswith('\n'):
+        lines.pop()
+    X = array('d')
+    y = array('d')
+    skipped = 0
+    errors = []
+    max_columns = 0
+    for local_line, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        point, n_columns, error = _parse_csv_line(line)
+        if n_columns > max_columns:
+            max_columns = n_columns
+        if point is None:
+            skipped += 1
+            errors.append((local_line, error))
+            continue
+        X.append(point[0])
+        y.append(point[1])
+    return {
+        "X": X,
+        "y": y,
+        "lines": len(lines),
+        "processed": len(X),
+        "skipped": skipped,
+        "errors": errors,
+        "max_columns": max_columns,
+    }
+
+def _iter_csv_fast(filepath, np, report):
+    """
+    Motor rápido: leer el CSV en bloques grandes y convertirlos con numpy.
+    
+    Los bloques que no pasan la validación vectorizada (líneas vacías,
+    columnas extra o valores inválidos) se procesan línea a línea, así
+    que el resultado y los avisos son los mismos que los del motor
+    "python". report acumula lines, processed y skipped.
+    
+    Yields:
+        tuple: (X, y) ndarrays de cada bloque
+    """
+    warned_columns = False
+    with open(filepath, 'rb') as file:
+        # Saltar la primera línea (headers)
+        file.readline()
+        first_line = 2
+        # En archivos pequeños, no reservar un búfer de lectura de 8 MB
+        block_bytes = max(1, min(FAST_BLOCK_BYTES, os.fstat(file.fileno()).st_size))
+        for data in _iter_line_blocks(file, block_bytes):
+            parsed = _parse_block_fast(np, data)
+            if parsed is not None:
+                X_block, y_block, n_lines = parsed
+            else:
+                result = _parse_block_strict(data)
+                if result["max_columns"] > 2 and not warned_columns:
+                    _warn_extra_columns(result["max_columns"])
+                    warned_columns = True
+                for local_line, error in result["errors"]:
+                    _report_bad_line(first_line + local_line - 1, error)
+                report["skipped"] += result["skipped"]
+                n_lines = result["lines"]
+                X_block = np.frombuffer(result["X"], dtype=np.float64)
+                y_block = np.frombuffer(result["y"], dtype=np.float64)
+            report["lines"] += n_lines
+            report["processed"] += len(X_block)
+            first_line += n_lines
+            if len(X_block) > 0:
+                yield X_block, y_block
+
+def _fast_engine_numpy(engine):
+    """Validar engine y devolver numpy si debe usarse el motor rápido."""
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"engine debe ser uno de {CSV_ENGINES}")
+    if engine != "fast":
+        return None
+    np = load_numpy()
+    if np is None:
+        logger.debug("numpy no está disponible: se usa el motor de lectura en Python")
+    return np
+
+def load_csv_data(filepath, engine="python"):
     """
     Cargar datos desde un archivo CSV.
     
+    Con engine="fast" el archivo se lee en bloques grandes que numpy
+    convierte de una vez (ver _iter_csv_fast); la validación y los avisos
+    son los mismos, pero X e y se devuelven como ndarrays. Sin numpy se
+    usa el motor "python".
+    
     Args:
         filepath (str): Ruta al archivo CSV
+        engine (str): "python" (línea a línea) o "fast"
         
     Returns:
         tuple: (X, y) datos cargados
     """
     X = []
     y = []
+    np = _fast_engine_numpy(engine)
 
     try:
-        print(f"📁 Cargando datos desde {filepath}...")
-        with open(filepath, 'r') as file:
-            lines = file.readlines()
-            
-            # Saltar la primera línea (headers)
-            first_data_line = True
-            skipped_lines = 0
-            processed_lines = 0
-            
-            for line_num, line in enumerate(lines[1:], start=2):  # Empezar desde línea 2
-                # Saltar líneas vacías
-                if not line.strip():
-                    continue
-                    
-                # Dividir por coma y limpiar espacios
-                values = [val.strip() for val in line.strip().split(',')]
+        logger.info("📁 Cargando datos desde %s...", filepath)
+        if np is not None:
+            report = {"lines": 0, "processed": 0, "skipped": 0}
+            blocks = list(_iter_csv_fast(filepath, np, report))
+            skipped_lines = report["skipped"]
+            processed_lines = report["processed"]
+            total_data_lines = report["lines"]
+            if blocks:
+                X = np.concatenate([X_block for X_block, _ in blocks])
+                y = np.concatenate([y_block for _, y_block in blocks])
+        else:
+            with open(filepath, 'r') as file:
+                # Saltar la primera línea (headers)
+                next(file, None)
+                first_data_line = True
+                skipped_lines = 0
+                processed_lines = 0
+                total_data_lines = 0
                 
-                # Advertir sobre columnas extra solo una vez
-                if first_data_line and len(values) > 2:
-                    print(f"\033[91mℹ️  Advertencia: CSV tiene {len(values)} columnas, usando solo las primeras 2\033[0m")
-                    first_data_line = False
-                
-                # Verificar número de columnas
-                if len(values) < 2:
-                    print(f"⚠️  Línea {line_num}: Solo {len(values)} valor(es) encontrado(s), se necesitan al menos 2. Saltando línea.")
-                    skipped_lines += 1
-                    continue
-                elif len(values) == 1:
-                    print(f"⚠️  Línea {line_num}: Solo 1 valor encontrado: '{values[0]}'. Saltando línea.")
-                    skipped_lines += 1
-                    continue
-                
-                try:
-                    # Primera columna = X (variable independiente)
-                    x_val = float(values[0])
+                for line_num, line in enumerate(file, start=2):  # Empezar desde línea 2
+                    total_data_lines += 1
+                    # Saltar líneas vacías
+                    if not line.strip():
+                        continue
                     
-                    # Segunda columna = y (variable dependiente)  
-                    y_val = float(values[1])
+                    point, n_columns, error = _parse_csv_line(line)
                     
-                    X.append(x_val)
-                    y.append(y_val)
-                    processed_lines += 1
+                    # Advertir sobre columnas extra solo una vez
+                    if first_data_line and n_columns > 2:
+                        _warn_extra_columns(n_columns)
+                        first_data_line = False
                     
-                except ValueError as ve:
-                    print(f"⚠️  Línea {line_num}: Error de conversión a número: '{values[0]}', '{values[1]}' - {ve}. Saltando línea.")
-                    skipped_lines += 1
-                    continue
+                    if point is None:
+                        _report_bad_line(line_num, error)
+                        skipped_lines += 1
+                        continue
                     
-        # Mostrar resumen de carga
-        total_data_lines = len(lines) - 1  # Excluir header
-        
+                    X.append(point[0])
+                    y.append(point[1])
+                    processed_lines += 1
+            
         # Validar si el formato es adecuado - MODO ESTRICTO
         if skipped_lines > 0:
-            print(f"❌ ERROR: Formato de datos inadecuado")
-            print(f"   📋 Se encontraron {skipped_lines} línea(s) con errores de formato")
-            print(f"   📊 Líneas totales procesadas: {total_data_lines}")
-            print(f"   ✅ Líneas válidas encontradas: {processed_lines}")
-            print(f"   🚫 Líneas con errores: {skipped_lines}")
-            print(f"   💡 Formato requerido: Todas las líneas deben tener exactamente 2 números")
-            print(f"   📝 Ejemplo correcto: 150000,4000")
+            _report_format_errors(skipped_lines, total_data_lines, processed_lines)
             return [], []
         
         if processed_lines == 0:
-            print(f"❌ ERROR: No se encontraron datos válidos")
-            print(f"   � El archivo debe contener al menos una línea con 2 números")
-            print(f"   💡 Formato esperado: numero1,numero2")
+            _report_no_data()
             return [], []
         
-        print(f"✅ Procesadas {processed_lines} líneas correctamente")
-        print(f"✅ Formato de archivo correcto - sin errores detectados")
-        print(f"📊 Total de datos cargados: {len(X)} puntos")
+        logger.info("✅ Procesadas %s líneas correctamente", processed_lines)
+        logger.info("✅ Formato de archivo correcto - sin errores detectados")
+        logger.info("📊 Total de datos cargados: %s puntos", len(X))
         return X, y
         
     except FileNotFoundError:
-        print(f"❌ Error: El archivo {filepath} no existe.")
+        logger.error("❌ Error: El archivo %s no existe.", filepath)
         return [], []
     except Exception as e:
-        print(f"❌ Error al cargar datos: {e}")
+        logger.error("❌ Error al cargar datos: %s", e)
         return [], []
 
-def split_data(X, y, test_size=0.2):
+def iter_csv_chunks(filepath, chunk_size=65536, as_numpy=False, engine="python"):
+    """
+    Leer un archivo CSV por bloques de tamaño fijo.
+    
+    A diferencia de load_csv_data, el archivo se recorre línea a línea y
+    sólo se mantiene en memoria el bloque actual, así que el consumo es
+    O(chunk_size) sea cual sea el tamaño del archivo. La validación es la
+    misma (modo estricto): las líneas inválidas se reportan con su número
+    y, al terminar, se lanza ValueError si hubo alguna.
+    
+    Desde la primera línea inválida no se entrega ningún bloque más (ni
+    el que la contiene ni los siguientes), pero los bloques anteriores ya
+    se han entregado: quien acumule estado con ellos (p. ej. partial_fit)
+    debe descartarlo si se lanza ValueError.
+    
+    Args:
+        filepath (str): Ruta al archivo CSV
+        chunk_size (int): Número máximo de filas por bloque
+        as_numpy (bool): Entregar ndarrays (vistas sin copia) en lugar de array('d')
+        engine (str): "python" (línea a línea) o "fast" (bloques convertidos con
+            numpy; los bloques entregados pueden tener menos de chunk_size filas)
+        
+    Yields:
+        tuple: (X_chunk, y_chunk) con como mucho chunk_size valores cada uno
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si alguna línea tiene un formato inválido o no hay datos
+    """
+    from array import array
+    
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    
+    fast_np = _fast_engine_numpy(engine)
+    if fast_np is not None:
+        yield from _iter_csv_chunks_fast(filepath, chunk_size, as_numpy, fast_np)
+        return
+    
+    np = None
+    if as_numpy:
+        import numpy as np
+    
+    def make_chunk(X_chunk, y_chunk):
+        if np is not None:
+            return np.frombuffer(X_chunk, dtype=np.float64), np.frombuffer(y_chunk, dtype=np.float64)
+        return X_chunk, y_chunk
+    
+    logger.info("📁 Leyendo %s por bloques de %s filas...", filepath, chunk_size)
+    with open(filepath, 'r') as file:
+        # Saltar la primera línea (headers)
+        next(file, None)
+        first_data_line = True
+        skipped_lines = 0
+        processed_lines = 0
+        total_data_lines = 0
+        X_chunk = array('d')
+        y_chunk = array('d')
+        
+        for line_num, line in enumerate(file, start=2):
+            total_data_lines += 1
+            if not line.strip():
+                continue
+            
+            point, n_columns, error = _parse_csv_line(line)
+            
+            if first_data_line and n_columns > 2:
+                _warn_extra_columns(n_columns)
+                first_data_line = False
+            
+            if point is None:
+                _report_bad_line(line_num, error)
+                skipped_lines += 1
+                continue
+            
+            X_chunk.append(point[0])
+            y_chunk.append(point[1])
+            processed_lines += 1
+            
+            if len(X_chunk) == chunk_size:
+                if skipped_lines == 0:
+                    yield make_chunk(X_chunk, y_chunk)
+                # Bloques nuevos: el consumidor puede conservar los anteriores
+                X_chunk = array('d')
+                y_chunk = array('d')
+    
+    if skipped_lines > 0:
+        _report_format_errors(skipped_lines, total_data_lines, processed_lines)
+        raise ValueError(f"Formato de datos inadecuado en {filepath}: {skipped_lines} línea(s) con errores")
+    
+    if len(X_chunk) > 0:
+        yield make_chunk(X_chunk, y_chunk)
+    
+    if processed_lines == 0:
+        _report_no_data()
+        raise ValueError(f"No se encontraron datos válidos en {filepath}")
+    
+    logger.info("✅ Procesadas %s líneas correctamente en bloques de %s", processed_lines, chunk_size)
+
+def _iter_csv_chunks_fast(filepath, chunk_size, as_numpy, np):
+    """iter_csv_chunks con el motor rápido: trocea los bloques de _iter_csv_fast."""
+    from array import array
+    
+    logger.info("📁 Leyendo %s por bloques de %s filas (motor rápido)...", filepath, chunk_size)
+    report = {"lines": 0, "processed": 0, "skipped": 0}
+    for X_block, y_block in _iter_csv_fast(filepath, np, report):
+        if report["skipped"] > 0:
+            # Seguir leyendo sólo para reportar el resto de errores
+            continue
+        for start in range(0, len(X_block), chunk_size):
+            X_chunk = X_block[start:start + chunk_size]
+            y_chunk = y_block[start:start + chunk_size]
+            if as_numpy:
+                yield X_chunk, y_chunk
+            else:
+                yield array('d', X_chunk.tobytes()), array('d', y_chunk.tobytes())
+    
+    if report["skipped"] > 0:
+        _report_format_errors(report["skipped"], report["lines"], report["processed"])
+        raise ValueError(f"Formato de datos inadecuado en {filepath}: {report['skipped']} línea(s) con errores")
+    
+    if report["processed"] == 0:
+        _report_no_data()
+        raise ValueError(f"No se encontraron datos válidos en {filepath}")
+    
+    logger.info("✅ Procesadas %s líneas correctamente en bloques de %s", report["processed"], chunk_size)
+
+def read_csv_header(filepath):
+    """
+    Leer los nombres de columna de la cabecera de un CSV.
+    
+    Args:
+        filepath (str): Ruta al archivo CSV
+        
+    Returns:
+        list: Nombres de las columnas
+    """
+    with open(filepath, 'r') as file:
+        header_line = file.readline()
+    return [name.strip() for name in header_line.strip().split(',')]
+
+def iter_csv_matrix_chunks(filepath, chunk_size=65536, target_column=-1, as_numpy=False):
+    """
+    Leer un CSV con varias columnas numéricas por bloques.
+    
+    Versión multivariable de iter_csv_chunks: se usan todas las columnas,
+    una como variable dependiente y el resto como variables
+    independientes. Cada línea debe tener tantos valores como la cabecera
+    (modo estricto) y los errores se reportan con su número de línea.
+    
+    Args:
+        filepath (str): Ruta al archivo CSV
+        chunk_size (int): Número máximo de filas por bloque
+        target_column (int): Índice de la columna dependiente (por defecto, la última)
+        as_numpy (bool): Entregar X como ndarray (filas × variables) e y como ndarray
+        
+    Yields:
+        tuple: (X_chunk, y_chunk); X_chunk es una lista de filas si as_numpy es False
+        
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si alguna línea tiene un formato inválido o no hay datos
+    """
+    from array import array
+    
+    if chunk_size < 1:
+        raise ValueError("chunk_size debe ser al menos 1")
+    
+    n_columns = len(read_csv_header(filepath))
+    if n_columns < 2:
+        raise ValueError(f"{filepath} necesita al menos 2 columnas")
+    target = target_column % n_columns
+    
+    np = None
+    if as_numpy:
+        import numpy as np
+    
+    def make_chunk(X_chunk, y_chunk):
+        if np is not None:
+            return (np.frombuffer(X_chunk, dtype=np.float64).reshape(-1, n_columns - 1),
+                    np.frombuffer(y_chunk, dtype=np.float64))
+        return X_chunk, y_chunk
+    
+    def new_chunk():
+        return (array('d') if np is not None else []), array('d')
+    
+    logger.info("📁 Leyendo %s (%d columnas) por bloques de %s filas...", filepath, n_columns, chunk_size)
+    with open(filepath, 'r') as file:
+        # Saltar la primera línea (headers)
+        next(file, None)
+        skipped_lines = 0
+        processed_lines = 0
+        total_data_lines = 0
+        rows = 0
+        X_chunk, y_chunk = new_chunk()
+        
+        for line_num, line in enumerate(file, start=2):
+            total_data_lines += 1
+            if not line.strip():
+                continue
+            
+            values = [val.strip() for val in line.strip().split(',')]
+            if len(values) != n_columns:
+                _report_bad_line(line_num, f"Se esperaban {n_columns} valores y hay {len(values)}")
+                skipped_lines += 1
+                continue
+            try:
+                numbers = [float(val) for val in values]
+            except ValueError as ve:
+                _report_bad_line(line_num, f"Error de conversión a número - {ve}")
+                skipped_lines += 1
+                continue
+            
+            y_chunk.append(numbers.pop(target))
+            if np is not None:
+                X_chunk.extend(numbers)
+            else:
+                X_chunk.append(numbers)
+            processed_lines += 1
+            rows += 1
+            
+            if rows == chunk_size:
+                yield make_chunk(X_chunk, y_chunk)
+                X_chunk, y_chunk = new_chunk()
+                rows = 0
+    
+    if skipped_lines > 0:
+        _report_format_errors(skipped_lines, total_data_lines, processed_lines, n_columns)
+        raise ValueError(f"Formato de datos inadecuado en {filepath}: {skipped_lines} línea(s) con errores")
+    
+    if rows > 0:
+        yield make_chunk(X_chunk, y_chunk)
+    
+    if processed_lines == 0:
+        _report_no_data()
+        raise ValueError(f"No se encontraron datos válidos en {filepath}")
+    
+    logger.info("✅ Procesadas %s líneas correctamente en bloques de %s", processed_lines, chunk_size)
+
+def _binary_header_bytes(n_rows, column_names):
+    """Construir la cabecera del formato binario, rellenada hasta la alineación."""
+    names = "\n".join(column_names).encode("utf-8")
+    size = _BINARY_HEADER.size + len(names)
+    header_size = -(-size // _BINARY_ALIGNMENT) * _BINARY_ALIGNMENT
+    header = _BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, header_size, n_rows, len(names)) + names
+    return header + b"\x00" * (header_size - len(header))
+
+def read_binary_header(filepath):
+    """
+    Leer la cabecera de un archivo binario de datos.
+    
+    Args:
+        filepath (str): Ruta al archivo .lrbin
+        
+    Returns:
+        dict: n_rows, column_names, header_size y version
+    """
+    with open(filepath, 'rb') as file:
+        fixed = file.read(_BINARY_HEADER.size)
+        if len(fixed) < _BINARY_HEADER.size:
+            raise ValueError(f"{filepath} no es un archivo binario de datos válido")
+        magic, version, header_size, n_rows, names_length = _BINARY_HEADER.unpack(fixed)
+        if magic != BINARY_MAGIC:
+            raise ValueError(f"{filepath} no es un archivo binario de datos válido")
+        if version != BINARY_VERSION:
+            raise ValueError(f"Versión de formato binario no soportada: {version}")
+        names = file.read(names_length).decode("utf-8")
+    
+    expected_size = header_size + 2 * 8 * n_rows
+    if os.path.getsize(filepath) < expected_size:
+        raise ValueError(f"{filepath} está truncado: faltan datos")
+    
+    return {
+        "n_rows": n_rows,
+        "column_names": names.split("\n") if names else [],
+        "header_size": header_size,
+        "version": version,
+    }
+
+def convert_csv_to_binary(csv_path, binary_path, chunk_size=1 << 20):
+    """
+    Convertir un CSV de dos columnas al formato binario columnar.
+    
+    El CSV se lee por bloques con iter_csv_chunks (misma validación
+    estricta), así que la memoria usada no depende del tamaño del archivo.
+    El resultado se escribe primero en un temporal y se renombra al final.
+    
+    Args:
+        csv_path (str): Ruta al archivo CSV de origen
+        binary_path (str): Ruta del archivo binario a generar
+        chunk_size (int): Filas por bloque de lectura
+        
+    Returns:
+        int: Número de filas convertidas
+    """
+    with open(csv_path, 'r') as file:
+        header_line = file.readline()
+    column_names = [name.strip() for name in header_line.strip().split(',')][:2]
+    
+    logger.info("🔄 Convirtiendo %s a formato binario...", csv_path)
+    tmp_path = binary_path + ".tmp"
+    y_tmp_path = binary_path + ".y.tmp"
+    n_rows = 0
+    try:
+        with open(tmp_path, 'wb') as out, open(y_tmp_path, 'w+b') as y_out:
+            header = _binary_header_bytes(0, column_names)
+            out.write(header)
+            for X_chunk, y_chunk in iter_csv_chunks(csv_path, chunk_size=chunk_size, engine="fast"):
+                if sys.byteorder != "little":
+                    X_chunk.byteswap()
+                    y_chunk.byteswap()
+                X_chunk.tofile(out)
+                y_chunk.tofile(y_out)
+                n_rows += len(X_chunk)
+            
+            # La columna y va a continuación de la columna X
+            y_out.seek(0)
+            while True:
+                block = y_out.read(8 * 1024 * 1024)
+                if not block:
+                    break
+                out.write(block)
+            
+            out.seek(0)
+            out.write(_binary_header_bytes(n_rows, column_names))
+        os.replace(tmp_path, binary_path)
+    finally:
+        for path in (tmp_path, y_tmp_path):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    logger.info("✅ %d filas guardadas en %s", n_rows, binary_path)
+    return n_rows
+
+def load_binary_data(filepath):
+    """
+    Cargar un archivo binario de datos mapeándolo en memoria.
+    
+    No se lee ni se convierte nada: X e y son vistas sobre el archivo
+    (np.memmap si numpy está disponible, memoryview de doubles si no),
+    por lo que la carga tarda lo mismo sea cual sea el número de filas.
+    
+    Args:
+        filepath (str): Ruta al archivo .lrbin
+        
+    Returns:
+        tuple: (X, y) vistas de solo lectura sobre el archivo
+    """
+    header = read_binary_header(filepath)
+    n_rows = header["n_rows"]
+    offset = header["header_size"]
+    logger.info("📁 Mapeando %s (%d filas)...", filepath, n_rows)
+    
+    np = load_numpy()
+    if np is not None:
+        if n_rows == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty
+        columns = np.memmap(filepath, dtype="<f8", mode="r", offset=offset, shape=(2, n_rows))
+        return columns[0], columns[1]
+    
+    import mmap
+    if sys.byteorder != "little":
+        raise ValueError("Sin numpy el formato binario sólo se puede mapear en máquinas little-endian")
+    with open(filepath, 'rb') as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    column_bytes = 8 * n_rows
+    X = view[offset:offset + column_bytes].cast('d')
+    y = view[offset + column_bytes:offset + 2 * column_bytes].cast('d')
+    return X, y
+
+def file_sha256(filepath, block_size=1 << 20):
+    """
+    Calcular la huella SHA-256 de un archivo leyéndolo por bloques.
+    
+    Args:
+        filepath (str): Ruta al archivo
+        block_size (int): Bytes por lectura
+        
+    Returns:
+        str: Huella en hexadecimal
+    """
+    import hashlib
+    
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as file:
+        while True:
+            block = file.read(block_size)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+class IndexedView:
+    """
+    Vista de solo lectura de unas filas de una secuencia, sin copiarlas.
+    
+    Guarda la secuencia original y un array de índices. Se comporta como
+    una secuencia (len, índices, iteración, slicing) y numpy la convierte
+    con __array__, así que LinearRegression y las métricas la aceptan
+    directamente.
+    
+    Attributes:
+        base (list or array): Secuencia original
+        indices (array): Posiciones de base que forman la vista
+    """
+    
+    __slots__ = ("base", "indices")
+    
+    def __init__(self, base, indices):
+        self.base = base
+        self.indices = indices
+    
+    def __len__(self):
+        return len(self.indices)
+    
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return IndexedView(self.base, self.indices[key])
+        return self.base[self.indices[key]]
+    
+    def __iter__(self):
+        base = self.base
+        for index in self.indices:
+            yield base[index]
+    
+    def __array__(self, dtype=None, copy=None):
+        np = load_numpy()
+        if isinstance(self.base, list):
+            arr = np.fromiter(self, dtype=np.float64, count=len(self))
+        else:
+            # ndarray, array('d') o memoryview: se indexa sin pasar por Python
+            arr = np.asarray(self.base)[np.asarray(self.indices)]
+        return arr if dtype is None else arr.astype(dtype, copy=False)
+    
+    def __repr__(self):
+        return f"IndexedView({len(self)} filas)"
+
+class Dataset:
+    """
+    Conjunto de datos (X, y) guardado en dos columnas de doubles.
+    
+    Cada columna es un ndarray float64 o, sin numpy, un array('d') (u
+    otro buffer de doubles, como las memoryviews de load_binary_data):
+    8 bytes por valor en lugar de los ~40 de una lista de floats, así que
+    50M filas ocupan 800 MB. Las columnas exponen el protocolo buffer
+    (memoryview(dataset.X)) y numpy las ve sin copiarlas.
+    
+    Un slice devuelve otro Dataset que es una vista de las mismas
+    columnas. Como una secuencia de filas, dataset[i] e iterar devuelven
+    pares (x, y); las columnas se obtienen con dataset.X y dataset.y o
+    con `X, y = dataset.columns()`. LinearRegression y las métricas lo
+    aceptan directamente, y plot_dataset lo dibuja.
+    
+    Attributes:
+        X (array): Variables independientes
+        y (array): Variables dependientes
+    """
+    
+    __slots__ = ("X", "y")
+    
+    def __init__(self, X=(), y=()):
+        """
+        Crear un Dataset a partir de dos secuencias de la misma longitud.
+        
+        Los ndarrays y los buffers de doubles se usan sin copiar; las
+        listas se convierten a array('d').
+        """
+        X = _as_column(X)
+        y = _as_column(y)
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+        self.X = X
+        self.y = y
+    
+    @classmethod
+    def from_csv(cls, filepath, engine="python"):
+        """
+        Cargar un CSV km,price sin pasar por listas de Python.
+        
+        Se valida igual que load_csv_data (modo estricto) y, como ella, un
+        archivo inexistente o con errores da un Dataset vacío.
+        
+        Args:
+            filepath (str): Ruta al archivo CSV
+            engine (str): "python" (línea a línea) o "fast"
+            
+        Returns:
+            Dataset: Datos cargados
+        """
+        if _fast_engine_numpy(engine) is not None:
+            return cls(*load_csv_data(filepath, engine=engine))
+        
+        from array import array
+        X = array('d')
+        y = array('d')
+        try:
+            for X_chunk, y_chunk in iter_csv_chunks(filepath):
+                X.extend(X_chunk)
+                y.extend(y_chunk)
+        except FileNotFoundError:
+            logger.error("❌ Error: El archivo %s no existe.", filepath)
+            return cls()
+        except ValueError:
+            # iter_csv_chunks ya ha informado de las líneas erróneas
+            return cls()
+        logger.info("📊 Total de datos cargados: %s puntos", len(X))
+        return cls(X, y)
+    
+    @classmethod
+    def from_binary(cls, filepath):
+        """Mapear un archivo .lrbin (ver load_binary_data) sin copiarlo."""
+        return cls(*load_binary_data(filepath))
+    
+    @classmethod
+    def generate(cls, n_samples, noise=0.1, slope=2.0, intercept=1.0, seed=None, x_range=(0.0, 100.0)):
+        """
+        Generar datos sintéticos directamente en columnas (ver iter_linear_data,
+        también para x_range).
+        
+        Returns:
+            Dataset: n_samples filas
+        """
+        np = load_numpy()
+        if np is not None:
+            X = np.empty(n_samples, dtype=np.float64)
+            y = np.empty(n_samples, dtype=np.float64)
+            start = 0
+            for X_chunk, y_chunk in iter_linear_data(n_samples, noise, slope, intercept, seed, x_range=x_range):
+                X[start:start + len(X_chunk)] = X_chunk
+                y[start:start + len(y_chunk)] = y_chunk
+                start += len(X_chunk)
+            return cls(X, y)
+        
+        from array import array
+        X = array('d')
+        y = array('d')
+        for X_chunk, y_chunk in iter_linear_data(n_samples, noise, slope, intercept, seed, x_range=x_range):
+            X.extend(X_chunk)
+            y.extend(y_chunk)
+        return cls(X, y)
+    
+    def __len__(self):
+        return len(self.X)
+    
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            dataset = Dataset.__new__(Dataset)
+            dataset.X = _column_view(self.X)[key]
+            dataset.y = _column_view(self.y)[key]
+            return dataset
+        return self.X[key], self.y[key]
+    
+    def __iter__(self):
+        # Filas (x, y), igual que dataset[i]
+        return zip(self.X, self.y)
+    
+    def columns(self):
+        """Devolver las columnas (X, y) sin copiarlas."""
+        return self.X, self.y
+    
+    def __repr__(self):
+        return f"Dataset({len(self)} filas, {self.nbytes / 1e6:.1f} MB)"
+    
+    @property
+    def nbytes(self):
+        """Bytes que ocupan las dos columnas."""
+        return 2 * 8 * len(self.X)
+    
+    def take(self, indices):
+        """
+        Copiar las filas indicadas en un Dataset nuevo.
+        
+        Args:
+            indices (array): Posiciones de las filas
+            
+        Returns:
+            Dataset: Filas seleccionadas, en ese orden
+        """
+        if is_ndarray(self.X) or is_ndarray(indices):
+            np = load_numpy()
+            indices = np.asarray(indices)
+            return Dataset(np.asarray(self.X)[indices], np.asarray(self.y)[indices])
+        
+        from array import array
+        X, y = self.X, self.y
+        return Dataset(array('d', [X[i] for i in indices]), array('d', [y[i] for i in indices]))
+    
+    def split(self, test_size=0.2, seed=None):
+        """
+        Dividir en entrenamiento y prueba barajando sólo los índices.
+        
+        Args:
+            test_size (float): Proporción para el conjunto de prueba
+            seed (int): Semilla para obtener siempre la misma división
+            
+        Returns:
+            tuple: (train, test) como Datasets
+        """
+        train_indices, test_indices = split_indices(len(self), test_size, seed)
+        return self.take(train_indices), self.take(test_indices)
+
+def _as_column(values):
+    """Ver values como columna de doubles, copiando sólo si hace falta."""
+    if is_ndarray(values):
+        np = load_numpy()
+        column = np.asarray(values, dtype=np.float64)
+        if column.ndim != 1:
+            raise ValueError("Se esperaba un vector de una dimensión")
+        return column
+    if isinstance(values, memoryview) and values.format == 'd':
+        return values
+    from array import array
+    if isinstance(values, array) and values.typecode == 'd':
+        return values
+    return array('d', values)
+
+def _column_view(column):
+    """Columna que se puede trocear sin copiar (array('d') → memoryview)."""
+    if is_ndarray(column) or isinstance(column, memoryview):
+        return column
+    return memoryview(column)
+
+def split_indices(n_samples, test_size=0.2, seed=None):
+    """
+    Generar índices aleatorios de entrenamiento y prueba.
+    
+    Args:
+        n_samples (int): Número de filas
+        test_size (float): Proporción para el conjunto de prueba
+        seed (int): Semilla para obtener siempre la misma división
+        
+    Returns:
+        tuple: (train_indices, test_indices) como ndarrays de enteros
+            (array('q') sin numpy)
+    """
+    if test_size < 0 or test_size > 1:
+        raise ValueError("test_size debe estar entre 0 y 1")
+    train_samples = n_samples - int(n_samples * test_size)
+    
+    np = load_numpy()
+    if np is not None:
+        indices = np.random.default_rng(seed).permutation(n_samples)
+    else:
+        import random
+        from array import array
+        indices = array('q', range(n_samples))
+        random.Random(seed).shuffle(indices)
+    return indices[:train_samples], indices[train_samples:]
+
+def split_data(X, y, test_size=0.2, seed=None, views=False):
     """
     Dividir datos en conjuntos de entrenamiento y prueba.
     
+    Sólo se baraja un array de índices (ver split_indices). Con
+    views=True los conjuntos son IndexedView sobre X e y, sin copiar
+    ningún dato; si no, se copian las filas: ndarrays si X e y lo son,
+    listas en otro caso.
+    
     Args:
-        X (list): Variables independientes
-        y (list): Variables dependientes
+        X (list or array): Variables independientes
+        y (list or array): Variables dependientes
         test_size (float): Proporción para el conjunto de prueba
+        seed (int): Semilla para obtener siempre la misma división
+        views (bool): Devolver vistas en lugar de copias
         
     Returns:
         tuple: (X_train, X_test, y_train, y_test)
     """
-    import random
-    
     # Validar entrada
     if len(X) != len(y):
-        print("❌ Error: X e y deben tener la misma longitud")
+        logger.error("❌ Error: X e y deben tener la misma longitud")
         return [], [], [], []
     
     if len(X) == 0:
-        print("❌ Error: No hay datos para dividir")
+        logger.error("❌ Error: No hay datos para dividir")
         return [], [], [], []
     
     if test_size < 0 or test_size > 1:
-        print("❌ Error: test_size debe estar entre 0 y 1")
+        logger.error("❌ Error: test_size debe estar entre 0 y 1")
         return [], [], [], []
     
-    print(f"🔀 Dividiendo datos: {int((1-test_size)*100)}% entrenamiento, {int(test_size*100)}% prueba")
-    
-    # Crear índices para mezclar aleatoriamente
-    indices = list(range(len(X)))
-    random.shuffle(indices)  # Mezclar aleatoriamente
+    logger.info("🔀 Dividiendo datos: %s%% entrenamiento, %s%% prueba", int((1-test_size)*100), int(test_size*100))
     
-    # Calcular tamaños
+    # Mezclar sólo los índices
     total_samples = len(X)
-    test_samples = int(total_samples * test_size)
-    train_samples = total_samples - test_samples
+    train_indices, test_indices = split_indices(total_samples, test_size, seed)
     
-    # Dividir índices
-    train_indices = indices[:train_samples]
-    test_indices = indices[train_samples:]
-    
-    # Crear conjuntos usando los índices
-    X_train = [X[i] for i in train_indices]
-    y_train = [y[i] for i in train_indices]
-    X_test = [X[i] for i in test_indices]
-    y_test = [y[i] for i in test_indices]
+    if views:
+        X_train, X_test = IndexedView(X, train_indices), IndexedView(X, test_indices)
+        y_train, y_test = IndexedView(y, train_indices), IndexedView(y, test_indices)
+    elif is_ndarray(X) and is_ndarray(y) and is_ndarray(train_indices):
+        X_train, X_test = X[train_indices], X[test_indices]
+        y_train, y_test = y[train_indices], y[test_indices]
+    else:
+        X_train = [X[i] for i in train_indices]
+        y_train = [y[i] for i in train_indices]
+        X_test = [X[i] for i in test_indices]
+        y_test = [y[i] for i in test_indices]
     
     # Mostrar estadísticas
-    print(f"   📊 Total de muestras: {total_samples}")
-    print(f"   🏋️  Entrenamiento: {len(X_train)} muestras")
-    print(f"   🧪 Prueba: {len(X_test)} muestras")
-    print(f"   🎲 Datos mezclados aleatoriamente")
+    logger.info("   📊 Total de muestras: %s", total_samples)
+    logger.info("   🏋️  Entrenamiento: %s muestras", len(X_train))
+    logger.info("   🧪 Prueba: %s muestras", len(X_test))
+    logger.info("   🎲 Datos mezclados aleatoriamente")
     
-    # Mostrar rangos de los conjuntos
-    if len(X_train) > 0:
-        print(f"   📈 Rango X entrenamiento: [{min(X_train):.2f}, {max(X_train):.2f}]")
-        print(f"   📊 Rango y entrenamiento: [{min(y_train):.2f}, {max(y_train):.2f}]")
+    # Mostrar rangos de los conjuntos (sólo si alguien escucha: son 8 pasadas)
+    verbose = logger.isEnabledFor(logging.INFO)
+    if verbose and len(X_train) > 0:
+        logger.info("   📈 Rango X entrenamiento: [%.2f, %.2f]", min(X_train), max(X_train))
+        logger.info("   📊 Rango y entrenamiento: [%.2f, %.2f]", min(y_train), max(y_train))
     
-    if len(X_test) > 0:
-        print(f"   🔍 Rango X prueba: [{min(X_test):.2f}, {max(X_test):.2f}]")
-        print(f"   📋 Rango y prueba: [{min(y_test):.2f}, {max(y_test):.2f}]")
+    if verbose and len(X_test) > 0:
+        logger.info("   🔍 Rango X prueba: [%.2f, %.2f]", min(X_test), max(X_test))
+        logger.info("   📋 Rango y prueba: [%.2f, %.2f]", min(y_test), max(y_test))
     
     return X_train, X_test, y_train, y_test
+
+_MASK64 = (1 << 64) - 1
+
+def _splitmix64(value):
+    """Mezclador splitmix64: convierte un entero en 64 bits pseudoaleatorios."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+def hash_split_mask(start, count, test_size=0.2, seed=0):
+    """
+    Decidir si las filas start..start+count-1 van al conjunto de prueba.
+    
+    La decisión de cada fila depende sólo de su posición y de la semilla
+    (splitmix64 del índice), no de las demás filas: se puede tomar
+    mientras se lee el archivo, en una sola pasada y con cualquier tamaño
+    de bloque, y siempre da la misma división.
+    
+    Args:
+        start (int): Índice de la primera fila
+        count (int): Número de filas
+        test_size (float): Proporción esperada del conjunto de prueba
+        seed (int): Semilla de la división
+        
+    Returns:
+        list: True para las filas de prueba (ndarray de bool con numpy)
+    """
+    if test_size < 0 or test_size > 1:
+        raise ValueError("test_size debe estar entre 0 y 1")
+    threshold = min(int(test_size * 2.0 ** 64), _MASK64 + 1)
+    key = _splitmix64(seed & _MASK64)
+    
+    np = load_numpy() if count >= 512 else None
+    if np is not None:
+        with np.errstate(over='ignore'):
+            value = np.arange(start, start + count, dtype=np.uint64) ^ np.uint64(key)
+            value += np.uint64(0x9E3779B97F4A7C15)
+            value = (value ^ (value >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+            value = (value ^ (value >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+            value ^= value >> np.uint64(31)
+        if threshold > _MASK64:
+            return np.ones(count, dtype=bool)
+        return value < np.uint64(threshold)
+    return [_splitmix64((index ^ key) & _MASK64) < threshold for index in range(start, start + count)]
+
+def iter_csv_split_chunks(filepath, test_size=0.2, seed=0, chunk_size=65536, engine="python"):
+    """
+    Leer un CSV por bloques repartiendo cada fila entre entrenamiento y prueba.
+    
+    Usa hash_split_mask con el índice global de cada fila válida, así que
+    la división no depende de chunk_size ni obliga a cargar el archivo.
+    
+    Args:
+        filepath (str): Ruta al archivo CSV
+        test_size (float): Proporción esperada del conjunto de prueba
+        seed (int): Semilla de la división
+        chunk_size (int): Número máximo de filas por bloque
+        engine (str): Motor de lectura (ver iter_csv_chunks)
+        
+    Yields:
+        tuple: (X_train, y_train, X_test, y_test) de cada bloque
+    """
+    from array import array
+    
+    row = 0
+    for X_chunk, y_chunk in iter_csv_chunks(filepath, chunk_size=chunk_size, engine=engine):
+        mask = hash_split_mask(row, len(X_chunk), test_size, seed)
+        row += len(X_chunk)
+        if is_ndarray(mask):
+            np = load_numpy()
+            X_chunk = np.frombuffer(X_chunk, dtype=np.float64)
+            y_chunk = np.frombuffer(y_chunk, dtype=np.float64)
+            train = ~mask
+            yield (array('d', X_chunk[train].tobytes()), array('d', y_chunk[train].tobytes()),
+                   array('d', X_chunk[mask].tobytes()), array('d', y_chunk[mask].tobytes()))
+            continue
+        X_train, y_train, X_test, y_test = array('d'), array('d'), array('d'), array('d')
+        for x_val, y_val, is_test in zip(X_chunk, y_chunk, mask):
+            if is_test:
+                X_test.append(x_val)
+                y_test.append(y_val)
+            else:
+                X_train.append(x_val)
+                y_train.append(y_val)
+        yield X_train, y_train, X_test, y_test
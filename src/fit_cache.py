@@ -0,0 +1,233 @@
+"""
+Caché en disco de ajustes de LinearRegression sobre archivos CSV.
+
+Cada archivo entrenado deja una entrada JSON con sus estadísticos
+suficientes (RegressionStats) y su huella: tamaño, mtime y SHA-256 del
+contenido. Al volver a entrenar con el mismo archivo:
+
+    - mismo tamaño y mtime → se reutilizan los estadísticos sin leer nada
+    - mtime distinto pero mismo contenido → igual, tras comprobar la huella
+    - filas añadidas al final (el contenido anterior coincide con la
+      huella guardada) → sólo se procesan las filas nuevas y se combinan
+      con los estadísticos guardados (RegressionStats.merge)
+    - cualquier otro cambio → se entrena desde cero
+
+La caché guarda como mucho max_entries entradas (de ~1 KB cada una) y
+descarta las usadas hace más tiempo.
+"""
+
+import hashlib
+import json
+import logging
+import os
+
+try:
+    from .linear_regression import LinearRegression, RegressionStats
+    from .data_utils import _report_bad_line, _report_format_errors
+    from .parallel import parallel_fit_csv, _fit_byte_range
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from linear_regression import LinearRegression, RegressionStats
+    from data_utils import _report_bad_line, _report_format_errors
+    from parallel import parallel_fit_csv, _fit_byte_range
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".lr_cache"
+DEFAULT_MAX_ENTRIES = 128
+
+CACHE_FORMAT = "ft_linear_regression.fit_cache"
+CACHE_FORMAT_VERSION = 1
+
+# Tamaño de lectura al calcular la huella
+HASH_BLOCK_BYTES = 8 * 1024 * 1024
+
+
+def _hash_range(filepath, start, end, digest):
+    """
+    Añadir a digest los bytes [start, end) del archivo.
+
+    Returns:
+        tuple: (saltos de línea en el rango, último byte leído o b'')
+    """
+    newlines = 0
+    last = b''
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = file.read(min(HASH_BLOCK_BYTES, remaining))
+            if not data:
+                break
+            remaining -= len(data)
+            digest.update(data)
+            newlines += data.count(b'\n')
+            last = data[-1:]
+    return newlines, last
+
+
+class FitCache:
+    """
+    Caché de estadísticos de entrenamiento por archivo.
+
+    Attributes:
+        directory (str): Carpeta de las entradas
+        max_entries (int): Número máximo de archivos recordados
+        hits (int): Entrenamientos resueltos sin leer datos
+        appends (int): Entrenamientos que sólo procesaron filas nuevas
+        misses (int): Entrenamientos desde cero
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=DEFAULT_MAX_ENTRIES):
+        """Preparar la caché (la carpeta se crea al guardar la primera entrada)."""
+        if max_entries < 1:
+            raise ValueError("max_entries debe ser al menos 1")
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.appends = 0
+        self.misses = 0
+
+    def _entry_path(self, filepath):
+        """Archivo de la entrada de filepath (un nombre por ruta absoluta)."""
+        key = hashlib.sha256(os.path.abspath(filepath).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, key + ".json")
+
+    def _read_entry(self, filepath):
+        """Leer la entrada de filepath; None si no hay o no es válida."""
+        try:
+            with open(self._entry_path(filepath), 'r') as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT
+                or entry.get("version") != CACHE_FORMAT_VERSION
+                or entry.get("path") != os.path.abspath(filepath)):
+            return None
+        return entry
+
+    def _write_entry(self, filepath, stat, sha256, ends_with_newline, stats):
+        """Guardar la entrada de filepath y aplicar el límite de entradas."""
+        os.makedirs(self.directory, exist_ok=True)
+        entry = {
+            "format": CACHE_FORMAT,
+            "version": CACHE_FORMAT_VERSION,
+            "path": os.path.abspath(filepath),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": sha256,
+            "ends_with_newline": ends_with_newline,
+            "stats": stats.to_dict(),
+        }
+        entry_path = self._entry_path(filepath)
+        tmp_path = entry_path + ".tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(entry, file)
+        os.replace(tmp_path, entry_path)
+        self._evict()
+
+    def _touch(self, filepath):
+        """Marcar la entrada como usada ahora (el mtime de la entrada ordena el LRU)."""
+        try:
+            os.utime(self._entry_path(filepath))
+        except OSError:
+            pass
+
+    def _evict(self):
+        """Borrar las entradas usadas hace más tiempo hasta respetar max_entries."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.stat(path).st_mtime_ns, path))
+                except OSError:
+                    continue
+        entries.sort()
+        for _, path in entries[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+                logger.info("🧹 Entrada de caché descartada: %s", path)
+            except OSError:
+                pass
+
+    def __len__(self):
+        if not os.path.isdir(self.directory):
+            return 0
+        return sum(1 for name in os.listdir(self.directory) if name.endswith(".json"))
+
+    def clear(self):
+        """Borrar todas las entradas."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                os.remove(os.path.join(self.directory, name))
+
+    def fit(self, filepath, workers=None):
+        """
+        Entrenar con un CSV reutilizando lo que se pueda de la caché.
+
+        Args:
+            filepath (str): Ruta al archivo CSV
+            workers (int): Procesos para entrenar desde cero (ver parallel_fit_csv)
+
+        Returns:
+            tuple: (LinearRegression entrenado, "hit", "append" o "miss")
+
+        Raises:
+            FileNotFoundError: Si el archivo no existe
+            ValueError: Si hay líneas con formato inválido (modo estricto) o no hay datos
+        """
+        stat = os.stat(filepath)
+        entry = self._read_entry(filepath)
+        stats = None
+
+        if entry is not None and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            logger.info("⚡ %s sin cambios: estadísticos recuperados de la caché", filepath)
+            self.hits += 1
+            self._touch(filepath)
+            model = LinearRegression().merge(RegressionStats.from_dict(entry["stats"]))
+            model.data_hash = entry["sha256"]
+            return model, "hit"
+
+        if entry is not None and stat.st_size >= entry["size"] and entry["ends_with_newline"]:
+            # ¿Sigue ahí el contenido que ya se entrenó?
+            digest = hashlib.sha256()
+            prefix_lines, _ = _hash_range(filepath, 0, entry["size"], digest)
+            if digest.hexdigest() == entry["sha256"]:
+                stats = RegressionStats.from_dict(entry["stats"])
+                status = "hit"
+                last = b'\n'
+                if stat.st_size > entry["size"]:
+                    status = "append"
+                    logger.info("➕ %s creció %d bytes: procesando sólo las filas nuevas...",
+                                filepath, stat.st_size - entry["size"])
+                    tail = _fit_byte_range(filepath, entry["size"], stat.st_size)
+                    if tail["skipped"] > 0:
+                        # La primera línea nueva es la número prefix_lines + 1
+                        for local_line, error in tail["errors"]:
+                            _report_bad_line(prefix_lines + local_line, error)
+                        _report_format_errors(tail["skipped"], tail["lines"], tail["processed"])
+                        raise ValueError(f"Formato de datos inadecuado en {filepath}: "
+                                         f"{tail['skipped']} línea(s) con errores")
+                    stats.merge(tail["stats"])
+                    _, last = _hash_range(filepath, entry["size"], stat.st_size, digest)
+                sha256 = digest.hexdigest()
+                if status == "hit":
+                    logger.info("⚡ %s sin cambios de contenido: estadísticos recuperados de la caché", filepath)
+                    self.hits += 1
+                else:
+                    self.appends += 1
+
+        if stats is None:
+            status = "miss"
+            self.misses += 1
+            stats = parallel_fit_csv(filepath, workers=workers).stats
+            digest = hashlib.sha256()
+            _, last = _hash_range(filepath, 0, stat.st_size, digest)
+            sha256 = digest.hexdigest()
+
+        self._write_entry(filepath, stat, sha256, last == b'\n', stats)
+        model = LinearRegression().merge(stats)
+        model.data_hash = sha256
+        return model, status
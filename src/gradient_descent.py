@@ -0,0 +1,273 @@
+"""
+Entrenamiento por descenso de gradiente.
+
+Implementa el algoritmo del enunciado del proyecto:
+
+    estimatePrice(km) = θ0 + θ1 · km
+    tmpθ0 = learningRate · 1/m · Σ(estimatePrice(km[i]) - price[i])
+    tmpθ1 = learningRate · 1/m · Σ(estimatePrice(km[i]) - price[i]) · km[i]
+
+sobre datos normalizados (media 0, desviación 1), que es lo que permite
+usar una tasa de aprendizaje fija sin que diverja con kilometrajes del
+orden de 10⁵. Al terminar, θ0 y θ1 se traducen a la pendiente y la
+intersección en las unidades originales, así que el modelo se usa igual
+que LinearRegression (predict, mse, score, save...).
+"""
+
+import logging
+import random
+import time
+
+try:
+    from ._backend import numpy_for, as_float_array
+    from .linear_regression import BaseRegression, RegressionStats, _columns
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import numpy_for, as_float_array
+    from linear_regression import BaseRegression, RegressionStats, _columns
+
+logger = logging.getLogger(__name__)
+
+
+class GradientDescentRegression(BaseRegression):
+    """
+    Regresión lineal simple entrenada con descenso de gradiente.
+
+    No admite partial_fit ni merge: la normalización necesita ver todos
+    los datos y los θ de dos descensos distintos no se pueden combinar.
+    Para datos que no caben en memoria está fit_chunks.
+
+    Attributes:
+        learning_rate (float): Tasa de aprendizaje
+        max_iterations (int): Máximo de iteraciones (fit) o de épocas (fit_chunks)
+        tolerance (float): Criterio de parada temprana
+        batch_size (int): Tamaño de mini-lote para fit_chunks
+        seed (int): Semilla para barajar los mini-lotes
+        theta0 (float): θ0 en la escala normalizada
+        theta1 (float): θ1 en la escala normalizada
+        n_iterations (int): Actualizaciones de θ realizadas
+        converged (bool): Si se alcanzó el criterio de parada
+        training_time (float): Segundos hasta converger (o agotar iteraciones)
+        iterations_per_second (float): Actualizaciones de θ por segundo
+    """
+
+    def __init__(self, learning_rate=0.1, max_iterations=10000, tolerance=1e-6,
+                 batch_size=256, seed=None):
+        """Inicializar el modelo con sus hiperparámetros."""
+        super().__init__()
+        if learning_rate <= 0:
+            raise ValueError("learning_rate debe ser positivo")
+        if batch_size < 1:
+            raise ValueError("batch_size debe ser al menos 1")
+        self.learning_rate = learning_rate
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.batch_size = batch_size
+        self.seed = seed
+        self.theta0 = 0.0
+        self.theta1 = 0.0
+        self.n_iterations = 0
+        self.converged = False
+        self.training_time = None
+        self.iterations_per_second = None
+
+    def fit(self, X, y=None):
+        """
+        Entrenar con descenso de gradiente por lotes completos.
+
+        Cada iteración calcula el gradiente sobre todos los datos (de forma
+        vectorizada si numpy está disponible) y se para cuando los dos
+        componentes del gradiente son menores que tolerance.
+
+        Args:
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes (None con un Dataset)
+        """
+        X, y = _columns(X, y)
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+
+        if len(X) < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
+
+        logger.info("🔧 Entrenando modelo con descenso de gradiente (lote completo)...")
+        start_time = time.perf_counter()
+
+        # Una pasada para las medias y desviaciones de la normalización
+        stats = RegressionStats.from_data(X, y)
+        mean_x, std_x, mean_y, std_y = self._scaling(stats)
+
+        theta0 = 0.0
+        theta1 = 0.0
+        iterations = 0
+        converged = False
+
+        np = numpy_for(X, y)
+        if np is not None:
+            x_n = (as_float_array(np, X) - mean_x) / std_x
+            y_n = (as_float_array(np, y) - mean_y) / std_y
+            n = len(x_n)
+            errors = np.empty_like(x_n)
+            while iterations < self.max_iterations:
+                # errors = θ0 + θ1·x - y, sin crear arrays nuevos en cada iteración
+                np.multiply(x_n, theta1, out=errors)
+                errors += theta0
+                errors -= y_n
+                grad0 = float(errors.sum()) / n
+                grad1 = float(np.dot(errors, x_n)) / n
+                theta0 -= self.learning_rate * grad0
+                theta1 -= self.learning_rate * grad1
+                iterations += 1
+                if abs(grad0) < self.tolerance and abs(grad1) < self.tolerance:
+                    converged = True
+                    break
+        else:
+            x_n = [(x_val - mean_x) / std_x for x_val in X]
+            y_n = [(y_val - mean_y) / std_y for y_val in y]
+            n = len(x_n)
+            while iterations < self.max_iterations:
+                sum_errors = 0.0
+                sum_errors_x = 0.0
+                for x_val, y_val in zip(x_n, y_n):
+                    error = theta0 + theta1 * x_val - y_val
+                    sum_errors += error
+                    sum_errors_x += error * x_val
+                grad0 = sum_errors / n
+                grad1 = sum_errors_x / n
+                theta0 -= self.learning_rate * grad0
+                theta1 -= self.learning_rate * grad1
+                iterations += 1
+                if abs(grad0) < self.tolerance and abs(grad1) < self.tolerance:
+                    converged = True
+                    break
+
+        self._finish(stats, theta0, theta1, iterations, converged, start_time)
+
+    def fit_chunks(self, chunks, shuffle=True):
+        """
+        Entrenar con SGD por mini-lotes sobre datos que llegan por bloques.
+
+        Los datos no se cargan enteros: una primera pasada obtiene la
+        normalización y después cada época recorre de nuevo los bloques
+        (por eso chunks debe poder recorrerse varias veces). Se para cuando
+        la pérdida media de una época mejora menos de un tolerance relativo
+        respecto a la anterior, o tras max_iterations épocas.
+
+        Args:
+            chunks (callable or iterable): Función que devuelve un iterador nuevo de
+                pares (X_chunk, y_chunk), p. ej. lambda: iter_csv_chunks(ruta),
+                o una lista de bloques
+            shuffle (bool): Barajar las filas de cada bloque en cada época
+
+        Raises:
+            TypeError: Si chunks es un iterador de un solo uso (p. ej. un generador)
+            ValueError: Si una época no recorre las mismas filas que la primera pasada
+        """
+        if callable(chunks):
+            make_chunks = chunks
+        elif iter(chunks) is chunks:
+            # La primera pasada lo agotaría y las épocas no verían ninguna fila
+            raise TypeError("chunks sólo se puede recorrer una vez; pasar una función que lo cree "
+                            "de nuevo, p. ej. lambda: iter_csv_chunks(ruta)")
+        else:
+            make_chunks = lambda: iter(chunks)
+
+        logger.info("🔧 Entrenando modelo con SGD por mini-lotes de %d...", self.batch_size)
+        start_time = time.perf_counter()
+
+        stats = RegressionStats()
+        for X_chunk, y_chunk in make_chunks():
+            stats.update(X_chunk, y_chunk)
+        if stats.n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
+        mean_x, std_x, mean_y, std_y = self._scaling(stats)
+
+        rng = random.Random(self.seed)
+        theta0 = 0.0
+        theta1 = 0.0
+        iterations = 0
+        converged = False
+        previous_loss = None
+
+        for epoch in range(self.max_iterations):
+            epoch_loss = 0.0
+            epoch_rows = 0
+            for X_chunk, y_chunk in make_chunks():
+                epoch_rows += len(X_chunk)
+                np = numpy_for(X_chunk, y_chunk)
+                if np is not None:
+                    x_n = (as_float_array(np, X_chunk) - mean_x) / std_x
+                    y_n = (as_float_array(np, y_chunk) - mean_y) / std_y
+                    if shuffle:
+                        order = np.random.default_rng(rng.getrandbits(64)).permutation(len(x_n))
+                        x_n = x_n[order]
+                        y_n = y_n[order]
+                    for start in range(0, len(x_n), self.batch_size):
+                        x_batch = x_n[start:start + self.batch_size]
+                        errors = theta0 + theta1 * x_batch - y_n[start:start + self.batch_size]
+                        epoch_loss += float(np.dot(errors, errors))
+                        theta0 -= self.learning_rate * float(errors.mean())
+                        theta1 -= self.learning_rate * float(np.dot(errors, x_batch)) / len(errors)
+                        iterations += 1
+                else:
+                    rows = [((x_val - mean_x) / std_x, (y_val - mean_y) / std_y)
+                            for x_val, y_val in zip(X_chunk, y_chunk)]
+                    if shuffle:
+                        rng.shuffle(rows)
+                    for start in range(0, len(rows), self.batch_size):
+                        batch = rows[start:start + self.batch_size]
+                        sum_errors = 0.0
+                        sum_errors_x = 0.0
+                        for x_val, y_val in batch:
+                            error = theta0 + theta1 * x_val - y_val
+                            epoch_loss += error * error
+                            sum_errors += error
+                            sum_errors_x += error * x_val
+                        theta0 -= self.learning_rate * sum_errors / len(batch)
+                        theta1 -= self.learning_rate * sum_errors_x / len(batch)
+                        iterations += 1
+
+            if epoch_rows != stats.n:
+                raise ValueError(f"La época {epoch + 1} recorrió {epoch_rows} filas y la primera pasada "
+                                 f"{stats.n}: chunks debe dar los mismos bloques en cada recorrido")
+            epoch_loss /= stats.n
+            logger.debug("   Época %d: pérdida %.6f", epoch + 1, epoch_loss)
+            if previous_loss is not None and abs(previous_loss - epoch_loss) <= self.tolerance * max(previous_loss, 1e-12):
+                converged = True
+                break
+            previous_loss = epoch_loss
+
+        self._finish(stats, theta0, theta1, iterations, converged, start_time)
+
+    @staticmethod
+    def _scaling(stats):
+        """Calcular medias y desviaciones típicas para normalizar X e y."""
+        if stats.m2_x == 0:
+            raise ValueError("Todos los valores X son iguales. No se puede ajustar una línea.")
+        std_x = (stats.m2_x / stats.n) ** 0.5
+        std_y = (stats.m2_y / stats.n) ** 0.5
+        if std_y == 0:
+            std_y = 1.0  # y constante: basta con centrarla
+        return stats.mean_x, std_x, stats.mean_y, std_y
+
+    def _finish(self, stats, theta0, theta1, iterations, converged, start_time):
+        """Guardar el resultado y traducir θ a las unidades originales."""
+        mean_x, std_x, mean_y, std_y = self._scaling(stats)
+        self.theta0 = theta0
+        self.theta1 = theta1
+        # y = ȳ + σy·(θ0 + θ1·(x - x̄)/σx)
+        self.slope = theta1 * std_y / std_x
+        self.intercept = mean_y + std_y * theta0 - self.slope * mean_x
+        self.stats = stats
+        self.is_fitted = True
+
+        self.training_time = time.perf_counter() - start_time
+        self.n_iterations = iterations
+        self.converged = converged
+        self.iterations_per_second = iterations / self.training_time if self.training_time > 0 else float('inf')
+
+        if converged:
+            logger.info("   ✅ Convergencia en %d iteraciones (%.3f s)", iterations, self.training_time)
+        else:
+            logger.warning("⚠️  Sin convergencia tras %d iteraciones (%.3f s)", iterations, self.training_time)
+        logger.info("   ⚡ %.0f iteraciones/s", self.iterations_per_second)
+        logger.info("   📝 Ecuación: y = %.4fx + %.4f", self.slope, self.intercept)
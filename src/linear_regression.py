@@ -3,144 +3,590 @@ Linear Regression Implementation
 
 Este módulo contiene la implementación principal del algoritmo
 de regresión lineal desde cero.
+
+Los mensajes de progreso se emiten con el módulo logging y están
+silenciados por defecto; ver src.log_utils.configure_logging.
 """
 
-class LinearRegression:
+import abc
+import json
+import logging
+import os
+from collections import OrderedDict
+
+try:
+    from ._backend import numpy_for, as_float_array, is_dataset
+    from .metrics import MetricsAccumulator
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import numpy_for, as_float_array, is_dataset
+    from metrics import MetricsAccumulator
+
+logger = logging.getLogger(__name__)
+
+# Identificador y versión del archivo de modelo (ver LinearRegression.save)
+MODEL_FORMAT = "ft_linear_regression.model"
+MODEL_FORMAT_VERSION = 1
+
+
+def _columns(X, y):
+    """Aceptar (X, y) o un Dataset en X (con y=None)."""
+    if is_dataset(X):
+        if y is not None:
+            raise ValueError("Con un Dataset no se pasa y por separado")
+        return X.X, X.y
+    if y is None:
+        raise ValueError("Falta y (o pasar un Dataset)")
+    return X, y
+
+
+class RegressionStats:
     """
-    Implementación de Regresión Lineal Simple usando Mínimos Cuadrados.
+    Estadísticos suficientes de una regresión lineal simple.
+    
+    En lugar de las sumas crudas Σx, Σy, Σxy y Σx² se guardan las medias
+    y los co-momentos centrados (al estilo de Welford), que no sufren la
+    cancelación catastrófica de la fórmula n·Σx² - (Σx)². Dos objetos
+    calculados sobre particiones distintas se combinan con merge() y dan
+    los mismos estadísticos que si se hubieran calculado de una vez.
     
     Attributes:
-        slope (float): Pendiente de la línea (m)
-        intercept (float): Intersección con el eje Y (b)
-        is_fitted (bool): Indica si el modelo ha sido entrenado
+        n (int): Número de muestras acumuladas
+        mean_x (float): Media de X
+        mean_y (float): Media de y
+        m2_x (float): Σ(x - x̄)²
+        m2_y (float): Σ(y - ȳ)²
+        c_xy (float): Σ(x - x̄)(y - ȳ)
     """
     
     def __init__(self):
-        """Inicializar el modelo de regresión lineal."""
-        self.slope = None
-        self.intercept = None
-        self.is_fitted = False
+        """Inicializar unos estadísticos vacíos."""
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0
+        self.m2_y = 0.0
+        self.c_xy = 0.0
+    
+    @classmethod
+    def from_data(cls, X, y):
+        """Calcular los estadísticos de un conjunto de datos."""
+        return cls().update(X, y)
     
-    def fit(self, X, y):
+    def copy(self):
+        """Devolver una copia independiente."""
+        other = RegressionStats()
+        other.__dict__.update(self.__dict__)
+        return other
+    
+    def update(self, X, y):
         """
-        Entrenar el modelo con los datos de entrada.
+        Acumular un bloque de datos.
         
         Args:
-            X (list or array): Variables independientes
-            y (list or array): Variables dependientes
+            X (list or array): Variables independientes del bloque
+            y (list or array): Variables dependientes del bloque
+            
+        Returns:
+            RegressionStats: self, para encadenar llamadas
         """
-        # Validar entrada
         if len(X) != len(y):
             raise ValueError("X e y deben tener la misma longitud")
         
-        if len(X) < 2:
-            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
+        if len(X) == 0:
+            return self
+        
+        np = numpy_for(X, y)
+        if np is not None:
+            # Momentos del bloque con dos pasadas vectorizadas y fusión con lo acumulado
+            X = as_float_array(np, X)
+            y = as_float_array(np, y)
+            chunk = RegressionStats()
+            chunk.n = len(X)
+            chunk.mean_x = float(X.mean())
+            chunk.mean_y = float(y.mean())
+            dx = X - chunk.mean_x
+            dy = y - chunk.mean_y
+            chunk.m2_x = float(np.dot(dx, dx))
+            chunk.m2_y = float(np.dot(dy, dy))
+            chunk.c_xy = float(np.dot(dx, dy))
+            return self.merge(chunk)
+        
+        # Actualización de Welford muestra a muestra
+        n = self.n
+        mean_x = self.mean_x
+        mean_y = self.mean_y
+        m2_x = self.m2_x
+        m2_y = self.m2_y
+        c_xy = self.c_xy
+        for x_val, y_val in zip(X, y):
+            n += 1
+            dx = x_val - mean_x
+            dy = y_val - mean_y
+            mean_x += dx / n
+            mean_y += dy / n
+            m2_x += dx * (x_val - mean_x)
+            m2_y += dy * (y_val - mean_y)
+            c_xy += dx * (y_val - mean_y)
+        self.n = n
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.m2_x = m2_x
+        self.m2_y = m2_y
+        self.c_xy = c_xy
+        return self
+    
+    def merge(self, other):
+        """
+        Combinar con los estadísticos de otra partición de los datos.
         
-        print("🔧 Entrenando modelo con algoritmo de mínimos cuadrados...")
-        
-        # Convertir a listas si no lo son
-        X = list(X)
-        y = list(y)
-        
-        # Calcular estadísticas necesarias
-        n = len(X)
-        sum_x = sum(X)
-        sum_y = sum(y)
-        sum_xy = 0
-        i = 0
-        while i < len(X):
-            sum_xy += X[i] * y[i]
-            i += 1
-        sum_x_squared = 0
-        j = 0
-        while j < len(X):
-            sum_x_squared += X[j] * X[j]
-            j += 1
+        Args:
+            other (RegressionStats): Estadísticos a incorporar
+            
+        Returns:
+            RegressionStats: self, para encadenar llamadas
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        
+        n = self.n + other.n
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        factor = self.n * other.n / n
+        
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.m2_x += other.m2_x + dx * dx * factor
+        self.m2_y += other.m2_y + dy * dy * factor
+        self.c_xy += other.c_xy + dx * dy * factor
+        self.n = n
+        return self
+    
+    def subtract(self, other):
+        """
+        Quitar los estadísticos de una parte de los datos (inversa de merge).
         
-        # Mostrar estadísticas de cálculo
-        print(f"   Número de muestras: {n}")
-        print(f"   🧮 Calculando parámetros usando mínimos cuadrados...")
+        Permite obtener, por ejemplo, los estadísticos de entrenamiento de
+        un fold de validación cruzada como total - fold sin volver a
+        recorrer los datos.
+        
+        Args:
+            other (RegressionStats): Estadísticos de un subconjunto de los datos
+            
+        Returns:
+            RegressionStats: self, para encadenar llamadas
+        """
+        if other.n == 0:
+            return self
+        if other.n > self.n:
+            raise ValueError("No se puede quitar más muestras de las que hay")
+        if other.n == self.n:
+            self.__init__()
+            return self
+        
+        n = self.n - other.n
+        # Medias del resto: n·x̄_resto = N·x̄ - n_otro·x̄_otro
+        mean_x = (self.n * self.mean_x - other.n * other.mean_x) / n
+        mean_y = (self.n * self.mean_y - other.n * other.mean_y) / n
+        dx = other.mean_x - mean_x
+        dy = other.mean_y - mean_y
+        factor = n * other.n / self.n
+        
+        self.m2_x = max(self.m2_x - other.m2_x - dx * dx * factor, 0.0)
+        self.m2_y = max(self.m2_y - other.m2_y - dy * dy * factor, 0.0)
+        self.c_xy -= other.c_xy + dx * dy * factor
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.n = n
+        return self
+    
+    def to_dict(self):
+        """Exportar los estadísticos como diccionario serializable."""
+        return {
+            "n": self.n,
+            "mean_x": self.mean_x,
+            "mean_y": self.mean_y,
+            "m2_x": self.m2_x,
+            "m2_y": self.m2_y,
+            "c_xy": self.c_xy,
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Reconstruir los estadísticos exportados con to_dict()."""
+        stats = cls()
+        stats.n = int(data["n"])
+        for name in ("mean_x", "mean_y", "m2_x", "m2_y", "c_xy"):
+            setattr(stats, name, float(data[name]))
+        return stats
+    
+    def residual_sum_of_squares(self, slope, intercept):
+        """
+        Calcular Σ(y - (slope·x + intercept))² sin recorrer los datos.
+        
+        Se deduce de los momentos: para cualquier recta,
+        SSE = Σ(y-ȳ)² - 2m·Σ(x-x̄)(y-ȳ) + m²·Σ(x-x̄)² + n·(ȳ - b - m·x̄)²
+        
+        Args:
+            slope (float): Pendiente de la recta
+            intercept (float): Intersección de la recta
+            
+        Returns:
+            float: Suma de errores cuadrados
+        """
+        offset = self.mean_y - intercept - slope * self.mean_x
+        sse = (self.m2_y - 2 * slope * self.c_xy + slope * slope * self.m2_x
+               + self.n * offset * offset)
+        # El redondeo puede dejar un valor negativo minúsculo en ajustes perfectos
+        return max(sse, 0.0)
+    
+    def coefficients(self):
+        """
+        Calcular la recta de mínimos cuadrados.
         
-        # Calcular denominador para la pendiente
-        denominator = n * sum_x_squared - sum_x * sum_x
+        Returns:
+            tuple: (pendiente, intersección)
+        """
+        if self.n < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
         
         # Verificar que no hay división por cero (todos los X son iguales)
-        if denominator == 0:
+        if self.m2_x == 0:
             raise ValueError("Todos los valores X son iguales. No se puede ajustar una línea.")
         
-        # Calcular pendiente (slope) usando la fórmula de mínimos cuadrados
-        # m = (n*Σ(xy) - Σ(x)*Σ(y)) / (n*Σ(x²) - (Σ(x))²)
-        self.slope = (n * sum_xy - sum_x * sum_y) / denominator
+        # m = Σ(x - x̄)(y - ȳ) / Σ(x - x̄)²
+        slope = self.c_xy / self.m2_x
+        # b = ȳ - m·x̄
+        intercept = self.mean_y - slope * self.mean_x
+        return slope, intercept
+
+
+class PredictionCache:
+    """
+    Caché LRU acotada de predicciones individuales.
+    
+    Las claves son (versión del modelo, valor de entrada), así que una
+    predicción nunca se reutiliza con otros parámetros.
+    
+    Attributes:
+        maxsize (int): Número máximo de entradas
+        hits (int): Consultas resueltas desde la caché
+        misses (int): Consultas que hubo que calcular
+        evictions (int): Entradas descartadas por falta de espacio
+        invalidations (int): Veces que se vació por un cambio del modelo
+    """
+    
+    def __init__(self, maxsize=1024):
+        """Crear una caché vacía."""
+        if maxsize < 1:
+            raise ValueError("maxsize debe ser al menos 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key):
+        """Devolver la predicción guardada para key, o None."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def put(self, key, value):
+        """Guardar una predicción, descartando la menos usada si no cabe."""
+        self._entries[key] = value
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def clear(self):
+        """Vaciar la caché (los contadores se conservan)."""
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+    
+    def info(self):
+        """
+        Resumen de los contadores.
+        
+        Returns:
+            dict: hits, misses, evictions, invalidations, size, maxsize y hit_rate
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class BaseRegression(abc.ABC):
+    """
+    Base común de los modelos de regresión lineal simple.
+    
+    Reúne lo que no depende de cómo se entrena: predicción, caché,
+    métricas, guardado y carga. Las subclases implementan fit(X, y=None)
+    y dejan slope, intercept, stats e is_fitted listos. El entrenamiento
+    incremental (partial_fit y merge) sólo existe en LinearRegression.
+    
+    Attributes:
+        slope (float): Pendiente de la línea (m)
+        intercept (float): Intersección con el eje Y (b)
+        is_fitted (bool): Indica si el modelo ha sido entrenado
+        stats (RegressionStats): Estadísticos suficientes de los datos vistos
+        data_hash (str): Huella opcional de los datos de entrenamiento
+        version (int): Se incrementa cada vez que cambian slope o intercept
+        cache (PredictionCache): Caché de predict_one, o None
+    """
+    
+    def __init__(self, cache_size=None):
+        """
+        Inicializar el modelo de regresión lineal.
         
-        # Calcular intersección (intercept) 
-        # b = (Σ(y) - m*Σ(x)) / n
-        self.intercept = (sum_y - self.slope * sum_x) / n
+        Args:
+            cache_size (int): Tamaño de la caché LRU de predict_one (None = sin caché)
+        """
+        self.version = 0
+        self.cache = PredictionCache(cache_size) if cache_size else None
+        self._slope = None
+        self._intercept = None
+        self.is_fitted = False
+        self.stats = None
+        self.data_hash = None
+    
+    # slope e intercept son propiedades para que cualquier cambio (fit,
+    # partial_fit, merge, load...) cambie la versión y vacíe la caché
+    @property
+    def slope(self):
+        return self._slope
+    
+    @slope.setter
+    def slope(self, value):
+        if value != self._slope:
+            self._slope = value
+            self._parameters_changed()
+    
+    @property
+    def intercept(self):
+        return self._intercept
+    
+    @intercept.setter
+    def intercept(self, value):
+        if value != self._intercept:
+            self._intercept = value
+            self._parameters_changed()
+    
+    def _parameters_changed(self):
+        """Invalidar las predicciones guardadas."""
+        self.version += 1
+        if self.cache is not None:
+            self.cache.clear()
+    
+    def enable_cache(self, maxsize=1024):
+        """
+        Activar (o redimensionar) la caché LRU de predict_one.
         
-        # Marcar como entrenado
-        self.is_fitted = True
+        Returns:
+            LinearRegression: self, para encadenar llamadas
+        """
+        self.cache = PredictionCache(maxsize)
+        return self
+    
+    def cache_info(self):
+        """Contadores de la caché de predict_one (None si no hay caché)."""
+        return self.cache.info() if self.cache is not None else None
+    
+    def predict_one(self, x_val):
+        """
+        Predecir un único valor, sin listas ni mensajes.
         
-        # Mostrar resultados
-        print(f"   📈 Pendiente (m): {self.slope:.4f}")
-        print(f"   📍 Intersección (b): {self.intercept:.4f}")
-        print(f"   📝 Ecuación: y = {self.slope:.4f}x + {self.intercept:.4f}")
-        print("✅ Modelo entrenado exitosamente!")
+        Si hay caché (cache_size o enable_cache), las consultas repetidas
+        se resuelven sin recalcular.
+        
+        Args:
+            x_val (float): Valor de entrada
+            
+        Returns:
+            float: Predicción
+        """
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        cache = self.cache
+        if cache is None:
+            return self._slope * x_val + self._intercept
+        key = (self.version, x_val)
+        y_pred = cache.get(key)
+        if y_pred is None:
+            y_pred = self._slope * x_val + self._intercept
+            cache.put(key, y_pred)
+        return y_pred
+    
+    @abc.abstractmethod
+    def fit(self, X, y=None):
+        """
+        Entrenar el modelo con los datos de entrada.
+        
+        Args:
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes (None con un Dataset)
+        """
+    
+    def save(self, filepath):
+        """
+        Guardar los parámetros y estadísticos del modelo en un archivo JSON.
         
+        El archivo lleva formato y versión para poder validarlo al cargarlo,
+        y se escribe en un temporal que se renombra al final.
+        
+        Args:
+            filepath (str): Ruta del archivo de modelo
+        """
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        
+        data = {
+            "format": MODEL_FORMAT,
+            "version": MODEL_FORMAT_VERSION,
+            "slope": self.slope,
+            "intercept": self.intercept,
+            "n": self.stats.n if self.stats is not None else None,
+            "moments": self.stats.to_dict() if self.stats is not None else None,
+            "feature_scaling": None,
+            "data_hash": self.data_hash,
+        }
+        if self.stats is not None and self.stats.n > 0:
+            data["feature_scaling"] = {
+                "mean": self.stats.mean_x,
+                "std": (self.stats.m2_x / self.stats.n) ** 0.5,
+            }
+        
+        tmp_path = filepath + ".tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(data, file, indent=2)
+        os.replace(tmp_path, filepath)
+        logger.info("💾 Modelo guardado en %s", filepath)
+    
+    @classmethod
+    def load(cls, filepath):
+        """
+        Cargar un modelo guardado con save().
+        
+        Args:
+            filepath (str): Ruta del archivo de modelo
+            
+        Returns:
+            LinearRegression: Modelo listo para predecir
+        """
+        with open(filepath, 'r') as file:
+            data = json.load(file)
+        
+        if not isinstance(data, dict) or data.get("format") != MODEL_FORMAT:
+            raise ValueError(f"{filepath} no es un archivo de modelo válido")
+        if data.get("version") != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Versión de modelo no soportada: {data.get('version')}")
+        
+        model = cls()
+        model.slope = float(data["slope"])
+        model.intercept = float(data["intercept"])
+        if data.get("moments") is not None:
+            model.stats = RegressionStats.from_dict(data["moments"])
+        model.data_hash = data.get("data_hash")
+        model.is_fitted = True
+        return model
+    
     def predict(self, X):
         """
         Realizar predicciones con el modelo entrenado.
         
         Args:
-            X (list or array): Valores para predecir
+            X (list, array or Dataset): Valores para predecir (de un Dataset se usa X)
             
         Returns:
-            list: Predicciones del modelo
+            list: Predicciones del modelo (ndarray si X es un ndarray)
         """
         if self.is_fitted == False:
             raise ValueError("El modelo debe ser entrenado primero")
         
+        if is_dataset(X):
+            X = X.X
+        
         # Validar entrada
         if len(X) == 0:
-            print("⚠️  No hay valores para predecir")
+            logger.warning("⚠️  No hay valores para predecir")
             return []
         
-        # Convertir a lista si no lo es
-        X = list(X)
+        input_is_list = isinstance(X, list)
+        np = numpy_for(X)
+        if np is None:
+            # Convertir a lista si no lo es
+            X = list(X)
         
-        print(f"📈 Realizando predicciones para {len(X)} valores...")
-        print(f"   📝 Usando ecuación: y = {self.slope:.4f}x + {self.intercept:.4f}")
+        verbose = logger.isEnabledFor(logging.INFO)
+        if verbose:
+            logger.info("📈 Realizando predicciones para %d valores...", len(X))
+            logger.info("   📝 Usando ecuación: y = %.4fx + %.4f", self.slope, self.intercept)
         
         # Aplicar la ecuación lineal: y = mx + b
-        predictions = []
-        for x_val in X:
-            y_pred = self.slope * x_val + self.intercept
-            predictions.append(y_pred)
-        
-        # Mostrar estadísticas de las predicciones
-        print(f"   📊 Predicciones generadas:")
-        print(f"   🔍 Rango de entrada X: [{min(X):.2f}, {max(X):.2f}]")
-        print(f"   📈 Rango de predicciones: [{min(predictions):.2f}, {max(predictions):.2f}]")
-        
-        # Mostrar algunos ejemplos si hay pocos valores
-        if len(X) <= 5:
-            print("   💡 Ejemplos de predicciones:")
-            for i, (x_val, y_pred) in enumerate(zip(X, predictions)):
-                print(f"      x = {x_val:.2f} → y = {y_pred:.2f}")
-        
-        print(f"✅ {len(predictions)} predicciones completadas!")
+        if np is not None:
+            X = as_float_array(np, X)
+            predictions = X * self.slope + self.intercept
+        else:
+            slope = self._slope
+            intercept = self._intercept
+            predictions = [slope * x_val + intercept for x_val in X]
+        
+        # Las estadísticas sólo se calculan si alguien va a leerlas
+        if verbose:
+            if np is not None:
+                x_min, x_max = float(X.min()), float(X.max())
+                pred_min, pred_max = float(predictions.min()), float(predictions.max())
+            else:
+                x_min, x_max = min(X), max(X)
+                pred_min, pred_max = min(predictions), max(predictions)
+            
+            logger.info("   📊 Predicciones generadas:")
+            logger.info("   🔍 Rango de entrada X: [%.2f, %.2f]", x_min, x_max)
+            logger.info("   📈 Rango de predicciones: [%.2f, %.2f]", pred_min, pred_max)
+            
+            # Mostrar algunos ejemplos si hay pocos valores
+            if len(X) <= 5:
+                logger.info("   💡 Ejemplos de predicciones:")
+                for x_val, y_pred in zip(X, predictions):
+                    logger.info("      x = %.2f → y = %.2f", x_val, y_pred)
+            
+            logger.info("✅ %d predicciones completadas!", len(predictions))
         
+        # Las listas de entrada se siguen respondiendo con listas
+        if np is not None and input_is_list:
+            return predictions.tolist()
         return predictions
     
-    def mse(self, X, y):
+    def mse(self, X, y=None):
         """
         Calcular el Error Cuadrático Medio (Mean Squared Error).
         
         Args:
-            X (list or array): Variables independientes
-            y (list or array): Variables dependientes reales
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes reales (None con un Dataset)
             
         Returns:
             float: Valor MSE del modelo
         """
+        X, y = _columns(X, y)
         if  self.is_fitted == False:
             raise ValueError("El modelo debe ser entrenado primero")
         
@@ -149,71 +595,45 @@ class LinearRegression:
             raise ValueError("X e y deben tener la misma longitud")
         
         if len(X) == 0:
-            print("⚠️  No hay datos para evaluar")
+            logger.warning("⚠️  No hay datos para evaluar")
             return float('inf')
         
-        print(f"📊 Calculando MSE para {len(X)} puntos...")
+        logger.info("📊 Calculando MSE para %d puntos...", len(X))
         
-        # Hacer predicciones (sin mostrar info detallada)
-        X = list(X)
-        y = list(y)
+        # Una sola pasada sin listas temporales de predicciones ni errores
+        mse_value = MetricsAccumulator().update_linear(X, y, self.slope, self.intercept).result()["mse"]
         
-        # Calcular predicciones sin prints
-        y_pred = []
-        i = 0
-        while i < len(X):
-            pred = self.slope * X[i] + self.intercept
-            y_pred.append(pred)
-            i += 1
-        
-        # Calcular errores cuadrados
-        errores_cuadrados = []
-        j = 0
-        while j < len(y):
-            error = y[j] - y_pred[j]
-            error_cuadrado = error ** 2
-            errores_cuadrados.append(error_cuadrado)
-            j += 1
-        
-        # Calcular MSE
-        mse_value = sum(errores_cuadrados) / len(errores_cuadrados)
-        
-        # Mostrar estadísticas
-        # Calcular errores individuales para estadísticas
-        errores = []
-        k = 0
-        while k < len(y):
-            error = y[k] - y_pred[k]
-            errores.append(error)
-            k += 1
-        
-        print(f"   📈 MSE: {mse_value:.4f}")
-        print(f"   📊 Error promedio: ±{(mse_value ** 0.5):.4f}")
-        print(f"   🔍 Rango de errores: [{min(errores):.4f}, {max(errores):.4f}]")
-        
-        # Interpretación
-        if mse_value < 0.1:
-            print("   ✅ ¡Excelente precisión!")
-        elif mse_value < 1.0:
-            print("   👍 Buena precisión")
-        elif mse_value < 10.0:
-            print("   ⚠️  Precisión moderada")
-        else:
-            print("   ❌ Baja precisión - modelo necesita mejoras")
+        if logger.isEnabledFor(logging.INFO):
+            # Rango de errores: pasada extra sólo si alguien va a leerlo
+            error_min, error_max = self._error_range(X, y)
+            logger.info("   📈 MSE: %.4f", mse_value)
+            logger.info("   📊 Error promedio: ±%.4f", mse_value ** 0.5)
+            logger.info("   🔍 Rango de errores: [%.4f, %.4f]", error_min, error_max)
+            
+            # Interpretación
+            if mse_value < 0.1:
+                logger.info("   ✅ ¡Excelente precisión!")
+            elif mse_value < 1.0:
+                logger.info("   👍 Buena precisión")
+            elif mse_value < 10.0:
+                logger.info("   ⚠️  Precisión moderada")
+            else:
+                logger.info("   ❌ Baja precisión - modelo necesita mejoras")
         
         return mse_value
     
-    def score(self, X, y):
+    def score(self, X, y=None):
         """
         Calcular el coeficiente de determinación R².
         
         Args:
-            X (list or array): Variables independientes
-            y (list or array): Variables dependientes reales
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes reales (None con un Dataset)
             
         Returns:
             float: Valor R² del modelo (entre 0 y 1, donde 1 es perfecto)
         """
+        X, y = _columns(X, y)
         if not self.is_fitted:
             raise ValueError("El modelo debe ser entrenado primero")
         
@@ -222,56 +642,211 @@ class LinearRegression:
             raise ValueError("X e y deben tener la misma longitud")
         
         if len(X) == 0:
-            print("⚠️  No hay datos para evaluar")
+            logger.warning("⚠️  No hay datos para evaluar")
             return 0.0
         
-        print(f"📊 Calculando R² para {len(X)} puntos...")
-        
-        # Convertir a listas
-        X = list(X)
-        y = list(y)
-        
-        # Calcular predicciones sin prints
-        y_pred = []
-        i = 0
-        while i < len(X):
-            pred = self.slope * X[i] + self.intercept
-            y_pred.append(pred)
-            i += 1
-        
-        # Calcular media de y reales
-        y_mean = sum(y) / len(y)
+        logger.info("📊 Calculando R² para %d puntos...", len(X))
         
-        # Calcular suma de cuadrados total (TSS)
-        ss_tot = sum((real - y_mean) ** 2 for real in y)
-        
-        # Calcular suma de cuadrados residual (RSS)
-        ss_res = 0
-        j = 0
-        while j < len(y):
-            ss_res += (y[j] - y_pred[j]) ** 2
-            j += 1
-        
-        # Calcular R²
-        if ss_tot == 0:
-            r2 = 1.0  # Caso especial: todos los y son iguales
-        else:
-            r2 = 1 - (ss_res / ss_tot)
+        # TSS y RSS se acumulan en la misma pasada (ver MetricsAccumulator)
+        r2 = MetricsAccumulator().update_linear(X, y, self.slope, self.intercept).result()["r2"]
         
         # Mostrar estadísticas
-        print(f"   📈 R²: {r2:.4f}")
-        print(f"   📊 Porcentaje explicado: {r2 * 100:.2f}%")
+        logger.info("   📈 R²: %.4f", r2)
+        logger.info("   📊 Porcentaje explicado: %.2f%%", r2 * 100)
         
         # Interpretación
         if r2 >= 0.9:
-            print("   ✅ ¡Excelente ajuste!")
+            logger.info("   ✅ ¡Excelente ajuste!")
         elif r2 >= 0.7:
-            print("   👍 Buen ajuste")
+            logger.info("   👍 Buen ajuste")
         elif r2 >= 0.5:
-            print("   ⚠️  Ajuste moderado")
+            logger.info("   ⚠️  Ajuste moderado")
         elif r2 >= 0.0:
-            print("   ❌ Ajuste pobre")
+            logger.info("   ❌ Ajuste pobre")
         else:
-            print("   💥 Modelo peor que una línea horizontal")
+            logger.info("   💥 Modelo peor que una línea horizontal")
         
         return r2
+    
+    def _error_range(self, X, y):
+        """Calcular el error mínimo y máximo (sólo para los mensajes)."""
+        np = numpy_for(X, y)
+        if np is not None:
+            errores = as_float_array(np, y) - (as_float_array(np, X) * self.slope + self.intercept)
+            return float(errores.min()), float(errores.max())
+        error_min = float('inf')
+        error_max = float('-inf')
+        for x_val, y_val in zip(X, y):
+            error = y_val - (self.slope * x_val + self.intercept)
+            if error < error_min:
+                error_min = error
+            if error > error_max:
+                error_max = error
+        return error_min, error_max
+    
+    def evaluate(self, X, y=None):
+        """
+        Calcular MSE, RMSE, MAE y R² del modelo en una sola pasada.
+        
+        Args:
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes reales (None con un Dataset)
+            
+        Returns:
+            dict: mse, rmse, mae y r2
+        """
+        X, y = _columns(X, y)
+        return self.evaluate_chunks([(X, y)])
+    
+    def evaluate_chunks(self, chunks):
+        """
+        Evaluar el modelo sobre datos que llegan por bloques.
+        
+        Pensado para conjuntos de prueba que no caben en memoria, p. ej.
+        model.evaluate_chunks(iter_csv_chunks("test.csv")). Cada bloque se
+        recorre una única vez y no se guarda nada de él.
+        
+        Args:
+            chunks (iterable): Pares (X_chunk, y_chunk) o Datasets
+            
+        Returns:
+            dict: mse, rmse, mae y r2
+        """
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        
+        accumulator = MetricsAccumulator()
+        for chunk in chunks:
+            X_chunk, y_chunk = chunk.columns() if is_dataset(chunk) else chunk
+            accumulator.update_linear(X_chunk, y_chunk, self.slope, self.intercept)
+        if accumulator.n == 0:
+            raise ValueError("No hay datos para evaluar")
+        return accumulator.result()
+    
+    def training_mse(self):
+        """
+        Calcular el MSE sobre los datos de entrenamiento en O(1).
+        
+        Se obtiene de los estadísticos guardados en fit/partial_fit, sin
+        volver a recorrer los datos.
+        
+        Returns:
+            float: MSE de entrenamiento
+        """
+        stats = self._training_stats()
+        return stats.residual_sum_of_squares(self.slope, self.intercept) / stats.n
+    
+    def training_score(self):
+        """
+        Calcular el R² sobre los datos de entrenamiento en O(1).
+        
+        Returns:
+            float: R² de entrenamiento
+        """
+        stats = self._training_stats()
+        if stats.m2_y == 0:
+            return 1.0  # Caso especial: todos los y son iguales
+        return 1 - stats.residual_sum_of_squares(self.slope, self.intercept) / stats.m2_y
+    
+    def _training_stats(self):
+        """Devolver los estadísticos de entrenamiento o fallar si no los hay."""
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        if self.stats is None or self.stats.n == 0:
+            raise ValueError("El modelo no tiene estadísticos de entrenamiento")
+        return self.stats
+
+
+class LinearRegression(BaseRegression):
+    """
+    Implementación de Regresión Lineal Simple usando Mínimos Cuadrados.
+    
+    Como sólo guarda estadísticos suficientes, además de fit admite
+    entrenamiento incremental (partial_fit) y combinar modelos entrenados
+    por separado (merge). Ver BaseRegression para los atributos.
+    """
+    
+    def fit(self, X, y=None):
+        """
+        Entrenar el modelo con los datos de entrada.
+        
+        Args:
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes (None con un Dataset)
+        """
+        X, y = _columns(X, y)
+        # Validar entrada
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+        
+        if len(X) < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
+        
+        logger.info("🔧 Entrenando modelo con algoritmo de mínimos cuadrados...")
+        
+        # Calcular estadísticas necesarias (desde cero)
+        stats = RegressionStats.from_data(X, y)
+        
+        # Mostrar estadísticas de cálculo
+        logger.info("   Número de muestras: %d", stats.n)
+        logger.info("   🧮 Calculando parámetros usando mínimos cuadrados...")
+        
+        self.slope, self.intercept = stats.coefficients()
+        self.stats = stats
+        
+        # Marcar como entrenado
+        self.is_fitted = True
+        
+        # Mostrar resultados
+        logger.info("   📈 Pendiente (m): %.4f", self.slope)
+        logger.info("   📍 Intersección (b): %.4f", self.intercept)
+        logger.info("   📝 Ecuación: y = %.4fx + %.4f", self.slope, self.intercept)
+        logger.info("✅ Modelo entrenado exitosamente!")
+    
+    def partial_fit(self, X_chunk, y_chunk=None):
+        """
+        Entrenar el modelo de forma incremental con un bloque de datos.
+        
+        Los estadísticos se acumulan entre llamadas, así que el modelo puede
+        aprender de un flujo sin límite de datos (p. ej. iter_csv_chunks).
+        Los parámetros se actualizan en cuanto hay suficientes datos.
+        
+        Args:
+            X_chunk (list, array or Dataset): Variables independientes del bloque
+            y_chunk (list or array): Variables dependientes del bloque (None con un Dataset)
+            
+        Returns:
+            LinearRegression: self, para encadenar llamadas
+        """
+        X_chunk, y_chunk = _columns(X_chunk, y_chunk)
+        if self.stats is None:
+            self.stats = RegressionStats()
+        self.stats.update(X_chunk, y_chunk)
+        self._refresh_parameters()
+        return self
+    
+    def merge(self, other):
+        """
+        Incorporar los estadísticos de otro modelo entrenado por separado.
+        
+        Args:
+            other (BaseRegression or RegressionStats): Modelo o estadísticos de otra partición
+            
+        Returns:
+            LinearRegression: self, para encadenar llamadas
+        """
+        other_stats = other.stats if isinstance(other, BaseRegression) else other
+        if other_stats is None:
+            return self
+        if self.stats is None:
+            self.stats = RegressionStats()
+        self.stats.merge(other_stats)
+        self._refresh_parameters()
+        return self
+    
+    def _refresh_parameters(self):
+        """Recalcular pendiente e intersección a partir de los estadísticos."""
+        if self.stats.n >= 2 and self.stats.m2_x > 0:
+            self.slope, self.intercept = self.stats.coefficients()
+            self.is_fitted = True
+        
@@ -0,0 +1,39 @@
+"""
+Configuración de los mensajes del paquete.
+
+Todos los módulos escriben sus mensajes de progreso con logging y el
+paquete no muestra nada por defecto. Los programas que quieran verlos
+(como main.py) llaman a configure_logging.
+"""
+
+import logging
+import sys
+
+PACKAGE_LOGGER = __name__.rpartition(".")[0] or "src"
+
+
+def configure_logging(level=logging.INFO, stream=None):
+    """
+    Mostrar por consola los mensajes del paquete.
+    
+    Se puede llamar varias veces: sólo se instala un manejador.
+    
+    Args:
+        level (int): Nivel mínimo a mostrar (logging.WARNING para modo silencioso)
+        stream (file): Destino de los mensajes (por defecto sys.stdout)
+        
+    Returns:
+        logging.Logger: Logger raíz del paquete
+    """
+    logger = logging.getLogger(PACKAGE_LOGGER)
+    logger.setLevel(level)
+    for handler in logger.handlers:
+        if getattr(handler, "_configured_by_log_utils", False):
+            handler.setStream(stream or sys.stdout)
+            break
+    else:
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._configured_by_log_utils = True
+        logger.addHandler(handler)
+    return logger
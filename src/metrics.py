@@ -3,38 +3,256 @@ Métricas de evaluación para modelos de regresión.
 
 Este módulo contiene funciones para calcular diferentes métricas
 de rendimiento en problemas de regresión.
+
+Todas aceptan listas, ndarrays, array('d') o memoryviews sin convertirlos
+a listas; si y_true es un Dataset se usa su columna y. compute_all (y
+MetricsAccumulator, para datos por bloques) obtiene MSE, RMSE, MAE y R²
+en una única pasada sobre los datos.
 """
 
+try:
+    from ._backend import numpy_for, as_float_array, is_dataset
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import numpy_for, as_float_array, is_dataset
+
+# Tamaño de bloque de la ruta vectorizada: los temporales caben en caché
+BLOCK_SIZE = 65536
+
+def _validate(y_true, y_pred):
+    """
+    Comprobar que las dos secuencias son comparables.
+
+    Returns:
+        list or array: y_true (la columna y si era un Dataset)
+    """
+    if is_dataset(y_true):
+        y_true = y_true.y
+    if len(y_true) != len(y_pred) or len(y_true) == 0:
+        raise ValueError("Las listas deben tener la misma longitud y no estar vacías")
+    return y_true
+
+class MetricsAccumulator:
+    """
+    Acumulador de métricas de regresión en una sola pasada.
+
+    Por cada bloque se calculan una vez los residuos y con ellos la suma
+    de errores cuadrados y absolutos; la dispersión de y_true (para R²)
+    se acumula con las fórmulas de Welford/Chan, así que no hace falta
+    conocer la media de antemano ni volver a recorrer los datos.
+
+    Attributes:
+        n (int): Número de valores acumulados
+        sse (float): Σ(y_true - y_pred)²
+        sae (float): Σ|y_true - y_pred|
+        mean_true (float): Media de y_true
+        m2_true (float): Σ(y_true - media)²
+    """
+
+    def __init__(self):
+        """Inicializar un acumulador vacío."""
+        self.n = 0
+        self.sse = 0.0
+        self.sae = 0.0
+        self.mean_true = 0.0
+        self.m2_true = 0.0
+
+    def update(self, y_true, y_pred):
+        """
+        Acumular un bloque de valores reales y predichos.
+
+        Args:
+            y_true (list or array): Valores reales
+            y_pred (list or array): Valores predichos
+
+        Returns:
+            MetricsAccumulator: self, para encadenar llamadas
+        """
+        if len(y_true) != len(y_pred):
+            raise ValueError("y_true e y_pred deben tener la misma longitud")
+
+        np = numpy_for(y_true, y_pred)
+        if np is not None:
+            y_true = as_float_array(np, y_true)
+            y_pred = as_float_array(np, y_pred)
+            buffer = np.empty(min(BLOCK_SIZE, len(y_true)), dtype=np.float64)
+            for start in range(0, len(y_true), BLOCK_SIZE):
+                true_block = y_true[start:start + BLOCK_SIZE]
+                errors = buffer[:len(true_block)]
+                np.subtract(true_block, y_pred[start:start + BLOCK_SIZE], out=errors)
+                self._update_block(np, true_block, errors)
+            return self
+
+        n = self.n
+        sse = self.sse
+        sae = self.sae
+        mean_true = self.mean_true
+        m2_true = self.m2_true
+        for real, pred in zip(y_true, y_pred):
+            error = real - pred
+            sse += error * error
+            sae += abs(error)
+            n += 1
+            delta = real - mean_true
+            mean_true += delta / n
+            m2_true += delta * (real - mean_true)
+        self.n = n
+        self.sse = sse
+        self.sae = sae
+        self.mean_true = mean_true
+        self.m2_true = m2_true
+        return self
+
+    def update_linear(self, X, y_true, slope, intercept):
+        """
+        Acumular comparando y_true con la recta y = slope·x + intercept.
+
+        Equivale a update(y_true, [slope * x + intercept for x in X]) pero
+        sin materializar las predicciones: cada residuo se calcula y se
+        consume en la misma pasada.
+
+        Args:
+            X (list or array): Variables independientes
+            y_true (list or array): Valores reales
+            slope (float): Pendiente de la recta
+            intercept (float): Intersección de la recta
+
+        Returns:
+            MetricsAccumulator: self, para encadenar llamadas
+        """
+        if len(X) != len(y_true):
+            raise ValueError("X e y deben tener la misma longitud")
+
+        np = numpy_for(X, y_true)
+        if np is not None:
+            X = as_float_array(np, X)
+            y_true = as_float_array(np, y_true)
+            buffer = np.empty(min(BLOCK_SIZE, len(X)), dtype=np.float64)
+            for start in range(0, len(X), BLOCK_SIZE):
+                true_block = y_true[start:start + BLOCK_SIZE]
+                errors = buffer[:len(true_block)]
+                np.multiply(X[start:start + BLOCK_SIZE], -slope, out=errors)
+                errors -= intercept
+                errors += true_block
+                self._update_block(np, true_block, errors)
+            return self
+
+        n = self.n
+        sse = self.sse
+        sae = self.sae
+        mean_true = self.mean_true
+        m2_true = self.m2_true
+        for x_val, real in zip(X, y_true):
+            error = real - (slope * x_val + intercept)
+            sse += error * error
+            sae += abs(error)
+            n += 1
+            delta = real - mean_true
+            mean_true += delta / n
+            m2_true += delta * (real - mean_true)
+        self.n = n
+        self.sse = sse
+        self.sae = sae
+        self.mean_true = mean_true
+        self.m2_true = m2_true
+        return self
+
+    def _update_block(self, np, true_block, errors):
+        """Acumular un bloque vectorizado; errors (residuos) se reutiliza como buffer."""
+        self.sse += float(np.dot(errors, errors))
+        self.sae += float(np.abs(errors, out=errors).sum())
+        # Dispersión del bloque, reutilizando el mismo buffer
+        block_mean = float(true_block.mean())
+        np.subtract(true_block, block_mean, out=errors)
+        self._merge_moments(len(true_block), block_mean, float(np.dot(errors, errors)))
+
+    def _merge_moments(self, n_block, mean_block, m2_block):
+        """Combinar la media y la dispersión de un bloque con lo acumulado."""
+        n = self.n + n_block
+        delta = mean_block - self.mean_true
+        self.m2_true += m2_block + delta * delta * self.n * n_block / n
+        self.mean_true += delta * n_block / n
+        self.n = n
+
+    def merge(self, other):
+        """
+        Combinar con otro acumulador (p. ej. de otro proceso).
+
+        Returns:
+            MetricsAccumulator: self, para encadenar llamadas
+        """
+        if other.n == 0:
+            return self
+        self.sse += other.sse
+        self.sae += other.sae
+        self._merge_moments(other.n, other.mean_true, other.m2_true)
+        return self
+
+    def result(self):
+        """
+        Calcular las métricas acumuladas.
+
+        Returns:
+            dict: mse, rmse, mae y r2
+        """
+        if self.n == 0:
+            raise ValueError("No hay valores acumulados: hace falta al menos un bloque no vacío")
+        mse = self.sse / self.n
+        if self.m2_true == 0:
+            r2 = 1.0
+        else:
+            r2 = 1 - (self.sse / self.m2_true)
+        return {
+            "mse": mse,
+            "rmse": mse ** 0.5,
+            "mae": self.sae / self.n,
+            "r2": r2,
+        }
+
+def compute_all(y_true, y_pred):
+    """
+    Calcular MSE, RMSE, MAE y R² en una única pasada.
+
+    Args:
+        y_true (list or array): Valores reales
+        y_pred (list or array): Valores predichos
+
+    Returns:
+        dict: mse, rmse, mae y r2
+    """
+    y_true = _validate(y_true, y_pred)
+    return MetricsAccumulator().update(y_true, y_pred).result()
+
 def mean_squared_error(y_true, y_pred):
     """
     Calcular el Error Cuadrático Medio (MSE).
-    
+
     Args:
         y_true (list): Valores reales
         y_pred (list): Valores predichos
-        
+
     Returns:
         float: Valor MSE
     """
-    if len(y_true) != len(y_pred) or len(y_true) == 0:
-        raise ValueError("Las listas deben tener la misma longitud y no estar vacías")
+    y_true = _validate(y_true, y_pred)
+    np = numpy_for(y_true, y_pred)
+    if np is not None:
+        errors = as_float_array(np, y_true) - as_float_array(np, y_pred)
+        return float(np.dot(errors, errors)) / len(errors)
     mse = 0.0
-    i = 0
-    while i < len(y_true):
-        error = y_true[i] - y_pred[i]
-        mse += error ** 2
-        i += 1
+    for real, pred in zip(y_true, y_pred):
+        error = real - pred
+        mse += error * error
     mse /= len(y_true)
     return mse
 
 def root_mean_squared_error(y_true, y_pred):
     """
     Calcular la Raíz del Error Cuadrático Medio (RMSE).
-    
+
     Args:
         y_true (list): Valores reales
         y_pred (list): Valores predichos
-        
+
     Returns:
         float: Valor RMSE
     """
@@ -45,54 +263,37 @@ def root_mean_squared_error(y_true, y_pred):
 def mean_absolute_error(y_true, y_pred):
     """
     Calcular el Error Absoluto Medio (MAE).
-    
+
     Args:
         y_true (list): Valores reales
         y_pred (list): Valores predichos
-        
+
     Returns:
         float: Valor MAE
     """
-    if len(y_true) != len(y_pred) or len(y_true) == 0:
-        raise ValueError("Las listas deben tener la misma longitud y no estar vacías")
+    y_true = _validate(y_true, y_pred)
+    np = numpy_for(y_true, y_pred)
+    if np is not None:
+        errors = as_float_array(np, y_true) - as_float_array(np, y_pred)
+        return float(np.abs(errors, out=errors).sum()) / len(errors)
     mae = 0.0
-    i = 0
-    while i < len(y_true):
-        error = abs(y_true[i] - y_pred[i])
-        mae += error
-        i += 1
+    for real, pred in zip(y_true, y_pred):
+        mae += abs(real - pred)
     mae /= len(y_true)
     return mae
 
 def r_squared(y_true, y_pred):
     """
     Calcular el coeficiente de determinación R².
-    
+
+    La suma de cuadrados total y la residual se acumulan en la misma
+    pasada (ver MetricsAccumulator).
+
     Args:
         y_true (list): Valores reales
         y_pred (list): Valores predichos
-        
+
     Returns:
         float: Valor R² (entre 0 y 1)
     """
-    if len(y_true) != len(y_pred) or len(y_true) == 0:
-        raise ValueError("Las listas deben tener la misma longitud y no estar vacías")
-    # Calcular la media de los valores reales
-    y_mean = sum(y_true) / len(y_true)
-    # Calcular suma de cuadrados total (TSS)
-    ss_tot = 0.0
-    i = 0
-    while i < len(y_true):
-        ss_tot += (y_true[i] - y_mean) ** 2
-        i += 1
-    # Calcular suma de cuadrados residual (RSS)
-    ss_res = 0.0
-    j = 0
-    while j < len(y_true):
-        ss_res += (y_true[j] - y_pred[j]) ** 2
-        j += 1
-    # Calcular R²
-    if ss_tot == 0:
-        return 1.0
-    r2 = 1 - (ss_res / ss_tot)
-    return r2
+    return compute_all(y_true, y_pred)["r2"]
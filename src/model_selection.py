@@ -0,0 +1,226 @@
+"""
+Validación cruzada para LinearRegression.
+
+K-fold y holdout repetido sin reentrenar desde los datos: los
+estadísticos suficientes (RegressionStats) de cada partición de prueba
+se calculan una sola vez y los de entrenamiento se obtienen restándolos
+del total (RegressionStats.subtract). La recta de cada fold sale de esos
+estadísticos y la evaluación de los folds (MSE, RMSE, MAE y R² sobre los
+datos de prueba) se reparte entre varios procesos.
+"""
+
+import logging
+import os
+import time
+
+try:
+    from ._backend import load_numpy, is_ndarray
+    from .data_utils import split_indices
+    from .linear_regression import RegressionStats
+    from .metrics import MetricsAccumulator
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy, is_ndarray
+    from data_utils import split_indices
+    from linear_regression import RegressionStats
+    from metrics import MetricsAccumulator
+
+logger = logging.getLogger(__name__)
+
+# Por debajo de este número de filas no compensa crear procesos
+MIN_PARALLEL_SAMPLES = 200000
+
+METRIC_NAMES = ("mse", "rmse", "mae", "r2")
+
+
+class CrossValidationResult:
+    """
+    Resultados de una validación cruzada.
+
+    Attributes:
+        method (str): "k-fold" o "holdout"
+        folds (list): Un diccionario por fold con fold, n_train, n_test,
+            slope, intercept, mse, rmse, mae y r2
+        elapsed (float): Segundos empleados
+    """
+
+    def __init__(self, method, folds, elapsed):
+        """Guardar los resultados de cada fold."""
+        self.method = method
+        self.folds = folds
+        self.elapsed = elapsed
+
+    def mean(self):
+        """Media de cada métrica sobre los folds."""
+        return {name: sum(fold[name] for fold in self.folds) / len(self.folds) for name in METRIC_NAMES}
+
+    def std(self):
+        """Desviación típica de cada métrica sobre los folds."""
+        means = self.mean()
+        return {
+            name: (sum((fold[name] - means[name]) ** 2 for fold in self.folds) / len(self.folds)) ** 0.5
+            for name in METRIC_NAMES
+        }
+
+    def table(self):
+        """
+        Tabla de texto con las métricas de cada fold, la media y la desviación.
+
+        Returns:
+            str: Tabla lista para imprimir
+        """
+        header = f"{'fold':>6} {'n_test':>9} {'MSE':>14} {'RMSE':>11} {'MAE':>11} {'R²':>8}"
+        lines = [header, "-" * len(header)]
+        for fold in self.folds:
+            lines.append(f"{fold['fold']:>6} {fold['n_test']:>9} {fold['mse']:>14.4f} {fold['rmse']:>11.4f} "
+                         f"{fold['mae']:>11.4f} {fold['r2']:>8.4f}")
+        lines.append("-" * len(header))
+        for label, values in (("media", self.mean()), ("desv.", self.std())):
+            lines.append(f"{label:>6} {'':>9} {values['mse']:>14.4f} {values['rmse']:>11.4f} "
+                         f"{values['mae']:>11.4f} {values['r2']:>8.4f}")
+        return "\n".join(lines)
+
+
+def k_fold_indices(n_samples, n_splits=5, shuffle=True, seed=None):
+    """
+    Repartir las filas en n_splits folds de prueba disjuntos.
+
+    Args:
+        n_samples (int): Número de filas
+        n_splits (int): Número de folds
+        shuffle (bool): Barajar antes de repartir (si no, folds contiguos)
+        seed (int): Semilla para barajar
+
+    Returns:
+        list: Índices de prueba de cada fold (ndarrays o range)
+    """
+    if n_splits < 2:
+        raise ValueError("n_splits debe ser al menos 2")
+    if n_splits > n_samples:
+        raise ValueError("No puede haber más folds que muestras")
+
+    if shuffle:
+        order, _ = split_indices(n_samples, test_size=0.0, seed=seed)
+    else:
+        order = range(n_samples)
+
+    # Los primeros n % k folds tienen una fila más
+    base, extra = divmod(n_samples, n_splits)
+    folds = []
+    start = 0
+    for k in range(n_splits):
+        size = base + (1 if k < extra else 0)
+        folds.append(order[start:start + size])
+        start += size
+    return folds
+
+
+def _take(data, indices):
+    """Copiar las filas indicadas (para enviarlas a otro proceso)."""
+    if is_ndarray(data) or is_ndarray(indices):
+        np = load_numpy()
+        return np.asarray(data, dtype=np.float64)[np.asarray(indices)]
+    if isinstance(indices, range) and not isinstance(data, memoryview):
+        return data[indices.start:indices.stop]
+    return [data[i] for i in indices]
+
+
+def _evaluate_fold(X_test, y_test, slope, intercept):
+    """Evaluar una recta sobre los datos de prueba de un fold (en un proceso trabajador)."""
+    return MetricsAccumulator().update_linear(X_test, y_test, slope, intercept).result()
+
+
+def _run_folds(X, y, test_folds, workers, method):
+    """Calcular estadísticos, rectas y métricas de cada fold."""
+    start_time = time.perf_counter()
+    if len(X) != len(y):
+        raise ValueError("X e y deben tener la misma longitud")
+
+    # Una pasada por fold de prueba; el total se obtiene combinándolos
+    # (en holdout repetido las particiones se solapan, así que se calcula aparte)
+    tests = [(_take(X, indices), _take(y, indices)) for indices in test_folds]
+    test_stats = [RegressionStats.from_data(X_test, y_test) for X_test, y_test in tests]
+    if method == "k-fold":
+        total = RegressionStats()
+        for stats in test_stats:
+            total.merge(stats)
+    else:
+        total = RegressionStats.from_data(X, y)
+
+    lines = []
+    for stats in test_stats:
+        train = total.copy().subtract(stats)
+        lines.append((train.n, train.coefficients()))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers > 1 and len(X) >= MIN_PARALLEL_SAMPLES:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(tests))) as executor:
+            futures = [executor.submit(_evaluate_fold, X_test, y_test, slope, intercept)
+                       for (X_test, y_test), (_, (slope, intercept)) in zip(tests, lines)]
+            results = [future.result() for future in futures]
+    else:
+        results = [_evaluate_fold(X_test, y_test, slope, intercept)
+                   for (X_test, y_test), (_, (slope, intercept)) in zip(tests, lines)]
+
+    folds = []
+    for k, ((n_train, (slope, intercept)), metrics, (X_test, _)) in enumerate(zip(lines, results, tests), start=1):
+        fold = {"fold": k, "n_train": n_train, "n_test": len(X_test), "slope": slope, "intercept": intercept}
+        fold.update(metrics)
+        folds.append(fold)
+
+    result = CrossValidationResult(method, folds, time.perf_counter() - start_time)
+    means = result.mean()
+    logger.info("✅ Validación cruzada (%s, %d folds) en %.3f s: MSE medio %.4f, R² medio %.4f",
+                method, len(folds), result.elapsed, means["mse"], means["r2"])
+    return result
+
+
+def cross_validate(X, y, n_splits=5, shuffle=True, seed=None, workers=None):
+    """
+    Validación cruzada K-fold de una regresión lineal simple.
+
+    Args:
+        X (list or array): Variables independientes
+        y (list or array): Variables dependientes
+        n_splits (int): Número de folds
+        shuffle (bool): Barajar las filas antes de repartirlas
+        seed (int): Semilla para barajar
+        workers (int): Procesos para evaluar los folds (por defecto, todos los núcleos)
+
+    Returns:
+        CrossValidationResult: Métricas de cada fold
+    """
+    logger.info("🔁 Validación cruzada K-fold con %d folds...", n_splits)
+    test_folds = k_fold_indices(len(X), n_splits, shuffle, seed)
+    return _run_folds(X, y, test_folds, workers, "k-fold")
+
+
+def repeated_holdout(X, y, test_size=0.2, n_repeats=10, seed=None, workers=None):
+    """
+    Holdout repetido: n_repeats divisiones aleatorias entrenamiento/prueba.
+
+    Args:
+        X (list or array): Variables independientes
+        y (list or array): Variables dependientes
+        test_size (float): Proporción para el conjunto de prueba
+        n_repeats (int): Número de divisiones
+        seed (int): Semilla de la primera división (las demás usan seed + i)
+        workers (int): Procesos para evaluar las divisiones
+
+    Returns:
+        CrossValidationResult: Métricas de cada división
+    """
+    if n_repeats < 1:
+        raise ValueError("n_repeats debe ser al menos 1")
+    n_test = int(len(X) * test_size)
+    if n_test < 1 or len(X) - n_test < 2:
+        raise ValueError("test_size deja algún conjunto sin datos suficientes")
+
+    logger.info("🔁 Holdout repetido %d veces (%d%% prueba)...", n_repeats, int(test_size * 100))
+    test_folds = []
+    for i in range(n_repeats):
+        split_seed = None if seed is None else seed + i
+        _, test_indices = split_indices(len(X), test_size, split_seed)
+        test_folds.append(test_indices)
+    return _run_folds(X, y, test_folds, workers, "holdout")
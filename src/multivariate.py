@@ -0,0 +1,369 @@
+"""
+Regresión lineal múltiple.
+
+Ajusta y = b + m1·x1 + ... + mp·xp por mínimos cuadrados. Los datos se
+pueden procesar bloque a bloque (p. ej. con iter_csv_matrix_chunks): de
+cada bloque sólo se guarda un resumen de tamaño (p+2)², así que la
+memoria es O(p²) sea cual sea el número de filas.
+
+Hay dos formas de resumir y resolver:
+
+- "cholesky": se acumula la matriz de Gram [1 X y]ᵀ[1 X y] y se resuelven
+  las ecuaciones normales con una factorización de Cholesky.
+- "qr": se mantiene el factor R de la descomposición QR de [1 X y],
+  actualizado con rotaciones de Givens (o con numpy.linalg.qr por
+  bloques). Evita formar XᵀX, que eleva al cuadrado el número de
+  condición, y es la opción más estable si las variables están muy
+  correlacionadas.
+
+En ambos casos los datos se desplazan por las medias del primer bloque
+antes de acumular, para que kilometrajes del orden de 10⁵ no provoquen
+cancelaciones al restar sumas grandes.
+"""
+
+import logging
+import math
+
+try:
+    from ._backend import numpy_for
+    from .metrics import compute_all
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import numpy_for
+    from metrics import compute_all
+
+logger = logging.getLogger(__name__)
+
+SOLVERS = ("cholesky", "qr")
+
+# Pivote relativo por debajo del cual las variables se consideran colineales
+COLLINEAR_TOLERANCE = 1e-10
+
+
+class MultipleLinearRegression:
+    """
+    Regresión lineal con varias variables independientes.
+
+    Attributes:
+        solver (str): "cholesky" (ecuaciones normales) o "qr"
+        coefficients (list): Pendiente de cada variable (m1, ..., mp)
+        intercept (float): Intersección (b)
+        n_features (int): Número de variables independientes
+        n_samples (int): Número de filas vistas
+        feature_names (list): Nombres opcionales de las variables
+        is_fitted (bool): Indica si el modelo ha sido entrenado
+    """
+
+    def __init__(self, solver="cholesky", feature_names=None):
+        """Inicializar el modelo."""
+        if solver not in SOLVERS:
+            raise ValueError(f"solver debe ser uno de {SOLVERS}")
+        self.solver = solver
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        self._reset()
+
+    def _reset(self):
+        """Olvidar todos los datos acumulados."""
+        self.coefficients = None
+        self.intercept = None
+        self.n_features = None
+        self.n_samples = 0
+        self.is_fitted = False
+        self._shift = None
+        # Gram (cholesky) o R (qr): matriz (p+2)×(p+2) como listas
+        self._summary = None
+
+    @staticmethod
+    def _rows(X):
+        """Normalizar la entrada: una secuencia 1-D se trata como una sola variable."""
+        if hasattr(X, 'ndim'):
+            if X.ndim == 1:
+                return X.reshape(-1, 1), 1
+            return X, X.shape[1]
+        if len(X) > 0 and not hasattr(X[0], '__len__'):
+            return [[x_val] for x_val in X], 1
+        return X, len(X[0]) if len(X) > 0 else 0
+
+    def fit(self, X, y):
+        """
+        Entrenar el modelo desde cero.
+
+        Args:
+            X (list or array): Filas de variables independientes (n × p)
+            y (list or array): Variables dependientes
+        """
+        self._reset()
+        logger.info("🔧 Entrenando regresión múltiple (%s)...", self.solver)
+        self.partial_fit(X, y)
+        if not self.is_fitted:
+            raise ValueError("No hay datos suficientes (o las variables son colineales) para entrenar")
+        self._log_result()
+        return self
+
+    def fit_chunks(self, chunks):
+        """
+        Entrenar desde cero con datos que llegan por bloques.
+
+        Args:
+            chunks (iterable): Pares (X_chunk, y_chunk)
+        """
+        self._reset()
+        logger.info("🔧 Entrenando regresión múltiple por bloques (%s)...", self.solver)
+        for X_chunk, y_chunk in chunks:
+            self.partial_fit(X_chunk, y_chunk)
+        if not self.is_fitted:
+            raise ValueError("No hay datos suficientes (o las variables son colineales) para entrenar")
+        self._log_result()
+        return self
+
+    def partial_fit(self, X_chunk, y_chunk):
+        """
+        Acumular un bloque de datos y actualizar los coeficientes.
+
+        Args:
+            X_chunk (list or array): Filas de variables independientes
+            y_chunk (list or array): Variables dependientes
+
+        Returns:
+            MultipleLinearRegression: self, para encadenar llamadas
+        """
+        if len(X_chunk) != len(y_chunk):
+            raise ValueError("X e y deben tener la misma longitud")
+        if len(X_chunk) == 0:
+            return self
+
+        rows, n_features = self._rows(X_chunk)
+        if self.n_features is None:
+            self._start(rows, y_chunk, n_features)
+        elif n_features != self.n_features:
+            raise ValueError(f"Se esperaban {self.n_features} variables y hay {n_features}")
+
+        np = numpy_for(rows, y_chunk)
+        if np is not None:
+            self._accumulate_numpy(np, rows, y_chunk)
+        elif self.solver == "qr":
+            self._accumulate_givens(rows, y_chunk)
+        else:
+            self._accumulate_gram(rows, y_chunk)
+        self.n_samples += len(y_chunk)
+
+        if self.n_samples > self.n_features:
+            self._solve()
+        return self
+
+    def _start(self, rows, y, n_features):
+        """Fijar el desplazamiento con las medias del primer bloque."""
+        self.n_features = n_features
+        if self.feature_names is not None and len(self.feature_names) != n_features:
+            raise ValueError("feature_names no coincide con el número de variables")
+        n = len(y)
+        shift = [0.0] * (n_features + 1)
+        for row, y_val in zip(rows, y):
+            for j in range(n_features):
+                shift[j] += row[j]
+            shift[n_features] += y_val
+        self._shift = [float(total) / n for total in shift]
+        size = n_features + 2
+        self._summary = [[0.0] * size for _ in range(size)]
+
+    def _augmented(self, row, y_val):
+        """Fila [1, x1 - c1, ..., xp - cp, y - cy]."""
+        shift = self._shift
+        return [1.0] + [row[j] - shift[j] for j in range(self.n_features)] + [y_val - shift[-1]]
+
+    def _accumulate_gram(self, rows, y):
+        """Sumar aᵀa de cada fila a la matriz de Gram (sólo el triángulo superior)."""
+        gram = self._summary
+        size = self.n_features + 2
+        for row, y_val in zip(rows, y):
+            a = self._augmented(row, y_val)
+            for i in range(size):
+                a_i = a[i]
+                if a_i == 0.0:
+                    continue
+                gram_row = gram[i]
+                for j in range(i, size):
+                    gram_row[j] += a_i * a[j]
+
+    def _accumulate_givens(self, rows, y):
+        """Incorporar cada fila al factor R con rotaciones de Givens."""
+        r = self._summary
+        size = self.n_features + 2
+        for row, y_val in zip(rows, y):
+            a = self._augmented(row, y_val)
+            for k in range(size):
+                a_k = a[k]
+                if a_k == 0.0:
+                    continue
+                r_k = r[k]
+                radius = math.hypot(r_k[k], a_k)
+                c = r_k[k] / radius
+                s = a_k / radius
+                r_k[k] = radius
+                for j in range(k + 1, size):
+                    r_kj = r_k[j]
+                    a_j = a[j]
+                    r_k[j] = c * r_kj + s * a_j
+                    a[j] = c * a_j - s * r_kj
+
+    def _accumulate_numpy(self, np, rows, y):
+        """Versión vectorizada: un producto de matrices (Gram) o una QR por bloque."""
+        n = len(y)
+        size = self.n_features + 2
+        shift = np.asarray(self._shift, dtype=np.float64)
+        a = np.empty((n, size), dtype=np.float64)
+        a[:, 0] = 1.0
+        a[:, 1:size - 1] = np.asarray(rows, dtype=np.float64).reshape(n, self.n_features) - shift[:-1]
+        a[:, size - 1] = np.asarray(y, dtype=np.float64) - shift[-1]
+
+        if self.solver == "qr":
+            stacked = np.vstack([np.asarray(self._summary, dtype=np.float64), a])
+            self._summary = np.linalg.qr(stacked, mode='r').tolist()
+        else:
+            chunk_gram = a.T @ a
+            gram = self._summary
+            for i in range(size):
+                for j in range(i, size):
+                    gram[i][j] += float(chunk_gram[i, j])
+
+    def _solve(self):
+        """Resolver el sistema con el resumen acumulado."""
+        p = self.n_features + 1  # incógnitas: intersección + pendientes
+        summary = self._summary
+
+        if self.solver == "qr":
+            # R_xx·β = R_xy (ya triangular)
+            upper = [row[:p] for row in summary[:p]]
+            rhs = [summary[i][p] for i in range(p)]
+        else:
+            # Ecuaciones normales: L·Lᵀ·β = Xᵀy
+            matrix = [[summary[min(i, j)][max(i, j)] for j in range(p)] for i in range(p)]
+            lower = _cholesky(matrix)
+            if lower is None:
+                # Variables colineales
+                self.is_fitted = False
+                return
+            rhs = [summary[i][p] for i in range(p)]
+            # Sustitución hacia delante: L·z = Xᵀy
+            z = [0.0] * p
+            for i in range(p):
+                z[i] = (rhs[i] - sum(lower[i][k] * z[k] for k in range(i))) / lower[i][i]
+            upper = [[lower[j][i] for j in range(p)] for i in range(p)]
+            rhs = z
+
+        scale = max(abs(upper[i][i]) for i in range(p))
+        if scale == 0 or any(abs(upper[i][i]) <= COLLINEAR_TOLERANCE * scale for i in range(p)):
+            # Variables colineales (o todavía sin datos suficientes)
+            self.is_fitted = False
+            return
+
+        # Sustitución hacia atrás
+        beta = [0.0] * p
+        for i in range(p - 1, -1, -1):
+            beta[i] = (rhs[i] - sum(upper[i][k] * beta[k] for k in range(i + 1, p))) / upper[i][i]
+
+        # Deshacer el desplazamiento de X e y
+        shift = self._shift
+        self.coefficients = beta[1:]
+        self.intercept = beta[0] + shift[-1] - sum(m * c for m, c in zip(self.coefficients, shift[:-1]))
+        self.is_fitted = True
+
+    def _log_result(self):
+        """Mostrar los coeficientes obtenidos."""
+        names = self.feature_names or [f"x{j + 1}" for j in range(self.n_features)]
+        logger.info("   Número de muestras: %d", self.n_samples)
+        for name, coefficient in zip(names, self.coefficients):
+            logger.info("   📈 %s: %.6f", name, coefficient)
+        logger.info("   📍 Intersección (b): %.4f", self.intercept)
+        logger.info("✅ Modelo entrenado exitosamente!")
+
+    def predict(self, X):
+        """
+        Realizar predicciones con el modelo entrenado.
+
+        Args:
+            X (list or array): Filas de variables independientes
+
+        Returns:
+            list: Predicciones (ndarray si X es un ndarray)
+        """
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        if len(X) == 0:
+            return []
+        rows, n_features = self._rows(X)
+        if n_features != self.n_features:
+            raise ValueError(f"Se esperaban {self.n_features} variables y hay {n_features}")
+
+        np = numpy_for(rows)
+        if np is not None:
+            predictions = np.asarray(rows, dtype=np.float64) @ np.asarray(self.coefficients) + self.intercept
+            return predictions if hasattr(X, 'ndim') else predictions.tolist()
+        return [self.intercept + sum(m * x_val for m, x_val in zip(self.coefficients, row)) for row in rows]
+
+    def evaluate(self, X, y):
+        """
+        Calcular MSE, RMSE, MAE y R² del modelo.
+
+        Returns:
+            dict: mse, rmse, mae y r2
+        """
+        return compute_all(y, self.predict(X))
+
+    def score(self, X, y):
+        """Calcular el coeficiente de determinación R²."""
+        return self.evaluate(X, y)["r2"]
+
+    def mse(self, X, y):
+        """Calcular el Error Cuadrático Medio."""
+        return self.evaluate(X, y)["mse"]
+
+    def _sums_of_squares(self):
+        """Devolver (SSE, SST) de los datos de entrenamiento a partir del resumen."""
+        if not self.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        p = self.n_features + 1
+        summary = self._summary
+        if self.solver == "qr":
+            # Las normas de columna se conservan: lo que no explica X queda en R_yy
+            sse = summary[p][p] ** 2
+            sst = sum(summary[k][p] ** 2 for k in range(1, p + 1))
+        else:
+            beta = [self.intercept + sum(m * c for m, c in zip(self.coefficients, self._shift[:-1])) - self._shift[-1]]
+            beta += self.coefficients
+            sse = summary[p][p] - sum(beta[i] * summary[i][p] for i in range(p))
+            sst = summary[p][p] - summary[0][p] ** 2 / summary[0][0]
+        return max(sse, 0.0), max(sst, 0.0)
+
+    def training_mse(self):
+        """Calcular el MSE de entrenamiento sin recorrer los datos."""
+        sse, _ = self._sums_of_squares()
+        return sse / self.n_samples
+
+    def training_score(self):
+        """Calcular el R² de entrenamiento sin recorrer los datos."""
+        sse, sst = self._sums_of_squares()
+        if sst == 0:
+            return 1.0
+        return 1 - sse / sst
+
+
+def _cholesky(matrix):
+    """
+    Factorizar una matriz simétrica definida positiva como L·Lᵀ.
+
+    Returns:
+        list or None: L (triangular inferior), o None si la matriz no es
+        definida positiva (variables colineales)
+    """
+    size = len(matrix)
+    lower = [[0.0] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(i + 1):
+            total = matrix[i][j] - sum(lower[i][k] * lower[j][k] for k in range(j))
+            if i == j:
+                if total <= COLLINEAR_TOLERANCE * matrix[i][i]:
+                    return None
+                lower[i][i] = math.sqrt(total)
+            else:
+                lower[i][j] = total / lower[j][j]
+    return lower
@@ -0,0 +1,217 @@
+"""
+Entrenamiento paralelo sobre archivos CSV grandes.
+
+El archivo se divide en rangos de bytes alineados a inicio de línea.
+Cada proceso lee y valida sólo su rango y devuelve los estadísticos
+suficientes (RegressionStats) de sus filas; el proceso principal los
+combina en un único LinearRegression, idéntico al ajuste en serie salvo
+por el redondeo en coma flotante. Si numpy está disponible, cada bloque
+leído se convierte de una vez con el motor rápido de data_utils.
+"""
+
+import os
+import logging
+
+try:
+    from ._backend import load_numpy
+    from .linear_regression import LinearRegression, RegressionStats
+    from .data_utils import (_parse_block_fast, _parse_block_strict, _report_bad_line, _report_format_errors,
+                             _report_no_data, _warn_extra_columns)
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy
+    from linear_regression import LinearRegression, RegressionStats
+    from data_utils import (_parse_block_fast, _parse_block_strict, _report_bad_line, _report_format_errors,
+                            _report_no_data, _warn_extra_columns)
+
+logger = logging.getLogger(__name__)
+
+# Tamaño de lectura de cada trabajador
+READ_BLOCK_BYTES = 8 * 1024 * 1024
+
+# No merece la pena lanzar un proceso para menos datos que esto
+MIN_RANGE_BYTES = 1024 * 1024
+
+# Errores de formato que cada trabajador devuelve como máximo para reportar
+MAX_REPORTED_ERRORS = 20
+
+
+def split_file_ranges(filepath, n_parts):
+    """
+    Dividir un CSV en rangos de bytes alineados a inicio de línea.
+
+    El primer rango empieza después de la cabecera.
+
+    Args:
+        filepath (str): Ruta al archivo CSV
+        n_parts (int): Número de rangos deseado
+
+    Returns:
+        list: Lista de tuplas (inicio, fin) en bytes, sin rangos vacíos
+    """
+    file_size = os.path.getsize(filepath)
+    with open(filepath, 'rb') as file:
+        # Saltar la primera línea (headers)
+        file.readline()
+        data_start = file.tell()
+
+        boundaries = [data_start]
+        step = (file_size - data_start) / max(n_parts, 1)
+        for k in range(1, n_parts):
+            target = data_start + int(step * k)
+            if target <= boundaries[-1]:
+                continue
+            # Avanzar hasta el inicio de la siguiente línea
+            file.seek(target - 1)
+            file.readline()
+            position = file.tell()
+            if position >= file_size:
+                break
+            if position > boundaries[-1]:
+                boundaries.append(position)
+        boundaries.append(file_size)
+
+    return [(boundaries[i], boundaries[i + 1]) for i in range(len(boundaries) - 1)
+            if boundaries[i + 1] > boundaries[i]]
+
+
+def _fit_byte_range(filepath, start, end):
+    """
+    Leer, validar y reducir un rango de bytes del CSV.
+
+    Se ejecuta en un proceso trabajador, por lo que no imprime nada: los
+    errores se devuelven con su número de línea relativo al rango para que
+    el proceso principal los reporte con la numeración global.
+
+    Returns:
+        dict: stats, lines, processed, skipped, errors y max_columns del rango
+    """
+    stats = RegressionStats()
+    lines = 0
+    processed = 0
+    skipped = 0
+    errors = []
+    max_columns = 0
+    pending = b''
+    np = load_numpy()
+
+    with open(filepath, 'rb') as file:
+        file.seek(start)
+        remaining = end - start
+        while True:
+            data = file.read(min(READ_BLOCK_BYTES, remaining))
+            remaining -= len(data)
+            if not data:
+                # Archivo truncado mientras se leía
+                remaining = 0
+            data = pending + data
+            if remaining > 0:
+                # Dejar la última línea incompleta para la siguiente lectura
+                cut = data.rfind(b'\n') + 1
+                pending = data[cut:]
+                data = data[:cut]
+            else:
+                pending = b''
+
+            # Sin líneas completas (línea más larga que el bloque o archivo
+            # truncado): no hay nada que contar todavía
+            if data:
+                # Bloques bien formados: conversión vectorizada; si no, línea a línea
+                parsed = _parse_block_fast(np, data) if np is not None else None
+                if parsed is not None:
+                    X_block, y_block, n_lines = parsed
+                else:
+                    result = _parse_block_strict(data)
+                    for local_line, error in result["errors"]:
+                        if len(errors) < MAX_REPORTED_ERRORS:
+                            errors.append((lines + local_line, error))
+                    X_block = result["X"]
+                    y_block = result["y"]
+                    n_lines = result["lines"]
+                    skipped += result["skipped"]
+                    max_columns = max(max_columns, result["max_columns"])
+                if len(X_block) > 0:
+                    max_columns = max(max_columns, 2)
+                lines += n_lines
+                processed += len(X_block)
+                stats.update(X_block, y_block)
+            if remaining <= 0:
+                break
+
+    return {
+        "stats": stats,
+        "lines": lines,
+        "processed": processed,
+        "skipped": skipped,
+        "errors": errors,
+        "max_columns": max_columns,
+    }
+
+
+def parallel_fit_csv(filepath, workers=None):
+    """
+    Entrenar un LinearRegression repartiendo el CSV entre varios procesos.
+
+    Args:
+        filepath (str): Ruta al archivo CSV
+        workers (int): Número de procesos (por defecto, todos los núcleos)
+
+    Returns:
+        LinearRegression: Modelo entrenado con todas las filas del archivo
+
+    Raises:
+        FileNotFoundError: Si el archivo no existe
+        ValueError: Si hay líneas con formato inválido (modo estricto) o no hay datos
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers debe ser al menos 1")
+
+    file_size = os.path.getsize(filepath)
+    n_parts = max(1, min(workers, file_size // MIN_RANGE_BYTES))
+    ranges = split_file_ranges(filepath, n_parts)
+
+    logger.info("⚡ Entrenamiento paralelo: %s rango(s) con %s proceso(s)...", len(ranges), workers)
+
+    if len(ranges) <= 1:
+        # Archivo pequeño: no compensa crear procesos
+        results = [_fit_byte_range(filepath, start, end) for start, end in ranges]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as executor:
+            futures = [executor.submit(_fit_byte_range, filepath, start, end) for start, end in ranges]
+            results = [future.result() for future in futures]
+
+    # Combinar en orden para poder reconstruir los números de línea globales
+    stats = RegressionStats()
+    first_line = 2
+    total_lines = 0
+    processed_lines = 0
+    skipped_lines = 0
+    max_columns = 0
+    for result in results:
+        for local_line, error in result["errors"]:
+            _report_bad_line(first_line + local_line - 1, error)
+        first_line += result["lines"]
+        total_lines += result["lines"]
+        processed_lines += result["processed"]
+        skipped_lines += result["skipped"]
+        max_columns = max(max_columns, result["max_columns"])
+        stats.merge(result["stats"])
+
+    if max_columns > 2:
+        _warn_extra_columns(max_columns)
+
+    if skipped_lines > 0:
+        _report_format_errors(skipped_lines, total_lines, processed_lines)
+        raise ValueError(f"Formato de datos inadecuado en {filepath}: {skipped_lines} línea(s) con errores")
+
+    if processed_lines == 0:
+        _report_no_data()
+        raise ValueError(f"No se encontraron datos válidos en {filepath}")
+
+    # Lanza ValueError si todos los X son iguales, igual que fit()
+    stats.coefficients()
+    model = LinearRegression().merge(stats)
+    logger.info("✅ Procesadas %s líneas en paralelo", processed_lines)
+    return model
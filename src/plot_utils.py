@@ -1,25 +1,168 @@
 """
 Funciones de visualización para regresión lineal.
+
+Con pocos puntos se dibujan todos; con muchos (más de MAX_SCATTER_POINTS)
+se dibuja la densidad en una rejilla 2D (numpy) o una muestra aleatoria
+de puntos, así que el tiempo de dibujo y el tamaño del PNG no dependen
+del número de filas. La recta se traza siempre desde sus dos extremos.
+Se dibuja con el backend Agg, sin ventanas ni estado global de pyplot.
 """
 
-import matplotlib.pyplot as plt
 import os
+import logging
+
+try:
+    from ._backend import load_numpy, numpy_for, as_float_array
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import load_numpy, numpy_for, as_float_array
+
+logger = logging.getLogger(__name__)
+
+PLOT_MODES = ("auto", "scatter", "density", "sample")
+# A partir de aquí "auto" deja de dibujar todos los puntos
+MAX_SCATTER_POINTS = 20000
+# Celdas por eje del modo densidad
+DENSITY_BINS = 200
+# Filas por bloque al acumular el histograma (memmaps enormes)
+DENSITY_BLOCK = 1 << 22
+
+def line_endpoints(X, y_pred):
+    """
+    Extremos de la recta: los puntos de X mínimo y máximo con su predicción.
+
+    Returns:
+        tuple: ((x_min, y_at_min), (x_max, y_at_max))
+    """
+    np = numpy_for(X, y_pred)
+    if np is not None:
+        X = as_float_array(np, X)
+        i_min, i_max = int(X.argmin()), int(X.argmax())
+    else:
+        i_min = i_max = 0
+        for i, x_val in enumerate(X):
+            if x_val < X[i_min]:
+                i_min = i
+            elif x_val > X[i_max]:
+                i_max = i
+    return (float(X[i_min]), float(y_pred[i_min])), (float(X[i_max]), float(y_pred[i_max]))
+
+def sample_points(X, y, max_points, seed=0):
+    """
+    Muestra aleatoria uniforme de como mucho max_points puntos.
+
+    Como X e y admiten acceso por índice, basta con sortear max_points
+    posiciones: el coste depende de max_points y no del número de filas.
+
+    Returns:
+        tuple: (X_sample, y_sample)
+    """
+    n = len(X)
+    if n <= max_points:
+        return X, y
+    np = numpy_for(X, y)
+    if np is not None:
+        indices = np.sort(np.random.default_rng(seed).choice(n, max_points, replace=False))
+        return as_float_array(np, X)[indices], as_float_array(np, y)[indices]
+    import random
+    indices = sorted(random.Random(seed).sample(range(n), max_points))
+    return [X[i] for i in indices], [y[i] for i in indices]
+
+def density_grid(np, X, y, bins=DENSITY_BINS):
+    """
+    Histograma 2D de los puntos, acumulado por bloques.
+
+    Las celdas son uniformes, así que el índice de cada punto se calcula
+    directamente y se cuenta con bincount (más rápido que histogram2d,
+    que busca cada valor en los bordes).
+
+    Returns:
+        tuple: (counts, x_edges, y_edges) como en numpy.histogram2d
+    """
+    X = as_float_array(np, X)
+    y = as_float_array(np, y)
+    x_edges = np.linspace(float(X.min()), float(X.max()), bins + 1)
+    y_edges = np.linspace(float(y.min()), float(y.max()), bins + 1)
+    x_scale = bins / ((x_edges[-1] - x_edges[0]) or 1.0)
+    y_scale = bins / ((y_edges[-1] - y_edges[0]) or 1.0)
+    counts = np.zeros(bins * bins, dtype=np.int64)
+    for start in range(0, len(X), DENSITY_BLOCK):
+        ix = ((X[start:start + DENSITY_BLOCK] - x_edges[0]) * x_scale).astype(np.intp)
+        iy = ((y[start:start + DENSITY_BLOCK] - y_edges[0]) * y_scale).astype(np.intp)
+        # El máximo cae justo en el borde derecho: va a la última celda
+        np.minimum(ix, bins - 1, out=ix)
+        np.minimum(iy, bins - 1, out=iy)
+        ix *= bins
+        ix += iy
+        counts += np.bincount(ix, minlength=bins * bins)
+    return counts.reshape(bins, bins), x_edges, y_edges
+
+def plot_dataset(dataset, y_pred, filename, **options):
+    """
+    plot_regression con las columnas de un Dataset.
+
+    Args:
+        dataset (Dataset): Datos reales
+        y_pred (list or array): Precios predichos
+        filename (str): Nombre del PNG dentro de graphics/
+        **options: mode, max_points y seed (ver plot_regression)
+    """
+    X, y = dataset.columns()
+    plot_regression(X, y, y_pred, filename, **options)
+
+def plot_regression(X, y, y_pred, filename, mode="auto", max_points=MAX_SCATTER_POINTS, seed=0):
+    """
+    Dibujar los datos y la recta de regresión en graphics/<filename>.
+
+    Args:
+        X (list or array): Kilometrajes
+        y (list or array): Precios reales
+        y_pred (list or array): Precios predichos
+        filename (str): Nombre del PNG dentro de graphics/
+        mode (str): "scatter" (todos los puntos), "density" (histograma 2D),
+            "sample" (max_points puntos al azar) o "auto"
+        max_points (int): Puntos como máximo en "auto" y "sample"
+        seed (int): Semilla de la muestra
+    """
+    if mode not in PLOT_MODES:
+        raise ValueError(f"mode debe ser uno de {PLOT_MODES}")
+    if mode == "auto":
+        mode = "scatter" if len(X) <= max_points else "density"
+    np = load_numpy()
+    if mode == "density" and np is None:
+        # El histograma 2D necesita numpy
+        mode = "sample"
+
+    # matplotlib tarda en importarse: sólo se carga cuando se dibuja
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    figure = Figure(figsize=(8, 5), facecolor="#e5d48f")  # Ajuste del color de fondo
+    FigureCanvasAgg(figure)
+    axes = figure.add_subplot()
+    axes.set_facecolor("#d3d3d395")  # Ajuste de color para la gráfica
+
+    if mode == "density":
+        counts, x_edges, y_edges = density_grid(np, X, y)
+        # Celdas vacías transparentes para que se vea el fondo
+        counts = np.ma.masked_equal(counts, 0)
+        mesh = axes.pcolormesh(x_edges, y_edges, counts.T, cmap="Greens")
+        figure.colorbar(mesh, ax=axes, label="Datos reales (puntos por celda)")
+    else:
+        if mode == "sample":
+            X_points, y_points = sample_points(X, y, max_points, seed)
+        else:
+            X_points, y_points = X, y
+        label = "Datos reales" if len(X_points) == len(X) else f"Datos reales (muestra de {len(X_points)})"
+        axes.scatter(X_points, y_points, color="#089232", label=label)
 
-def plot_regression(X, y, y_pred, filename):
- 
-    #plt.figure(figsize=(8, 5), facecolor="grey")
-    #plt.figure(figsize=(8, 5), facecolor=(0.5, 0.5, 0.5))   
-    plt.figure(figsize=(8, 5), facecolor=("#e5d48f"))  # Ajuste del color de fondo
-    plt.gca().set_facecolor("#d3d3d395")  # Ajuste de color para la gráfica
-
-    plt.scatter(X, y, color="#089232", label="Datos reales")
-    plt.plot(X, y_pred, color="#ff4c00", label="Recta de regresión")
-    plt.xlabel("Kms recorridos")
-    plt.ylabel("Precio (€)")
-    plt.title("Regresión Lineal en Precio de Vehículos")
-    plt.legend()
-    plt.tight_layout()
+    (x_min, y_min), (x_max, y_max) = line_endpoints(X, y_pred)
+    axes.plot([x_min, x_max], [y_min, y_max], color="#ff4c00", label="Recta de regresión")
+    axes.set_xlabel("Kms recorridos")
+    axes.set_ylabel("Precio (€)")
+    axes.set_title("Regresión Lineal en Precio de Vehículos")
+    axes.legend()
+    figure.tight_layout()
+    os.makedirs("graphics", exist_ok=True)
     output_path = os.path.join("graphics", filename)
-    plt.savefig(output_path)
-    plt.close()
-    print(f"✅ Gráfico guardado como {filename}")
+    figure.savefig(output_path)
+    logger.info("✅ Gráfico guardado como %s (modo %s)", filename, mode)
@@ -0,0 +1,384 @@
+"""
+Regresión lineal robusta frente a valores atípicos.
+
+Unos pocos anuncios con precios absurdos bastan para torcer la recta de
+mínimos cuadrados. Este módulo ofrece tres alternativas que se usan igual
+que LinearRegression (predict, mse, score, save...):
+
+    HuberRegression     mínimos cuadrados reponderados (IRLS) con la
+                        pérdida de Huber: los residuos grandes pesan
+                        linealmente en lugar de al cuadrado
+    RANSACRegression    rectas por pares de puntos al azar, con un número
+                        máximo de intentos; se queda con la que explica
+                        más puntos y la reajusta con sus inliers
+    TheilSenRegression  mediana de las pendientes entre pares de puntos:
+                        exacta (O(n²)) o aproximada con un número fijo de
+                        pares al azar, útil con 10⁶ filas o más
+
+Todos guardan training_time (segundos del ajuste) para comparar el
+coste con la precisión, y los estadísticos de los datos (stats), así que
+training_mse y training_score siguen funcionando.
+"""
+
+import abc
+import logging
+import random
+import statistics
+import time
+
+try:
+    from ._backend import numpy_for, as_float_array
+    from .linear_regression import BaseRegression, RegressionStats, _columns
+except ImportError:  # importado como módulo suelto (p. ej. desde los tests)
+    from _backend import numpy_for, as_float_array
+    from linear_regression import BaseRegression, RegressionStats, _columns
+
+logger = logging.getLogger(__name__)
+
+# Factor que convierte la MAD en una estimación de σ para ruido normal
+MAD_TO_SIGMA = 1.4826
+
+THEIL_SEN_METHODS = ("auto", "exact", "approximate")
+
+
+def _median(np, values):
+    """Mediana con numpy (selección O(n)) o con statistics."""
+    if np is not None:
+        return float(np.median(values))
+    return statistics.median(values)
+
+
+def _robust_scale(np, residuals):
+    """σ robusta de los residuos: MAD · 1.4826 (0 si la mayoría son exactos)."""
+    center = _median(np, residuals)
+    if np is not None:
+        return MAD_TO_SIGMA * float(np.median(np.abs(residuals - center)))
+    return MAD_TO_SIGMA * statistics.median(abs(r - center) for r in residuals)
+
+
+class _RobustRegression(BaseRegression):
+    """
+    Base común: validación, cronómetro y estadísticos de los datos.
+
+    No hay partial_fit ni merge: los estimadores robustos necesitan ver
+    todos los datos y dos ajustes no se combinan sumando estadísticos.
+
+    Attributes:
+        training_time (float): Segundos empleados en el último fit
+    """
+
+    def __init__(self):
+        """Inicializar el modelo sin entrenar."""
+        super().__init__()
+        self.training_time = None
+
+    def fit(self, X, y=None):
+        """
+        Entrenar el estimador robusto.
+
+        Args:
+            X (list, array or Dataset): Variables independientes (o un Dataset)
+            y (list or array): Variables dependientes (None con un Dataset)
+        """
+        X, y = _columns(X, y)
+        if len(X) != len(y):
+            raise ValueError("X e y deben tener la misma longitud")
+        if len(X) < 2:
+            raise ValueError("Se necesitan al menos 2 puntos de datos para entrenar")
+
+        logger.info("🔧 Entrenando %s con %d muestras...", type(self).__name__, len(X))
+        start_time = time.perf_counter()
+        # Los momentos sirven para training_mse/training_score y para descartar X constantes
+        stats = RegressionStats.from_data(X, y)
+        if stats.m2_x == 0:
+            raise ValueError("Todos los valores X son iguales. No se puede ajustar una línea.")
+
+        np = numpy_for(X, y)
+        if np is not None:
+            X = as_float_array(np, X)
+            y = as_float_array(np, y)
+        else:
+            X = list(X)
+            y = list(y)
+        slope, intercept = self._fit_line(np, X, y, stats)
+
+        self.slope = slope
+        self.intercept = intercept
+        self.stats = stats
+        self.is_fitted = True
+        self.training_time = time.perf_counter() - start_time
+        logger.info("   ⏱️  %s en %.3f s", type(self).__name__, self.training_time)
+        logger.info("   📝 Ecuación: y = %.4fx + %.4f", self.slope, self.intercept)
+
+    @abc.abstractmethod
+    def _fit_line(self, np, X, y, stats):
+        """Calcular (pendiente, intersección); lo implementa cada estimador."""
+
+
+class HuberRegression(_RobustRegression):
+    """
+    Regresión de Huber por mínimos cuadrados reponderados (IRLS).
+
+    Cada iteración calcula los residuos, su escala robusta (MAD) y unos
+    pesos w = min(1, epsilon·σ/|r|), y resuelve los mínimos cuadrados
+    ponderados en forma cerrada. Con numpy todo son operaciones
+    vectorizadas sobre los n residuos.
+
+    Attributes:
+        epsilon (float): Umbral de Huber en unidades de σ (1.35 ≈ 95% de eficiencia)
+        max_iterations (int): Máximo de reponderaciones
+        tolerance (float): Cambio relativo de los parámetros para parar
+        n_iterations (int): Reponderaciones realizadas
+        converged (bool): Si se alcanzó tolerance
+        scale (float): σ robusta de los residuos finales
+        n_outliers (int): Puntos con peso menor que 1 en la última iteración
+    """
+
+    def __init__(self, epsilon=1.35, max_iterations=100, tolerance=1e-8):
+        """Inicializar el modelo con sus hiperparámetros."""
+        super().__init__()
+        if epsilon <= 0:
+            raise ValueError("epsilon debe ser positivo")
+        self.epsilon = epsilon
+        self.max_iterations = max_iterations
+        self.tolerance = tolerance
+        self.n_iterations = 0
+        self.converged = False
+        self.scale = None
+        self.n_outliers = None
+
+    def _fit_line(self, np, X, y, stats):
+        # Punto de partida: mínimos cuadrados
+        slope, intercept = stats.coefficients()
+        self.converged = False
+        self.n_iterations = 0
+        for _ in range(self.max_iterations):
+            self.n_iterations += 1
+            if np is not None:
+                residuals = y - (X * slope + intercept)
+                scale = _robust_scale(np, residuals)
+                if scale == 0:
+                    # La mayoría de puntos ya están sobre la recta
+                    self.converged = True
+                    break
+                threshold = self.epsilon * scale
+                weights = np.abs(residuals)
+                outliers = weights > threshold
+                # w = 1 dentro del umbral y threshold/|r| fuera
+                np.divide(threshold, weights, out=weights, where=outliers)
+                weights[~outliers] = 1.0
+                new_slope, new_intercept = self._weighted_line_numpy(np, X, y, weights)
+                self.n_outliers = int(outliers.sum())
+            else:
+                residuals = [y_val - (slope * x_val + intercept) for x_val, y_val in zip(X, y)]
+                scale = _robust_scale(None, residuals)
+                if scale == 0:
+                    self.converged = True
+                    break
+                threshold = self.epsilon * scale
+                weights = [1.0 if abs(r) <= threshold else threshold / abs(r) for r in residuals]
+                new_slope, new_intercept = self._weighted_line(X, y, weights)
+                self.n_outliers = sum(1 for w in weights if w < 1.0)
+
+            change = abs(new_slope - slope) + abs(new_intercept - intercept)
+            slope, intercept = new_slope, new_intercept
+            self.scale = scale
+            if change <= self.tolerance * (abs(slope) + abs(intercept) + self.tolerance):
+                self.converged = True
+                break
+        else:
+            logger.warning("⚠️  Huber sin convergencia tras %d iteraciones", self.n_iterations)
+        logger.info("   🔁 %d iteraciones IRLS, %s puntos atenuados", self.n_iterations, self.n_outliers)
+        return slope, intercept
+
+    @staticmethod
+    def _weighted_line_numpy(np, X, y, weights):
+        """Recta de mínimos cuadrados ponderados (vectorizada)."""
+        total = float(weights.sum())
+        mean_x = float(np.dot(weights, X)) / total
+        mean_y = float(np.dot(weights, y)) / total
+        xc = X - mean_x
+        wxc = weights * xc
+        slope = float(np.dot(wxc, y - mean_y)) / float(np.dot(wxc, xc))
+        return slope, mean_y - slope * mean_x
+
+    @staticmethod
+    def _weighted_line(X, y, weights):
+        """Recta de mínimos cuadrados ponderados (Python puro)."""
+        total = sum(weights)
+        mean_x = sum(w * x_val for w, x_val in zip(weights, X)) / total
+        mean_y = sum(w * y_val for w, y_val in zip(weights, y)) / total
+        sxx = 0.0
+        sxy = 0.0
+        for w, x_val, y_val in zip(weights, X, y):
+            dx = x_val - mean_x
+            sxx += w * dx * dx
+            sxy += w * dx * (y_val - mean_y)
+        slope = sxy / sxx
+        return slope, mean_y - slope * mean_x
+
+
+class RANSACRegression(_RobustRegression):
+    """
+    RANSAC: consenso de rectas trazadas por pares de puntos al azar.
+
+    Cada intento traza la recta por dos puntos y cuenta los inliers
+    (|residuo| ≤ residual_threshold). El número de intentos está acotado
+    por max_trials y se reduce en cuanto la mejor recta tiene suficientes
+    inliers para que, con probabilidad stop_probability, algún intento ya
+    haya elegido dos inliers. La recta final son los mínimos cuadrados de
+    los inliers de la mejor.
+
+    Attributes:
+        residual_threshold (float): Residuo máximo de un inlier (por
+            defecto, la MAD de y)
+        max_trials (int): Intentos como máximo
+        stop_probability (float): Confianza para parar antes
+        seed (int): Semilla de los pares
+        n_trials (int): Intentos realizados
+        n_inliers (int): Inliers de la recta final
+        inlier_mask (list or array): True para cada inlier
+    """
+
+    def __init__(self, residual_threshold=None, max_trials=100, stop_probability=0.99, seed=None):
+        """Inicializar el modelo con sus hiperparámetros."""
+        super().__init__()
+        if max_trials < 1:
+            raise ValueError("max_trials debe ser al menos 1")
+        if not 0 < stop_probability < 1:
+            raise ValueError("stop_probability debe estar entre 0 y 1")
+        self.residual_threshold = residual_threshold
+        self.max_trials = max_trials
+        self.stop_probability = stop_probability
+        self.seed = seed
+        self.n_trials = 0
+        self.n_inliers = None
+        self.inlier_mask = None
+
+    def _fit_line(self, np, X, y, stats):
+        import math
+
+        n = len(X)
+        threshold = self.residual_threshold
+        if threshold is None:
+            threshold = _robust_scale(np, y) / MAD_TO_SIGMA
+        rng = random.Random(self.seed)
+
+        best_count = -1
+        best_mask = None
+        needed = self.max_trials
+        self.n_trials = 0
+        while self.n_trials < min(self.max_trials, needed):
+            self.n_trials += 1
+            i, j = rng.sample(range(n), 2)
+            if X[i] == X[j]:
+                continue
+            slope = (y[j] - y[i]) / (X[j] - X[i])
+            intercept = y[i] - slope * X[i]
+            if np is not None:
+                mask = np.abs(y - (X * slope + intercept)) <= threshold
+                count = int(mask.sum())
+            else:
+                mask = [abs(y_val - (slope * x_val + intercept)) <= threshold for x_val, y_val in zip(X, y)]
+                count = sum(mask)
+            if count > best_count:
+                best_count = count
+                best_mask = mask
+                # Intentos necesarios para elegir dos inliers con la confianza pedida
+                ratio = count / n
+                if ratio >= 1:
+                    needed = 0
+                elif ratio > 0:
+                    needed = math.ceil(math.log(1 - self.stop_probability) / math.log(1 - ratio * ratio))
+
+        if best_count < 2:
+            raise ValueError("RANSAC no encontró ninguna recta con al menos 2 inliers")
+        if np is not None:
+            inliers = RegressionStats.from_data(X[best_mask], y[best_mask])
+        else:
+            inliers = RegressionStats.from_data([x_val for x_val, keep in zip(X, best_mask) if keep],
+                                                [y_val for y_val, keep in zip(y, best_mask) if keep])
+        if inliers.m2_x == 0:
+            raise ValueError("Los inliers de RANSAC tienen todos el mismo X")
+        self.n_inliers = best_count
+        self.inlier_mask = best_mask
+        logger.info("   🎯 %d intentos, %d inliers de %d", self.n_trials, best_count, n)
+        return inliers.coefficients()
+
+
+class TheilSenRegression(_RobustRegression):
+    """
+    Estimador de Theil-Sen: mediana de las pendientes entre pares.
+
+    El método exacto usa los n·(n-1)/2 pares, O(n²) en tiempo y memoria.
+    El aproximado usa n_pairs pares elegidos al azar: la mediana de esa
+    muestra converge a la exacta con error O(1/√n_pairs) y el coste no
+    depende de n. La intersección es la mediana de y - m·x (en el modo
+    aproximado, sobre n_pairs puntos al azar).
+
+    Attributes:
+        method (str): "exact", "approximate" o "auto" (exacto si hay como
+            mucho n_pairs pares)
+        n_pairs (int): Pares del modo aproximado
+        seed (int): Semilla del muestreo
+        method_used (str): Método aplicado en el último fit
+        n_slopes (int): Pendientes de las que se tomó la mediana
+    """
+
+    def __init__(self, method="auto", n_pairs=200000, seed=None):
+        """Inicializar el modelo con sus hiperparámetros."""
+        super().__init__()
+        if method not in THEIL_SEN_METHODS:
+            raise ValueError(f"method debe ser uno de {THEIL_SEN_METHODS}")
+        if n_pairs < 1:
+            raise ValueError("n_pairs debe ser al menos 1")
+        self.method = method
+        self.n_pairs = n_pairs
+        self.seed = seed
+        self.method_used = None
+        self.n_slopes = None
+
+    def _fit_line(self, np, X, y, stats):
+        n = len(X)
+        method = self.method
+        if method == "auto":
+            method = "exact" if n * (n - 1) // 2 <= self.n_pairs else "approximate"
+        self.method_used = method
+
+        if np is not None:
+            if method == "exact":
+                i, j = np.triu_indices(n, k=1)
+            else:
+                rng = np.random.default_rng(self.seed)
+                i = rng.integers(0, n, self.n_pairs)
+                j = rng.integers(0, n, self.n_pairs)
+            dx = X[j] - X[i]
+            valid = dx != 0
+            slopes = (y[j] - y[i])[valid] / dx[valid]
+            if len(slopes) == 0:
+                raise ValueError("No hay pares con X distintos")
+            slope = float(np.median(slopes))
+            if method == "exact" or n <= self.n_pairs:
+                intercept = float(np.median(y - slope * X))
+            else:
+                sample = rng.integers(0, n, self.n_pairs)
+                intercept = float(np.median(y[sample] - slope * X[sample]))
+        else:
+            rng = random.Random(self.seed)
+            if method == "exact":
+                pairs = ((i, j) for i in range(n) for j in range(i + 1, n))
+            else:
+                pairs = ((rng.randrange(n), rng.randrange(n)) for _ in range(self.n_pairs))
+            slopes = [(y[j] - y[i]) / (X[j] - X[i]) for i, j in pairs if X[j] != X[i]]
+            if not slopes:
+                raise ValueError("No hay pares con X distintos")
+            slope = statistics.median(slopes)
+            if method == "exact" or n <= self.n_pairs:
+                intercept = statistics.median(y_val - slope * x_val for x_val, y_val in zip(X, y))
+            else:
+                sample = [rng.randrange(n) for _ in range(self.n_pairs)]
+                intercept = statistics.median(y[k] - slope * X[k] for k in sample)
+
+        self.n_slopes = len(slopes)
+        logger.info("   📐 Theil-Sen %s: mediana de %d pendientes", method, self.n_slopes)
+        return slope, intercept
@@ -0,0 +1,360 @@
+"""
+Servicio HTTP de predicción con micro-lotes.
+
+Servidor asyncio sin dependencias externas que carga un LinearRegression
+entrenado y responde consultas kilometraje → precio:
+
+    GET  /predict?km=150000            → {"km": 150000.0, "price": ...}
+    POST /predict  {"km": [1, 2, ...]} → {"km": [...], "price": [...]}
+    GET  /metrics                      → peticiones, QPS y latencias p50/p99
+    GET  /health                       → {"status": "ok"}
+
+Las consultas que llegan a la vez se agrupan en micro-lotes (MicroBatcher):
+se espera como mucho max_delay a que lleguen más, y todas se resuelven con
+una única llamada vectorizada a predict.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import time
+from collections import deque
+from urllib.parse import urlsplit, parse_qs
+
+logger = logging.getLogger(__name__)
+
+# Latencias guardadas para calcular los percentiles
+LATENCY_WINDOW = 10000
+# Ventana (segundos) del QPS reciente
+QPS_WINDOW = 10.0
+# Tamaño máximo de una petición
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class ServingMetrics:
+    """
+    Contadores del servicio: peticiones, micro-lotes y latencias.
+
+    Attributes:
+        requests (int): Peticiones de predicción atendidas
+        errors (int): Peticiones rechazadas
+        batches (int): Llamadas a predict
+        predictions (int): Valores predichos
+        started (float): Instante de arranque (time.monotonic)
+    """
+
+    def __init__(self):
+        """Inicializar los contadores."""
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.predictions = 0
+        self.started = time.monotonic()
+        # (instante, latencia en segundos) de las últimas peticiones
+        self._recent = deque(maxlen=LATENCY_WINDOW)
+
+    def record_request(self, latency):
+        """Anotar una petición atendida y su latencia."""
+        self.requests += 1
+        self._recent.append((time.monotonic(), latency))
+
+    def record_batch(self, size):
+        """Anotar un micro-lote de size valores."""
+        self.batches += 1
+        self.predictions += size
+
+    def snapshot(self):
+        """
+        Resumen de los contadores.
+
+        Returns:
+            dict: requests, errors, batches, mean_batch_size, qps, qps_recent,
+                p50_ms, p99_ms y uptime_s
+        """
+        now = time.monotonic()
+        uptime = now - self.started
+        latencies = sorted(latency for _, latency in self._recent)
+        window = min(QPS_WINDOW, uptime)
+        if len(self._recent) == self._recent.maxlen:
+            # Con la ventana de latencias llena sólo se conocen las últimas peticiones
+            window = min(window, now - self._recent[0][0])
+        recent = sum(1 for stamp, _ in self._recent if now - stamp <= window)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": self.predictions / self.batches if self.batches else 0.0,
+            "qps": self.requests / uptime if uptime > 0 else 0.0,
+            "qps_recent": recent / window if window > 0 else 0.0,
+            "p50_ms": _percentile(latencies, 0.50) * 1000,
+            "p99_ms": _percentile(latencies, 0.99) * 1000,
+            "uptime_s": uptime,
+        }
+
+
+def _percentile(ordered, q):
+    """Percentil (vecino más cercano) de una lista ordenada; 0 si está vacía."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class MicroBatcher:
+    """
+    Agrupa las consultas concurrentes en una sola llamada a predict.
+
+    Attributes:
+        model (LinearRegression): Modelo entrenado
+        max_batch_size (int): Valores máximos por llamada a predict
+        max_delay (float): Segundos que se espera a completar un lote
+        metrics (ServingMetrics): Contadores del servicio
+    """
+
+    def __init__(self, model, max_batch_size=1024, max_delay=0.002, metrics=None):
+        """Preparar la cola; el bucle empieza con start()."""
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.metrics = metrics if metrics is not None else ServingMetrics()
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        """Lanzar el bucle de micro-lotes en el event loop actual."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Detener el bucle de micro-lotes."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def predict(self, values):
+        """
+        Encolar unos kilometrajes y esperar sus predicciones.
+
+        Args:
+            values (list): Kilometrajes
+
+        Returns:
+            list: Precios predichos
+        """
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((values, future))
+        return await future
+
+    async def _run(self):
+        """Recoger peticiones, predecir en bloque y repartir los resultados."""
+        loop = asyncio.get_running_loop()
+        while True:
+            pending = [await self._queue.get()]
+            size = len(pending[0][0])
+            deadline = loop.time() + self.max_delay
+            while size < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                pending.append(item)
+                size += len(item[0])
+
+            values = [value for item_values, _ in pending for value in item_values]
+            try:
+                predictions = self.model.predict(values)
+                if not isinstance(predictions, list):
+                    predictions = predictions.tolist()
+            except Exception as e:
+                for _, future in pending:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.metrics.record_batch(len(values))
+
+            start = 0
+            for item_values, future in pending:
+                end = start + len(item_values)
+                if not future.done():
+                    future.set_result(predictions[start:end])
+                start = end
+
+
+class PredictionServer:
+    """
+    Servidor HTTP/1.1 mínimo (con keep-alive) sobre asyncio.
+
+    Attributes:
+        model (LinearRegression): Modelo entrenado
+        batcher (MicroBatcher): Agrupador de consultas
+        metrics (ServingMetrics): Contadores del servicio
+    """
+
+    def __init__(self, model, max_batch_size=1024, max_delay=0.002):
+        """Preparar el servidor para un modelo entrenado."""
+        if not model.is_fitted:
+            raise ValueError("El modelo debe ser entrenado primero")
+        self.model = model
+        self.metrics = ServingMetrics()
+        self.batcher = MicroBatcher(model, max_batch_size, max_delay, self.metrics)
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=8000):
+        """
+        Empezar a escuchar.
+
+        Returns:
+            int: Puerto en el que escucha (útil con port=0)
+        """
+        self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        port = self._server.sockets[0].getsockname()[1]
+        logger.info("🚀 Sirviendo predicciones en http://%s:%d", host, port)
+        return port
+
+    async def stop(self):
+        """Cerrar el servidor y el bucle de micro-lotes."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self, host="127.0.0.1", port=8000):
+        """Arrancar y atender peticiones hasta que se cancele."""
+        await self.start(host, port)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+
+    async def _handle_connection(self, reader, writer):
+        """Atender las peticiones de una conexión (keep-alive)."""
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, 400, {"error": "petición mal formada"}, False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", "0") or 0)
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    await self._respond(writer, 400, {"error": "Content-Length inválido"}, False)
+                    break
+                if length > MAX_BODY_BYTES:
+                    await self._respond(writer, 413, {"error": "petición demasiado grande"}, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+                status, payload = await self._dispatch(method, target, body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method, target, body):
+        """Resolver una petición y devolver (código HTTP, contenido JSON)."""
+        url = urlsplit(target)
+        if url.path == "/predict":
+            start = time.perf_counter()
+            try:
+                values, single = _parse_predict_request(method, url.query, body)
+            except ValueError as e:
+                self.metrics.errors += 1
+                return 400, {"error": str(e)}
+            try:
+                prices = await self.batcher.predict(values)
+            except Exception as e:
+                # Cualquier fallo del lote es un 500, no una conexión cortada
+                logger.exception("❌ Error al predecir un lote")
+                self.metrics.errors += 1
+                return 500, {"error": str(e) or type(e).__name__}
+            if not all(math.isfinite(price) for price in prices):
+                # JSON no admite NaN ni Infinity
+                self.metrics.errors += 1
+                return 400, {"error": "km fuera de rango: la predicción no es finita"}
+            self.metrics.record_request(time.perf_counter() - start)
+            if single:
+                return 200, {"km": values[0], "price": prices[0]}
+            return 200, {"km": values, "price": prices}
+        if url.path == "/metrics" and method == "GET":
+            return 200, self.metrics.snapshot()
+        if url.path == "/health" and method == "GET":
+            return 200, {"status": "ok"}
+        return 404, {"error": "ruta no encontrada"}
+
+    @staticmethod
+    async def _respond(writer, status, payload, keep_alive):
+        """Enviar una respuesta JSON."""
+        reasons = {200: "OK", 400: "Bad Request", 404: "Not Found", 413: "Payload Too Large",
+                   500: "Internal Server Error"}
+        body = json.dumps(payload).encode("utf-8")
+        head = (f"HTTP/1.1 {status} {reasons.get(status, 'OK')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode("latin-1") + body)
+        await writer.drain()
+
+
+def _parse_predict_request(method, query, body):
+    """
+    Extraer los kilometrajes de una petición /predict.
+
+    Returns:
+        tuple: (lista de kilometrajes, True si era un único valor)
+    """
+    if method == "GET":
+        raw = parse_qs(query).get("km")
+        if not raw:
+            raise ValueError("falta el parámetro km")
+        values = raw
+    elif method == "POST":
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise ValueError("el cuerpo debe ser JSON")
+        values = data.get("km") if isinstance(data, dict) else None
+        if values is None:
+            raise ValueError("falta el campo km")
+    else:
+        raise ValueError(f"método no soportado: {method}")
+
+    single = not isinstance(values, list)
+    if single:
+        values = [values]
+    if not values:
+        raise ValueError("km está vacío")
+    try:
+        values = [float(value) for value in values]
+    except (TypeError, ValueError):
+        raise ValueError("km debe ser numérico")
+    if not all(math.isfinite(value) for value in values):
+        raise ValueError("km debe ser un número finito")
+    return values, single or (method == "GET" and len(values) == 1)
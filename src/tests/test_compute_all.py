@@ -0,0 +1,67 @@
+"""
+Tests automáticos para el cálculo conjunto de métricas.
+"""
+
+import sys
+import os
+import unittest
+from array import array
+# Ajustar sys.path para importar desde src correctamente
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.abspath(os.path.join(current_dir, '..'))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+from metrics import (compute_all, MetricsAccumulator, mean_squared_error,
+                     root_mean_squared_error, mean_absolute_error, r_squared)
+
+class TestComputeAll(unittest.TestCase):
+    def setUp(self):
+        self.y_true = [2.0, 4.0, 6.0, 8.0, 11.0, 3.5]
+        self.y_pred = [1.0, 5.0, 7.0, 10.0, 10.5, 3.0]
+
+    def test_matches_individual_metrics(self):
+        result = compute_all(self.y_true, self.y_pred)
+        self.assertAlmostEqual(result["mse"], mean_squared_error(self.y_true, self.y_pred))
+        self.assertAlmostEqual(result["rmse"], root_mean_squared_error(self.y_true, self.y_pred))
+        self.assertAlmostEqual(result["mae"], mean_absolute_error(self.y_true, self.y_pred))
+        self.assertAlmostEqual(result["r2"], r_squared(self.y_true, self.y_pred))
+
+    def test_buffers_without_lists(self):
+        expected = compute_all(self.y_true, self.y_pred)
+        y_true = array('d', self.y_true)
+        y_pred = memoryview(array('d', self.y_pred))
+        result = compute_all(y_true, y_pred)
+        for name in expected:
+            self.assertAlmostEqual(result[name], expected[name])
+
+    def test_accumulator_by_chunks(self):
+        expected = compute_all(self.y_true, self.y_pred)
+        left = MetricsAccumulator().update(self.y_true[:2], self.y_pred[:2])
+        right = MetricsAccumulator().update(self.y_true[2:], self.y_pred[2:])
+        result = left.merge(right).result()
+        for name in expected:
+            self.assertAlmostEqual(result[name], expected[name])
+
+    def test_numpy_matches_pure_python(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy no está instalado")
+        import _backend
+        y_true = np.linspace(0.0, 100.0, 200001)
+        y_pred = y_true + np.sin(y_true)
+        result = compute_all(y_true, y_pred)
+        _backend.USE_NUMPY = False
+        try:
+            expected = compute_all(y_true.tolist(), y_pred.tolist())
+        finally:
+            _backend.USE_NUMPY = True
+        for name in expected:
+            self.assertAlmostEqual(result[name], expected[name])
+
+    def test_empty_raises(self):
+        with self.assertRaises(ValueError):
+            compute_all([], [])
+
+if __name__ == "__main__":
+    unittest.main()
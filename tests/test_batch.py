@@ -0,0 +1,54 @@
+import json
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from batch import expand_inputs, fit_many, write_summary
+
+
+def write_segment(path, slope, intercept, n=50):
+    rows = [f"{i * 1000},{slope * i * 1000 + intercept + (i % 5)}" for i in range(n)]
+    path.write_text("km,price\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+
+class TestBatch:
+    def test_expand_directory_and_glob(self, tmp_path):
+        a = write_segment(tmp_path / "a.csv", -0.01, 9000)
+        b = write_segment(tmp_path / "b.csv", -0.02, 8000)
+        (tmp_path / "notes.txt").write_text("x")
+        assert expand_inputs(str(tmp_path)) == [a, b]
+        assert expand_inputs([str(tmp_path / "b*.csv"), a, b]) == [b, a]
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_one_model_per_file(self, tmp_path, workers):
+        write_segment(tmp_path / "a.csv", -0.01, 9000)
+        write_segment(tmp_path / "b.csv", -0.02, 8000)
+        (tmp_path / "c.csv").write_text("km,price\n1,abc\n")
+        results, elapsed = fit_many(str(tmp_path), workers=workers)
+        assert [os.path.basename(r["file"]) for r in results] == ["a.csv", "b.csv", "c.csv"]
+        assert results[0]["slope"] == pytest.approx(-0.01, abs=1e-4)
+        assert results[1]["n_samples"] == 50
+        assert results[1]["error"] is None
+        assert results[2]["error"] is not None and results[2]["slope"] is None
+        assert elapsed >= 0 and all(r["seconds"] >= 0 for r in results)
+
+    def test_summary_formats(self, tmp_path):
+        write_segment(tmp_path / "a.csv", -0.01, 9000)
+        results, _ = fit_many(str(tmp_path / "*.csv"), workers=1)
+        write_summary(results, str(tmp_path / "summary.json"))
+        assert json.loads((tmp_path / "summary.json").read_text())[0]["n_samples"] == 50
+        write_summary(results, str(tmp_path / "summary.csv"))
+        lines = (tmp_path / "summary.csv").read_text().splitlines()
+        assert lines[0] == "file,n_samples,slope,intercept,mse,r2,seconds,error"
+        assert len(lines) == 2
+
+    def test_no_files(self, tmp_path):
+        with pytest.raises(ValueError):
+            fit_many(str(tmp_path / "*.csv"))
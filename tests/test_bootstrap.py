@@ -0,0 +1,81 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import _backend
+import bootstrap
+from bootstrap import bootstrap_coefficients, bootstrap_chunks
+from linear_regression import LinearRegression
+
+X = [float(i * 2500 + (i % 7) * 300) for i in range(400)]
+y = [9000.0 - 0.02 * x + ((i * 37) % 101 - 50) * 6 for i, x in enumerate(X)]
+
+
+def standard_error(X, y):
+    """Error típico de la pendiente por mínimos cuadrados."""
+    model = LinearRegression()
+    model.fit(X, y)
+    sse = model.training_mse() * len(X)
+    mean_x = sum(X) / len(X)
+    return (sse / (len(X) - 2) / sum((x - mean_x) ** 2 for x in X)) ** 0.5
+
+
+class TestBootstrap:
+    @pytest.mark.parametrize("method", ["index", "poisson"])
+    def test_interval_covers_estimate(self, method):
+        result = bootstrap_coefficients(X, y, n_resamples=800, method=method, seed=1, workers=1)
+        model = LinearRegression()
+        model.fit(X, y)
+        assert result.slope == pytest.approx(model.slope)
+        assert result.slope_interval[0] < model.slope < result.slope_interval[1]
+        assert result.intercept_interval[0] < model.intercept < result.intercept_interval[1]
+        # Un IC del 95% mide unos 2·1.96 errores típicos
+        width = result.slope_interval[1] - result.slope_interval[0]
+        assert width == pytest.approx(3.92 * standard_error(X, y), rel=0.25)
+        assert result.elapsed > 0
+        assert "IC 95%" in result.summary()
+
+    def test_seed_is_reproducible(self):
+        a = bootstrap_coefficients(X, y, n_resamples=200, seed=3, workers=1)
+        b = bootstrap_coefficients(X, y, n_resamples=200, seed=3, workers=1)
+        assert a.slope_interval == b.slope_interval
+
+    def test_exact_line_has_no_uncertainty(self):
+        exact = [9000.0 - 0.02 * x for x in X]
+        result = bootstrap_coefficients(X, exact, n_resamples=100, seed=0, workers=1)
+        assert result.slope_interval[0] == pytest.approx(-0.02)
+        assert result.slope_interval[1] == pytest.approx(-0.02)
+
+    def test_pure_python_path(self, monkeypatch):
+        monkeypatch.setattr(_backend, "USE_NUMPY", False)
+        for method in ("index", "poisson"):
+            result = bootstrap_coefficients(X, y, n_resamples=200, method=method, seed=2)
+            assert result.slope_interval[0] < result.slope < result.slope_interval[1]
+
+    def test_streaming_poisson(self):
+        pytest.importorskip("numpy")
+        chunks = [(X[i:i + 64], y[i:i + 64]) for i in range(0, len(X), 64)]
+        result = bootstrap_chunks(chunks, n_resamples=800, seed=4)
+        full = bootstrap_coefficients(X, y, n_resamples=800, method="poisson", seed=5, workers=1)
+        assert result.slope == pytest.approx(full.slope)
+        assert result.slope_interval[0] == pytest.approx(full.slope_interval[0], rel=0.2)
+        assert result.slope_interval[1] == pytest.approx(full.slope_interval[1], rel=0.2)
+
+    def test_process_pool(self, monkeypatch):
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(bootstrap, "MIN_PARALLEL_WORK", 1)
+        result = bootstrap_coefficients(X, y, n_resamples=300, seed=6, workers=2)
+        assert result.n_resamples == 300
+        assert result.slope_interval[0] < result.slope < result.slope_interval[1]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            bootstrap_coefficients(X, y, method="jackknife")
+        with pytest.raises(ValueError):
+            bootstrap_coefficients(X, y, confidence=1.5)
@@ -0,0 +1,322 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from data_utils import load_csv_data, iter_csv_chunks
+
+
+def write_csv(path, rows, header="km,price"):
+    path.write_text(header + "\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+
+class TestCsvChunks:
+    def test_chunks_match_full_load(self, tmp_path):
+        csv_file = write_csv(tmp_path / "data.csv", [f"{i},{2 * i + 1}" for i in range(25)])
+        X, y = load_csv_data(csv_file)
+        chunks = list(iter_csv_chunks(csv_file, chunk_size=10))
+        assert [len(X_chunk) for X_chunk, _ in chunks] == [10, 10, 5]
+        assert [v for X_chunk, _ in chunks for v in X_chunk] == X
+        assert [v for _, y_chunk in chunks for v in y_chunk] == y
+
+    def test_bad_line_raises(self, tmp_path, caplog):
+        csv_file = write_csv(tmp_path / "bad.csv", ["1,2", "3,abc", "5,6"])
+        with pytest.raises(ValueError):
+            list(iter_csv_chunks(csv_file, chunk_size=2))
+        assert "Línea 3" in caplog.text
+
+    @pytest.mark.parametrize("engine", ["python", "fast"])
+    def test_no_chunks_after_bad_line(self, tmp_path, caplog, monkeypatch, engine):
+        if engine == "fast":
+            pytest.importorskip("numpy")
+            import data_utils
+            monkeypatch.setattr(data_utils, "FAST_BLOCK_BYTES", 8)
+        rows = [f"{i},{i}" for i in range(10)]
+        rows[5] = "5,abc"
+        rows[8] = "8,"
+        csv_file = write_csv(tmp_path / "bad.csv", rows)
+        seen = []
+        with pytest.raises(ValueError):
+            for X_chunk, _ in iter_csv_chunks(csv_file, chunk_size=2, engine=engine):
+                seen.extend(X_chunk)
+        # Sólo filas anteriores a la primera línea inválida; el resto de errores se reporta igual
+        assert seen == [float(i) for i in range(len(seen))]
+        assert len(seen) <= 5
+        assert "Línea 7" in caplog.text and "Línea 10" in caplog.text
+
+    def test_empty_file_raises(self, tmp_path):
+        csv_file = write_csv(tmp_path / "empty.csv", [])
+        with pytest.raises(ValueError):
+            list(iter_csv_chunks(csv_file))
+
+
+class TestFastEngine:
+    def test_matches_python_engine(self, tmp_path):
+        pytest.importorskip("numpy")
+        rows = [f"{i * 1234.5}, {9000 - i * 0.75}" for i in range(3000)]
+        csv_file = write_csv(tmp_path / "data.csv", rows)
+        X, y = load_csv_data(csv_file)
+        X_fast, y_fast = load_csv_data(csv_file, engine="fast")
+        assert list(X_fast) == X
+        assert list(y_fast) == y
+        chunks = list(iter_csv_chunks(csv_file, chunk_size=1000, engine="fast"))
+        assert [len(X_chunk) for X_chunk, _ in chunks] == [1000, 1000, 1000]
+        assert [v for X_chunk, _ in chunks for v in X_chunk] == X
+
+    def test_irregular_blocks_fall_back(self, tmp_path, caplog, monkeypatch):
+        pytest.importorskip("numpy")
+        import data_utils
+        monkeypatch.setattr(data_utils, "FAST_BLOCK_BYTES", 16)
+        path = tmp_path / "mixed.csv"
+        path.write_bytes(b"km,price\r\n1,2\r\n\r\n3,4,5\r\n6,7\r\n8,9")
+        X, y = load_csv_data(str(path), engine="fast")
+        assert list(X) == [1.0, 3.0, 6.0, 8.0]
+        assert list(y) == [2.0, 4.0, 7.0, 9.0]
+        assert "3 columnas" in caplog.text
+
+    def test_bad_lines_keep_line_numbers(self, tmp_path, caplog, monkeypatch):
+        pytest.importorskip("numpy")
+        import data_utils
+        monkeypatch.setattr(data_utils, "FAST_BLOCK_BYTES", 20)
+        rows = [f"{i},{i}" for i in range(20)]
+        rows[13] = "13,abc"
+        csv_file = write_csv(tmp_path / "bad.csv", rows)
+        assert load_csv_data(csv_file, engine="fast") == ([], [])
+        assert "Línea 15" in caplog.text
+        with pytest.raises(ValueError):
+            list(iter_csv_chunks(csv_file, engine="fast"))
+
+    @pytest.mark.parametrize("line", [b" ,1", b"1, ", b" , ", b"\t,\t", b"  ,  ", b"1\r,2", b"1,2\r3",
+                                      b" 1 , 2 ", b"1,2\r", b"nan,1", b"1_0,2"])
+    def test_edge_lines_match_python_engine(self, tmp_path, caplog, line):
+        pytest.importorskip("numpy")
+        from parallel import parallel_fit_csv
+        path = tmp_path / "edge.csv"
+        path.write_bytes(b"km,price\n1,2\n" + line + b"\n3,4\n5,7\n")
+        X, y = load_csv_data(str(path))
+        X_fast, y_fast = load_csv_data(str(path), engine="fast")
+        assert [repr(float(v)) for v in X_fast] == [repr(v) for v in X]
+        assert [repr(float(v)) for v in y_fast] == [repr(v) for v in y]
+        python_lines = [r.getMessage() for r in caplog.records if "Línea" in r.getMessage()]
+        assert len(python_lines) % 2 == 0
+        assert python_lines[:len(python_lines) // 2] == python_lines[len(python_lines) // 2:]
+        if X:
+            assert parallel_fit_csv(str(path), workers=1).stats.n == len(X)
+        else:
+            with pytest.raises(ValueError):
+                parallel_fit_csv(str(path), workers=1)
+
+    def test_unknown_engine(self, tmp_path):
+        csv_file = write_csv(tmp_path / "data.csv", ["1,2"])
+        with pytest.raises(ValueError):
+            load_csv_data(csv_file, engine="c")
+
+
+class TestBinaryFormat:
+    def test_roundtrip(self, tmp_path):
+        from data_utils import convert_csv_to_binary, load_binary_data, read_binary_header
+        csv_file = write_csv(tmp_path / "data.csv", [f"{i * 1000},{9000 - i}" for i in range(30)])
+        binary_file = str(tmp_path / "data.lrbin")
+        assert convert_csv_to_binary(csv_file, binary_file, chunk_size=7) == 30
+        header = read_binary_header(binary_file)
+        assert header["n_rows"] == 30
+        assert header["column_names"] == ["km", "price"]
+        assert header["header_size"] % 64 == 0
+        X, y = load_binary_data(binary_file)
+        X_csv, y_csv = load_csv_data(csv_file)
+        assert list(X) == X_csv
+        assert list(y) == y_csv
+
+    def test_memoryview_without_numpy(self, tmp_path, monkeypatch):
+        import _backend
+        from data_utils import convert_csv_to_binary, load_binary_data
+        from linear_regression import LinearRegression
+        monkeypatch.setattr(_backend, "USE_NUMPY", False)
+        csv_file = write_csv(tmp_path / "data.csv", [f"{i},{2 * i + 1}" for i in range(10)])
+        binary_file = str(tmp_path / "data.lrbin")
+        convert_csv_to_binary(csv_file, binary_file)
+        X, y = load_binary_data(binary_file)
+        assert isinstance(X, memoryview)
+        model = LinearRegression()
+        model.fit(X, y)
+        assert model.slope == pytest.approx(2.0)
+
+    def test_rejects_other_files(self, tmp_path):
+        from data_utils import load_binary_data
+        csv_file = write_csv(tmp_path / "data.csv", ["1,2"])
+        with pytest.raises(ValueError):
+            load_binary_data(csv_file)
+
+
+class TestSyntheticData:
+    def check_distribution(self, X, y, n, noise=0.1, slope=-0.02, intercept=9000.0):
+        for i, (x_val, y_val) in enumerate(zip(X, y)):
+            assert abs(x_val - i * 100.0 / n) <= 5
+            y_perfect = slope * x_val + intercept
+            assert abs(y_val - y_perfect) <= noise * abs(y_perfect) + 1e-9
+
+    def test_seed_is_reproducible_across_chunk_sizes(self):
+        from data_utils import iter_linear_data
+        small = [v for X_chunk, _ in iter_linear_data(1000, seed=7, chunk_size=64) for v in X_chunk]
+        large = [v for X_chunk, _ in iter_linear_data(1000, seed=7) for v in X_chunk]
+        assert small == large
+        other = [v for X_chunk, _ in iter_linear_data(1000, seed=8) for v in X_chunk]
+        assert small != other
+
+    def test_distribution_is_preserved(self, monkeypatch):
+        import _backend
+        from data_utils import iter_linear_data, generate_linear_data
+        for use_numpy in (True, False):
+            monkeypatch.setattr(_backend, "USE_NUMPY", use_numpy)
+            chunks = list(iter_linear_data(500, slope=-0.02, intercept=9000.0, seed=1, chunk_size=100))
+            assert len(chunks) == 5
+            self.check_distribution([v for c, _ in chunks for v in c], [v for _, c in chunks for v in c], 500)
+        X, y = generate_linear_data(500, slope=-0.02, intercept=9000.0, seed=1)
+        self.check_distribution(X, y, 500)
+        assert generate_linear_data(50, seed=3) == generate_linear_data(50, seed=3)
+
+    def test_x_range(self, monkeypatch):
+        import _backend
+        from data_utils import iter_linear_data
+        from linear_regression import LinearRegression
+        for use_numpy in (True, False):
+            monkeypatch.setattr(_backend, "USE_NUMPY", use_numpy)
+            X = [v for c, _ in iter_linear_data(400, slope=-0.021, intercept=8500.0, seed=2,
+                                                x_range=(20000.0, 250000.0)) for v in c]
+            for i, x_val in enumerate(X):
+                assert abs(x_val - (20000.0 + i * 230000.0 / 400)) <= 0.05 * 230000.0
+            model = LinearRegression()
+            model.fit(*[[v for chunk in column for v in chunk]
+                        for column in zip(*iter_linear_data(400, slope=-0.021, intercept=8500.0, seed=2,
+                                                            x_range=(20000.0, 250000.0)))])
+            assert model.slope == pytest.approx(-0.021, rel=0.2)
+        with pytest.raises(ValueError):
+            next(iter_linear_data(10, x_range=(5.0, 5.0)))
+        # Dataset.generate da los mismos datos que iter_linear_data
+        from data_utils import Dataset
+        data = Dataset.generate(50, seed=2, x_range=(20000.0, 250000.0))
+        assert list(data.X) == [v for c, _ in iter_linear_data(50, seed=2, x_range=(20000.0, 250000.0)) for v in c]
+
+    def test_writes_csv_and_binary(self, tmp_path):
+        from data_utils import write_linear_data, load_binary_data, iter_linear_data
+        csv_file = str(tmp_path / "synthetic.csv")
+        binary_file = str(tmp_path / "synthetic.lrbin")
+        assert write_linear_data(csv_file, 300, seed=5, chunk_size=128) == 300
+        write_linear_data(binary_file, 300, seed=5, chunk_size=128)
+        expected_X = [v for X_chunk, _ in iter_linear_data(300, seed=5) for v in X_chunk]
+        expected_y = [v for _, y_chunk in iter_linear_data(300, seed=5) for v in y_chunk]
+        X_csv, y_csv = load_csv_data(csv_file)
+        X_bin, y_bin = load_binary_data(binary_file)
+        assert X_csv == expected_X
+        assert y_csv == expected_y
+        assert list(X_bin) == expected_X
+        assert list(y_bin) == expected_y
+
+
+class TestSplit:
+    def test_indices_are_seeded_and_disjoint(self):
+        from data_utils import split_indices
+        train, test = split_indices(100, test_size=0.25, seed=3)
+        assert len(train) == 75 and len(test) == 25
+        assert sorted(list(train) + list(test)) == list(range(100))
+        again_train, _ = split_indices(100, test_size=0.25, seed=3)
+        assert list(again_train) == list(train)
+
+    def test_views_match_copies(self):
+        from data_utils import split_data, IndexedView
+        from linear_regression import LinearRegression
+        X = [float(i) for i in range(1000)]
+        y = [3.0 * v + 1.0 for v in X]
+        copies = split_data(X, y, test_size=0.2, seed=1)
+        views = split_data(X, y, test_size=0.2, seed=1, views=True)
+        assert all(isinstance(view, IndexedView) for view in views)
+        assert views[0].base is X
+        for copy, view in zip(copies, views):
+            assert list(view) == list(copy)
+        model = LinearRegression()
+        model.fit(views[0], views[2])
+        assert model.slope == pytest.approx(3.0)
+        assert model.score(views[1], views[3]) == pytest.approx(1.0)
+
+    def test_hash_split_is_stable_and_balanced(self, monkeypatch):
+        import _backend
+        from data_utils import hash_split_mask
+        vectorised = list(hash_split_mask(0, 20000, test_size=0.3, seed=9))
+        monkeypatch.setattr(_backend, "USE_NUMPY", False)
+        pure = hash_split_mask(0, 20000, test_size=0.3, seed=9)
+        assert [bool(v) for v in vectorised] == pure
+        assert sum(pure) / len(pure) == pytest.approx(0.3, abs=0.02)
+        assert hash_split_mask(150, 50, test_size=0.3, seed=9) == pure[150:200]
+        assert all(hash_split_mask(0, 10, test_size=1.0))
+        assert not any(hash_split_mask(0, 10, test_size=0.0))
+
+    def test_streaming_split_ignores_chunk_size(self, tmp_path):
+        from data_utils import iter_csv_split_chunks
+        csv_file = write_csv(tmp_path / "data.csv", [f"{i},{i}" for i in range(2000)])
+
+        def collect(chunk_size):
+            train, test = [], []
+            for X_train, _, X_test, _ in iter_csv_split_chunks(csv_file, 0.2, seed=4, chunk_size=chunk_size):
+                train += list(X_train)
+                test += list(X_test)
+            return train, test
+
+        train, test = collect(2000)
+        assert collect(77) == (train, test)
+        assert sorted(train + test) == [float(i) for i in range(2000)]
+
+
+class TestDataset:
+    def test_from_csv_uses_compact_columns(self, tmp_path, monkeypatch):
+        import _backend
+        from array import array
+        from data_utils import Dataset
+        monkeypatch.setattr(_backend, "USE_NUMPY", False)
+        csv_file = write_csv(tmp_path / "data.csv", [f"{i},{2 * i + 1}" for i in range(10)])
+        data = Dataset.from_csv(csv_file)
+        assert isinstance(data.X, array) and data.X.typecode == 'd'
+        assert len(data) == 10
+        assert data.nbytes == 160
+        X, y = data.columns()
+        assert X is data.X and y is data.y
+        assert list(X) == [float(i) for i in range(10)]
+        assert data[3] == (3.0, 7.0)
+        # Iterar y indexar ven las mismas filas
+        assert list(data) == [data[i] for i in range(len(data))]
+        assert list(data[2:4]) == [(2.0, 5.0), (3.0, 7.0)]
+        assert len(Dataset.from_csv(str(tmp_path / "missing.csv"))) == 0
+
+    def test_slices_are_views(self):
+        from data_utils import Dataset
+        data = Dataset([float(i) for i in range(10)], [float(2 * i) for i in range(10)])
+        part = data[2:5]
+        assert isinstance(part, Dataset)
+        assert list(part.X) == [2.0, 3.0, 4.0]
+        assert memoryview(part.X).obj is memoryview(data.X).obj
+        with pytest.raises(ValueError):
+            Dataset([1.0, 2.0], [1.0])
+
+    def test_accepted_by_model_and_metrics(self):
+        from data_utils import Dataset
+        from linear_regression import LinearRegression
+        from metrics import mean_squared_error, compute_all
+        data = Dataset.generate(2000, noise=0.0, slope=-2.0, intercept=50.0, seed=3)
+        model = LinearRegression()
+        model.fit(data)
+        assert model.slope == pytest.approx(-2.0)
+        predictions = model.predict(data)
+        assert mean_squared_error(data, predictions) == pytest.approx(0.0, abs=1e-12)
+        assert compute_all(data, predictions)["r2"] == pytest.approx(1.0)
+        assert model.score(data) == pytest.approx(1.0)
+        train, test = data.split(test_size=0.25, seed=0)
+        assert (len(train), len(test)) == (1500, 500)
+        model.partial_fit(test[:100])
+        assert model.evaluate_chunks([train[:500], train[500:]])["r2"] == pytest.approx(1.0)
+        with pytest.raises(ValueError):
+            model.fit(data, data.y)
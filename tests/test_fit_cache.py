@@ -0,0 +1,102 @@
+import os
+import pytest
+import sys
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from fit_cache import FitCache
+from linear_regression import LinearRegression
+
+
+def rows(start, stop):
+    return "".join(f"{i * 1000},{9000 - 2.5 * i + (i % 7)}\n" for i in range(start, stop))
+
+
+def full_fit(path):
+    X, y = [], []
+    with open(path) as file:
+        next(file)
+        for line in file:
+            km, price = line.split(",")
+            X.append(float(km))
+            y.append(float(price))
+    model = LinearRegression()
+    model.fit(X, y)
+    return model
+
+
+class TestFitCache:
+    def test_unchanged_file_is_a_hit(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("km,price\n" + rows(0, 100))
+        cache = FitCache(str(tmp_path / "cache"))
+        first, status = cache.fit(str(csv_file), workers=1)
+        assert status == "miss"
+        second, status = cache.fit(str(csv_file), workers=1)
+        assert status == "hit"
+        assert second.slope == first.slope and second.intercept == first.intercept
+        assert second.data_hash == first.data_hash
+
+    def test_touched_file_with_same_content_is_a_hit(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("km,price\n" + rows(0, 100))
+        cache = FitCache(str(tmp_path / "cache"))
+        cache.fit(str(csv_file), workers=1)
+        os.utime(csv_file, ns=(1, 1))
+        assert cache.fit(str(csv_file), workers=1)[1] == "hit"
+
+    def test_appended_rows_only_parse_the_tail(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("km,price\n" + rows(0, 100))
+        cache = FitCache(str(tmp_path / "cache"))
+        cache.fit(str(csv_file), workers=1)
+        with open(csv_file, "a") as file:
+            file.write(rows(100, 160))
+        model, status = cache.fit(str(csv_file), workers=1)
+        assert status == "append"
+        expected = full_fit(csv_file)
+        assert model.stats.n == 160
+        assert model.slope == pytest.approx(expected.slope)
+        assert model.intercept == pytest.approx(expected.intercept)
+        assert cache.fit(str(csv_file), workers=1)[1] == "hit"
+
+    def test_rewritten_file_is_refit(self, tmp_path):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("km,price\n" + rows(0, 100))
+        cache = FitCache(str(tmp_path / "cache"))
+        cache.fit(str(csv_file), workers=1)
+        csv_file.write_text("km,price\n" + rows(50, 200))
+        model, status = cache.fit(str(csv_file), workers=1)
+        assert status == "miss"
+        assert model.stats.n == 150
+
+    def test_bad_appended_line_keeps_global_line_number(self, tmp_path, caplog):
+        csv_file = tmp_path / "data.csv"
+        csv_file.write_text("km,price\n" + rows(0, 10))
+        cache = FitCache(str(tmp_path / "cache"))
+        cache.fit(str(csv_file), workers=1)
+        with open(csv_file, "a") as file:
+            file.write("1,2\nx,3\n")
+        with pytest.raises(ValueError):
+            cache.fit(str(csv_file), workers=1)
+        assert "Línea 13" in caplog.text
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = FitCache(str(tmp_path / "cache"), max_entries=2)
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.csv"
+            path.write_text("km,price\n" + rows(0, 20))
+            paths.append(str(path))
+        cache.fit(paths[0], workers=1)
+        cache.fit(paths[1], workers=1)
+        os.utime(cache._entry_path(paths[1]), ns=(1, 1))
+        cache.fit(paths[0], workers=1)
+        cache.fit(paths[2], workers=1)
+        assert len(cache) == 2
+        assert cache.fit(paths[0], workers=1)[1] == "hit"
+        assert cache.fit(paths[1], workers=1)[1] == "miss"
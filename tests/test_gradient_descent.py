@@ -0,0 +1,71 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from gradient_descent import GradientDescentRegression
+from linear_regression import LinearRegression
+
+X = [float(i * 5000 + (i % 3) * 700) for i in range(60)]
+y = [9000.0 - 0.02 * x + ((i * 13) % 17 - 8) * 40 for i, x in enumerate(X)]
+
+
+class TestGradientDescent:
+    def test_full_batch_matches_closed_form(self):
+        closed = LinearRegression()
+        closed.fit(X, y)
+        model = GradientDescentRegression(learning_rate=0.5, tolerance=1e-10)
+        model.fit(X, y)
+        assert model.converged is True
+        assert model.n_iterations > 0
+        assert model.iterations_per_second > 0
+        assert model.slope == pytest.approx(closed.slope, rel=1e-6)
+        assert model.intercept == pytest.approx(closed.intercept, rel=1e-6)
+
+    def test_mini_batch_over_chunks(self):
+        closed = LinearRegression()
+        closed.fit(X, y)
+        chunks = [(X[i:i + 16], y[i:i + 16]) for i in range(0, len(X), 16)]
+        model = GradientDescentRegression(learning_rate=0.05, max_iterations=500,
+                                          tolerance=1e-6, batch_size=8, seed=0)
+        model.fit_chunks(chunks)
+        assert model.slope == pytest.approx(closed.slope, rel=0.05)
+        assert model.score(X, y) == pytest.approx(closed.score(X, y), abs=0.01)
+
+    def test_chunks_from_csv_loader(self, tmp_path):
+        from data_utils import iter_csv_chunks
+        csv_file = tmp_path / "cars.csv"
+        csv_file.write_text("km,price\n" + "\n".join(f"{x!r},{v!r}" for x, v in zip(X, y)) + "\n")
+        model = GradientDescentRegression(learning_rate=0.05, max_iterations=500, batch_size=8, seed=0)
+        # Un generador se agotaría en la primera pasada: hay que pasar una función
+        with pytest.raises(TypeError):
+            model.fit_chunks(iter_csv_chunks(str(csv_file), chunk_size=16))
+        model.fit_chunks(lambda: iter_csv_chunks(str(csv_file), chunk_size=16))
+        closed = LinearRegression()
+        closed.fit(X, y)
+        assert model.slope == pytest.approx(closed.slope, rel=0.05)
+        passes = iter([[(X, y)], []])
+        with pytest.raises(ValueError):
+            model.fit_chunks(lambda: iter(next(passes)))
+
+    def test_numpy_path(self):
+        np = pytest.importorskip("numpy")
+        model = GradientDescentRegression(learning_rate=0.5, tolerance=1e-10)
+        model.fit(np.array(X), np.array(y))
+        closed = LinearRegression()
+        closed.fit(X, y)
+        assert model.slope == pytest.approx(closed.slope, rel=1e-6)
+
+    def test_not_incremental(self):
+        model = GradientDescentRegression(learning_rate=0.5)
+        assert not hasattr(model, "partial_fit")
+        assert not hasattr(model, "merge")
+        # Sus estadísticos sí se pueden incorporar a un LinearRegression
+        model.fit(X, y)
+        closed = LinearRegression().merge(model)
+        assert closed.slope == pytest.approx(model.slope, rel=1e-4)
@@ -158,3 +158,186 @@ class TestDataUtils:
         assert r2 > 0.7, f"❌ El modelo ajustado debe tener un R² aceptable (>0.7), obtenido: {r2}"
         print("✅ R² aceptable")
         print("🎉 [Test] test_generate_linear_data completado exitosamente!")
+
+
+
+class TestNumpyBackend:
+    def test_fit_matches_pure_python(self, monkeypatch):
+        np = pytest.importorskip("numpy")
+        import _backend
+        X = [float(i) for i in range(1000)]
+        y = [3.0 * x - 7.0 + (i % 5) for i, x in enumerate(X)]
+        fast = LinearRegression()
+        fast.fit(np.array(X), np.array(y))
+        monkeypatch.setattr(_backend, "USE_NUMPY", False)
+        slow = LinearRegression()
+        slow.fit(X, y)
+        assert fast.slope == pytest.approx(slow.slope)
+        assert fast.intercept == pytest.approx(slow.intercept)
+
+    def test_predict_keeps_input_type(self):
+        np = pytest.importorskip("numpy")
+        model = LinearRegression()
+        model.fit([0.0, 1.0, 2.0], [1.0, 3.0, 5.0])
+        X = np.arange(1000, dtype=np.float64)
+        assert isinstance(model.predict(X), np.ndarray)
+        assert isinstance(model.predict(X.tolist()), list)
+        assert model.mse(X, 2 * X + 1) == pytest.approx(0.0)
+        assert model.score(X, 2 * X + 1) == pytest.approx(1.0)
+
+
+
+class TestPartialFit:
+    X = [float(i) + (i % 3) * 0.5 for i in range(40)]
+    y = [-2.5 * x + 100.0 + (i % 7) for i, x in enumerate(X)]
+
+    def test_partial_fit_matches_fit(self):
+        full = LinearRegression()
+        full.fit(self.X, self.y)
+        online = LinearRegression()
+        for start in range(0, 40, 7):
+            online.partial_fit(self.X[start:start + 7], self.y[start:start + 7])
+        assert online.is_fitted is True
+        assert online.slope == pytest.approx(full.slope)
+        assert online.intercept == pytest.approx(full.intercept)
+
+    def test_merge_shards(self):
+        full = LinearRegression()
+        full.fit(self.X, self.y)
+        left = LinearRegression().partial_fit(self.X[:15], self.y[:15])
+        right = LinearRegression().partial_fit(self.X[15:], self.y[15:])
+        merged = left.merge(right)
+        assert merged.stats.n == 40
+        assert merged.slope == pytest.approx(full.slope)
+        assert merged.intercept == pytest.approx(full.intercept)
+
+    def test_stable_with_large_offset(self):
+        from linear_regression import RegressionStats
+        X = [1e9 + i for i in range(10)]
+        y = [2.0 * i for i in range(10)]
+        slope, _ = RegressionStats.from_data(X, y).coefficients()
+        assert slope == pytest.approx(2.0)
+
+
+
+class TestLogging:
+    def test_silent_by_default(self, capsys):
+        model = LinearRegression()
+        model.fit([1.0, 2.0, 3.0], [2.0, 4.0, 6.5])
+        model.predict([4.0, 5.0])
+        captured = capsys.readouterr()
+        assert captured.out == ""
+        assert captured.err == ""
+
+    def test_messages_when_enabled(self, caplog):
+        import logging
+        caplog.set_level(logging.INFO)
+        model = LinearRegression()
+        model.fit([1.0, 2.0, 3.0], [2.0, 4.0, 6.0])
+        model.predict([4.0])
+        assert "Rango de predicciones" in caplog.text
+
+
+
+class TestPersistence:
+    def test_save_load_roundtrip(self, tmp_path):
+        model = LinearRegression()
+        model.fit([10.0, 20.0, 30.0, 40.0], [5.0, 4.0, 2.5, 1.0])
+        model.data_hash = "abc123"
+        path = str(tmp_path / "model.json")
+        model.save(path)
+        loaded = LinearRegression.load(path)
+        assert loaded.is_fitted is True
+        assert loaded.slope == model.slope
+        assert loaded.intercept == model.intercept
+        assert loaded.stats.to_dict() == model.stats.to_dict()
+        assert loaded.data_hash == "abc123"
+        assert loaded.predict([25.0]) == model.predict([25.0])
+
+    def test_load_rejects_unknown_version(self, tmp_path):
+        import json
+        path = tmp_path / "model.json"
+        path.write_text(json.dumps({"format": "ft_linear_regression.model", "version": 99}))
+        with pytest.raises(ValueError):
+            LinearRegression.load(str(path))
+
+    def test_save_requires_fit(self, tmp_path):
+        with pytest.raises(ValueError):
+            LinearRegression().save(str(tmp_path / "model.json"))
+
+
+
+class TestClosedFormEvaluation:
+    X = [float(i) for i in range(50)]
+    y = [1.5 * x + 4.0 + ((i * 7) % 11 - 5) for i, x in enumerate(X)]
+
+    def test_training_metrics_match_data_pass(self):
+        model = LinearRegression()
+        model.fit(self.X, self.y)
+        assert model.training_mse() == pytest.approx(model.mse(self.X, self.y))
+        assert model.training_score() == pytest.approx(model.score(self.X, self.y))
+
+    def test_training_metrics_after_merge(self):
+        model = LinearRegression().partial_fit(self.X[:20], self.y[:20])
+        model.merge(LinearRegression().partial_fit(self.X[20:], self.y[20:]))
+        assert model.training_score() == pytest.approx(r_squared(self.y, model.predict(self.X)))
+
+    def test_evaluate_chunks_matches_evaluate(self):
+        model = LinearRegression()
+        model.fit(self.X, self.y)
+        chunks = [(self.X[i:i + 8], self.y[i:i + 8]) for i in range(0, 50, 8)]
+        full = model.evaluate(self.X, self.y)
+        streamed = model.evaluate_chunks(chunks)
+        for name in full:
+            assert streamed[name] == pytest.approx(full[name])
+        assert full["mse"] == pytest.approx(mean_squared_error(self.y, model.predict(self.X)))
+
+
+
+class TestPredictionCache:
+    X = [1.0, 2.0, 3.0, 4.0]
+    y = [3.0, 5.0, 7.0, 9.0]
+
+    def test_predict_one_matches_predict(self):
+        model = LinearRegression()
+        model.fit(self.X, self.y)
+        assert model.predict_one(10.0) == model.predict([10.0])[0]
+        assert model.cache_info() is None
+
+    def test_predict_one_without_fit(self):
+        with pytest.raises(ValueError):
+            LinearRegression(cache_size=8).predict_one(1.0)
+
+    def test_hits_misses_and_evictions(self):
+        model = LinearRegression(cache_size=2)
+        model.fit(self.X, self.y)
+        for km in (1.0, 1.0, 2.0, 3.0, 1.0):
+            model.predict_one(km)
+        info = model.cache_info()
+        assert info["hits"] == 1
+        assert info["misses"] == 4
+        assert info["evictions"] == 2
+        assert info["size"] == 2
+
+    def test_invalidated_by_fit_and_partial_fit(self):
+        model = LinearRegression(cache_size=8)
+        model.fit(self.X, self.y)
+        assert model.predict_one(10.0) == pytest.approx(21.0)
+
+        model.fit(self.X, [-v for v in self.y])
+        assert model.predict_one(10.0) == pytest.approx(-21.0)
+
+        model.partial_fit([5.0, 6.0], [0.0, 0.0])
+        assert model.predict_one(10.0) == pytest.approx(model.slope * 10.0 + model.intercept)
+        assert model.cache_info()["hits"] == 0
+        assert model.cache_info()["invalidations"] == 2
+
+    def test_refit_with_same_parameters_keeps_cache(self):
+        model = LinearRegression(cache_size=8)
+        model.fit(self.X, self.y)
+        version = model.version
+        model.predict_one(10.0)
+        model.fit(self.X, self.y)
+        assert model.version == version
+        model.predict_one(10.0)
+        assert model.cache_info()["hits"] == 1
@@ -0,0 +1,33 @@
+import pytest
+import sys
+import os
+# Añadir la raíz del proyecto y src al path para importar main y los módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+for path in (parent_dir, src_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from main import build_model, parse_args
+from data_utils import Dataset
+
+
+class TestBuildModel:
+    @pytest.mark.parametrize("flags, name", [
+        ([], "LinearRegression"),
+        (["--gradient-descent"], "GradientDescentRegression"),
+        (["--robust", "huber"], "HuberRegression"),
+        (["--robust", "ransac"], "RANSACRegression"),
+        (["--robust", "theil-sen"], "TheilSenRegression"),
+    ])
+    def test_fits_dataset(self, flags, name):
+        # main.py entrena siempre con model.fit(data)
+        model = build_model(parse_args(["main.py", "data.csv", *flags]))
+        assert type(model).__name__ == name
+        data = Dataset.generate(300, noise=0.01, slope=-20.0, intercept=9000.0, seed=4)
+        model.fit(data)
+        assert model.is_fitted
+        assert model.slope == pytest.approx(-20.0, rel=0.05)
+        assert len(model.predict(data)) == len(data)
+        assert model.training_mse() >= 0
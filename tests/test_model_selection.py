@@ -0,0 +1,78 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import model_selection
+from model_selection import cross_validate, repeated_holdout, k_fold_indices
+from linear_regression import LinearRegression, RegressionStats
+from metrics import compute_all
+
+X = [float(i * 5000 + (i % 3) * 700) for i in range(103)]
+y = [9000.0 - 0.02 * x + ((i * 13) % 17 - 8) * 40 for i, x in enumerate(X)]
+
+
+def refit_fold(test_indices):
+    test = set(int(i) for i in test_indices)
+    X_train = [x for i, x in enumerate(X) if i not in test]
+    y_train = [v for i, v in enumerate(y) if i not in test]
+    model = LinearRegression()
+    model.fit(X_train, y_train)
+    X_test = [X[i] for i in sorted(test)]
+    y_test = [y[i] for i in sorted(test)]
+    return model, compute_all(y_test, model.predict(X_test))
+
+
+class TestStatsSubtract:
+    def test_subtract_inverts_merge(self):
+        total = RegressionStats.from_data(X, y)
+        part = RegressionStats.from_data(X[:40], y[:40])
+        rest = total.copy().subtract(part)
+        expected = RegressionStats.from_data(X[40:], y[40:])
+        for name in ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy"):
+            assert getattr(rest, name) == pytest.approx(getattr(expected, name), rel=1e-9)
+        assert total.copy().subtract(total).n == 0
+        with pytest.raises(ValueError):
+            part.copy().subtract(total)
+
+
+class TestCrossValidation:
+    def test_k_fold_partitions_rows(self):
+        folds = k_fold_indices(103, n_splits=5, seed=1)
+        assert [len(f) for f in folds] == [21, 21, 21, 20, 20]
+        assert sorted(int(i) for f in folds for i in f) == list(range(103))
+        with pytest.raises(ValueError):
+            k_fold_indices(3, n_splits=5)
+
+    def test_k_fold_matches_refitting(self):
+        result = cross_validate(X, y, n_splits=4, seed=2, workers=1)
+        folds = k_fold_indices(len(X), n_splits=4, seed=2)
+        assert len(result.folds) == 4
+        for fold, test_indices in zip(result.folds, folds):
+            model, metrics = refit_fold(test_indices)
+            assert fold["slope"] == pytest.approx(model.slope, rel=1e-9)
+            assert fold["intercept"] == pytest.approx(model.intercept, rel=1e-9)
+            for name in ("mse", "rmse", "mae", "r2"):
+                assert fold[name] == pytest.approx(metrics[name], rel=1e-7)
+        assert "media" in result.table()
+        assert result.mean()["mse"] == pytest.approx(sum(f["mse"] for f in result.folds) / 4)
+
+    def test_repeated_holdout(self):
+        result = repeated_holdout(X, y, test_size=0.25, n_repeats=3, seed=5, workers=1)
+        assert [f["n_test"] for f in result.folds] == [25, 25, 25]
+        assert all(f["n_train"] == 78 for f in result.folds)
+        with pytest.raises(ValueError):
+            repeated_holdout(X, y, test_size=0.0)
+
+    def test_process_pool_gives_same_table(self, monkeypatch):
+        serial = cross_validate(X, y, n_splits=3, seed=0, workers=1)
+        monkeypatch.setattr(model_selection, "MIN_PARALLEL_SAMPLES", 1)
+        parallel = cross_validate(X, y, n_splits=3, seed=0, workers=2)
+        for a, b in zip(serial.folds, parallel.folds):
+            assert a["mse"] == pytest.approx(b["mse"])
+            assert a["mae"] == pytest.approx(b["mae"])
@@ -0,0 +1,95 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import _backend
+from multivariate import MultipleLinearRegression
+from linear_regression import LinearRegression
+from data_utils import iter_csv_matrix_chunks
+
+# y = 5000 - 0.02·km + 300·edad - 10·potencia + ruido determinista
+ROWS = [[100000.0 + i * 3700.0, float(i % 11), 90.0 + (i * 7) % 40] for i in range(200)]
+Y = [5000.0 - 0.02 * km + 300.0 * age - 10.0 * power + ((i * 13) % 17 - 8) * 5
+     for i, (km, age, power) in enumerate(ROWS)]
+EXACT_Y = [5000.0 - 0.02 * km + 300.0 * age - 10.0 * power for km, age, power in ROWS]
+
+
+class TestMultipleLinearRegression:
+    @pytest.mark.parametrize("solver", ["cholesky", "qr"])
+    def test_recovers_exact_coefficients(self, solver):
+        model = MultipleLinearRegression(solver=solver)
+        model.fit(ROWS, EXACT_Y)
+        assert model.coefficients == pytest.approx([-0.02, 300.0, -10.0], rel=1e-8)
+        assert model.intercept == pytest.approx(5000.0, rel=1e-8)
+        assert model.training_mse() == pytest.approx(0.0, abs=1e-6)
+
+    def test_solvers_agree_and_chunks_match_full_fit(self):
+        full = MultipleLinearRegression(solver="qr").fit(ROWS, Y)
+        chunked = MultipleLinearRegression(solver="cholesky")
+        chunked.fit_chunks((ROWS[i:i + 37], Y[i:i + 37]) for i in range(0, len(ROWS), 37))
+        assert chunked.n_samples == len(ROWS)
+        assert chunked.coefficients == pytest.approx(full.coefficients, rel=1e-7)
+        assert chunked.intercept == pytest.approx(full.intercept, rel=1e-7)
+
+    @pytest.mark.parametrize("solver", ["cholesky", "qr"])
+    def test_training_metrics_match_evaluate(self, solver):
+        model = MultipleLinearRegression(solver=solver).fit(ROWS, Y)
+        metrics = model.evaluate(ROWS, Y)
+        assert model.training_mse() == pytest.approx(metrics["mse"], rel=1e-6)
+        assert model.training_score() == pytest.approx(metrics["r2"], rel=1e-9)
+
+    def test_single_feature_matches_simple_regression(self):
+        X = [row[0] for row in ROWS]
+        simple = LinearRegression()
+        simple.fit(X, Y)
+        model = MultipleLinearRegression().fit(X, Y)
+        assert model.coefficients[0] == pytest.approx(simple.slope, rel=1e-9)
+        assert model.intercept == pytest.approx(simple.intercept, rel=1e-9)
+
+    def test_numpy_and_pure_paths_agree(self):
+        np = pytest.importorskip("numpy")
+        X_np = np.array(ROWS)
+        for solver in ("cholesky", "qr"):
+            vectorised = MultipleLinearRegression(solver=solver).fit(X_np, np.array(Y))
+            _backend.USE_NUMPY = False
+            try:
+                pure = MultipleLinearRegression(solver=solver).fit(ROWS, Y)
+            finally:
+                _backend.USE_NUMPY = True
+            assert vectorised.coefficients == pytest.approx(pure.coefficients, rel=1e-8)
+            assert isinstance(vectorised.predict(X_np), np.ndarray)
+
+    def test_collinear_features_raise(self):
+        rows = [[x, 2 * x] for x in range(1, 20)]
+        with pytest.raises(ValueError):
+            MultipleLinearRegression().fit(rows, [float(x) for x in range(1, 20)])
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            MultipleLinearRegression(solver="lu")
+        model = MultipleLinearRegression().fit(ROWS, Y)
+        with pytest.raises(ValueError):
+            model.predict([[1.0, 2.0]])
+        with pytest.raises(ValueError):
+            MultipleLinearRegression().predict(ROWS)
+
+    def test_streams_matrix_csv(self, tmp_path):
+        path = tmp_path / "cars.csv"
+        lines = ["km,age,power,price"] + [",".join(str(v) for v in row + [y_val]) for row, y_val in zip(ROWS, Y)]
+        path.write_text("\n".join(lines) + "\n")
+        model = MultipleLinearRegression(solver="qr")
+        model.fit_chunks(iter_csv_matrix_chunks(str(path), chunk_size=50))
+        expected = MultipleLinearRegression(solver="qr").fit(ROWS, Y)
+        assert model.coefficients == pytest.approx(expected.coefficients, rel=1e-9)
+
+    def test_matrix_csv_reports_bad_columns(self, tmp_path):
+        path = tmp_path / "bad.csv"
+        path.write_text("a,b,c\n1,2,3\n4,5\n")
+        with pytest.raises(ValueError):
+            list(iter_csv_matrix_chunks(str(path)))
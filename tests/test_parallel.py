@@ -0,0 +1,65 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+import parallel
+from parallel import parallel_fit_csv, split_file_ranges
+from data_utils import load_csv_data
+from linear_regression import LinearRegression
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    rows = [f"{i * 1000 + (i % 7) * 13},{9000 - i * 2.5 + (i % 5)}" for i in range(3000)]
+    path = tmp_path / "cars.csv"
+    path.write_text("km,price\n" + "\n".join(rows) + "\n")
+    return str(path)
+
+
+class TestParallelFit:
+    def test_ranges_cover_file_on_line_boundaries(self, csv_file):
+        ranges = split_file_ranges(csv_file, 4)
+        assert len(ranges) == 4
+        with open(csv_file, 'rb') as f:
+            content = f.read()
+        assert ranges[0][0] == content.index(b'\n') + 1
+        assert ranges[-1][1] == len(content)
+        for (_, end), (start, _) in zip(ranges, ranges[1:]):
+            assert end == start
+            assert content[start - 1:start] == b'\n'
+
+    def test_matches_serial_fit(self, csv_file, monkeypatch):
+        monkeypatch.setattr(parallel, "MIN_RANGE_BYTES", 1)
+        model = parallel_fit_csv(csv_file, workers=3)
+        X, y = load_csv_data(csv_file)
+        serial = LinearRegression()
+        serial.fit(X, y)
+        assert model.stats.n == len(X)
+        assert model.slope == pytest.approx(serial.slope)
+        assert model.intercept == pytest.approx(serial.intercept)
+
+    def test_bad_line_reports_global_line_number(self, csv_file, monkeypatch, caplog):
+        with open(csv_file, 'a') as f:
+            f.write("1000,abc\n")
+        monkeypatch.setattr(parallel, "MIN_RANGE_BYTES", 1)
+        with pytest.raises(ValueError):
+            parallel_fit_csv(csv_file, workers=3)
+        assert "Línea 3002" in caplog.text
+
+    def test_line_longer_than_read_block(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr(parallel, "READ_BLOCK_BYTES", 8)
+        path = tmp_path / "long.csv"
+        path.write_text("km,price\n1,2\n" + "1" * 30 + ".5,2\n3,abc\n5,6\n")
+        result = parallel._fit_byte_range(str(path), len("km,price\n"), path.stat().st_size)
+        assert result["lines"] == 4
+        assert result["processed"] == 3
+        assert result["errors"][0][0] == 3
+        with pytest.raises(ValueError):
+            parallel_fit_csv(str(path), workers=1)
+        assert "Línea 4" in caplog.text
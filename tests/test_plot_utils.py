@@ -0,0 +1,63 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from plot_utils import line_endpoints, sample_points, density_grid, plot_regression
+
+
+class TestLargeDataPlotting:
+    def test_line_endpoints_ignore_order(self):
+        X = [5.0, 1.0, 9.0, 3.0]
+        y_pred = [2 * x + 1 for x in X]
+        assert line_endpoints(X, y_pred) == ((1.0, 3.0), (9.0, 19.0))
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_sample_is_bounded_and_reproducible(self, monkeypatch, use_numpy):
+        import _backend
+        monkeypatch.setattr(_backend, "USE_NUMPY", use_numpy)
+        X = [float(i) for i in range(5000)]
+        y = [2 * x for x in X]
+        X_sample, y_sample = sample_points(X, y, 100, seed=3)
+        assert len(X_sample) == 100
+        assert all(b == 2 * a for a, b in zip(X_sample, y_sample))
+        assert list(sample_points(X, y, 100, seed=3)[0]) == list(X_sample)
+        assert sample_points(X[:50], y[:50], 100) == (X[:50], y[:50])
+
+    def test_density_grid_matches_histogram2d(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(0)
+        X = rng.uniform(0, 10, 10000)
+        y = rng.normal(0, 1, 10000)
+        counts, x_edges, y_edges = density_grid(np, X, y, bins=20)
+        expected, _, _ = np.histogram2d(X, y, bins=(x_edges, y_edges))
+        assert counts.sum() == 10000
+        assert (counts == expected).all()
+
+    def test_plot_large_data(self, tmp_path, monkeypatch):
+        pytest.importorskip("matplotlib")
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "graphics").mkdir()
+        X = [float(i) for i in range(1000)]
+        y = [3.0 - x for x in X]
+        for mode in ("auto", "sample"):
+            plot_regression(X, y, y, f"{mode}.png", mode=mode, max_points=100)
+            assert (tmp_path / "graphics" / f"{mode}.png").stat().st_size > 0
+        with pytest.raises(ValueError):
+            plot_regression(X, y, y, "bad.png", mode="3d")
+
+    def test_plot_dataset_passes_columns(self, monkeypatch):
+        import plot_utils
+        from data_utils import Dataset
+        calls = []
+        monkeypatch.setattr(plot_utils, "plot_regression", lambda *args, **kwargs: calls.append((args, kwargs)))
+        data = Dataset([1.0, 2.0], [3.0, 4.0])
+        plot_utils.plot_dataset(data, [3.0, 4.0], filename="a.png", mode="sample")
+        assert calls == [((data.X, data.y, [3.0, 4.0], "a.png"), {"mode": "sample"})]
+        with pytest.raises(TypeError):
+            plot_regression([1.0], [1.0], [1.0])
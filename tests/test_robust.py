@@ -0,0 +1,77 @@
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from linear_regression import LinearRegression
+from robust import HuberRegression, RANSACRegression, TheilSenRegression, _RobustRegression
+
+# Precio ≈ 9000 - 0.02·km con ruido pequeño y un 10% de precios absurdos
+X = [float(i * 2500) for i in range(100)]
+y = [9000.0 - 0.02 * x + ((i * 37) % 11 - 5) * 10 for i, x in enumerate(X)]
+for i in range(0, 100, 10):
+    y[i] = 60000.0
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def backend(request, monkeypatch):
+    import _backend
+    monkeypatch.setattr(_backend, "USE_NUMPY", request.param)
+    monkeypatch.setattr(_backend, "NUMPY_MIN_SIZE", 1)
+    return request.param
+
+
+class TestRobustRegression:
+    @pytest.mark.parametrize("make_model", [
+        lambda: HuberRegression(),
+        lambda: RANSACRegression(residual_threshold=200.0, seed=0),
+        lambda: TheilSenRegression(method="exact"),
+        lambda: TheilSenRegression(method="approximate", n_pairs=3000, seed=0),
+    ], ids=["huber", "ransac", "theil-sen", "theil-sen-approx"])
+    def test_resists_outliers(self, backend, make_model):
+        ols = LinearRegression()
+        ols.fit(X, y)
+        model = make_model()
+        model.fit(X, y)
+        assert model.is_fitted is True
+        assert model.training_time >= 0
+        assert abs(model.slope + 0.02) < abs(ols.slope + 0.02) / 5
+        assert model.slope == pytest.approx(-0.02, abs=0.002)
+        assert model.predict_one(100000.0) == pytest.approx(7000.0, abs=500.0)
+        assert model.training_mse() == pytest.approx(model.mse(X, y))
+
+    def test_ransac_finds_the_inliers(self, backend):
+        model = RANSACRegression(residual_threshold=200.0, seed=1)
+        model.fit(X, y)
+        assert model.n_inliers == 90
+        assert 1 <= model.n_trials <= model.max_trials
+        assert not any(model.inlier_mask[i] for i in range(0, 100, 10))
+
+    def test_theil_sen_auto_method(self):
+        small = TheilSenRegression(n_pairs=10000)
+        small.fit(X, y)
+        assert small.method_used == "exact" and small.n_slopes == 4950
+        large = TheilSenRegression(n_pairs=1000, seed=0)
+        large.fit(X, y)
+        assert large.method_used == "approximate" and large.n_slopes <= 1000
+
+    def test_huber_matches_ols_without_outliers(self):
+        clean_y = [9000.0 - 0.02 * x for x in X]
+        model = HuberRegression()
+        model.fit(X, clean_y)
+        assert model.converged is True
+        assert model.slope == pytest.approx(-0.02)
+
+    def test_not_incremental(self):
+        for model in (HuberRegression(), RANSACRegression(), TheilSenRegression()):
+            assert not hasattr(model, "partial_fit")
+            assert not hasattr(model, "merge")
+        with pytest.raises(TypeError):
+            _RobustRegression()
+        with pytest.raises(ValueError):
+            TheilSenRegression().fit([1.0, 1.0, 1.0], [1.0, 2.0, 3.0])
@@ -0,0 +1,109 @@
+import asyncio
+import json
+import pytest
+import sys
+import os
+# Añadir src al path para importar módulos
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+src_dir = os.path.join(parent_dir, 'src')
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+
+from linear_regression import LinearRegression
+from serving import PredictionServer
+
+
+def fitted_model():
+    model = LinearRegression()
+    model.fit([0.0, 100000.0, 200000.0], [9000.0, 7000.0, 5000.0])
+    return model
+
+
+async def http(port, method, path, body=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    data = json.dumps(body).encode() if body is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(data)}\r\n"
+                 f"Connection: close\r\n\r\n".encode() + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, payload = response.split(b"\r\n\r\n", 1)
+    return int(head.split(b" ")[1]), json.loads(payload)
+
+
+async def raw_http(port, request):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return int(response.split(b" ")[1])
+
+
+def serve(test, **kwargs):
+    async def run():
+        server = PredictionServer(fitted_model(), **kwargs)
+        port = await server.start(port=0)
+        try:
+            return await test(server, port)
+        finally:
+            await server.stop()
+    return asyncio.run(run())
+
+
+class TestPredictionServer:
+    def test_get_and_post(self):
+        async def test(server, port):
+            assert await http(port, "GET", "/predict?km=150000") == (200, {"km": 150000.0, "price": pytest.approx(6000.0)})
+            status, payload = await http(port, "POST", "/predict", {"km": [0, 200000]})
+            assert status == 200
+            assert payload["price"] == [pytest.approx(9000.0), pytest.approx(5000.0)]
+            assert (await http(port, "GET", "/health"))[0] == 200
+        serve(test)
+
+    def test_bad_requests(self):
+        async def test(server, port):
+            assert (await http(port, "GET", "/predict?km=abc"))[0] == 400
+            assert (await http(port, "GET", "/predict"))[0] == 400
+            assert (await http(port, "POST", "/predict", {"km": []}))[0] == 400
+            assert (await http(port, "GET", "/nope"))[0] == 404
+            _, metrics = await http(port, "GET", "/metrics")
+            assert metrics["errors"] == 3
+        serve(test)
+
+    def test_invalid_input_is_a_client_error(self):
+        async def test(server, port):
+            for length in (b"abc", b"-5"):
+                request = b"POST /predict HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n{}"
+                assert await raw_http(port, request) == 400
+            assert (await http(port, "GET", "/predict?km=nan"))[0] == 400
+            assert (await http(port, "POST", "/predict", {"km": [1.0, float("inf")]}))[0] == 400
+        serve(test)
+
+    def test_prediction_failure_is_500(self):
+        async def test(server, port):
+            def broken(values):
+                raise RuntimeError("modelo roto")
+            server.model.predict = broken
+            assert await http(port, "GET", "/predict?km=1") == (500, {"error": "modelo roto"})
+            del server.model.predict
+            assert (await http(port, "GET", "/predict?km=1"))[0] == 200
+        serve(test)
+
+    def test_concurrent_requests_are_batched(self):
+        async def test(server, port):
+            results = await asyncio.gather(*(http(port, "GET", f"/predict?km={k * 1000}") for k in range(50)))
+            for k, (status, payload) in enumerate(results):
+                assert status == 200
+                assert payload["price"] == pytest.approx(9000.0 - 0.02 * k * 1000)
+            _, metrics = await http(port, "GET", "/metrics")
+            assert metrics["requests"] == 50
+            assert metrics["batches"] < 50
+            assert metrics["p99_ms"] >= metrics["p50_ms"] > 0
+            assert metrics["qps"] > 0
+        serve(test, max_delay=0.05)
+
+    def test_requires_fitted_model(self):
+        with pytest.raises(ValueError):
+            PredictionServer(LinearRegression())
@@ -0,0 +1,51 @@
+"""
+Benchmark de arranque: vigila lo que importa `python main.py`.
+
+Usa `python -X importtime` en un proceso nuevo para medir los imports
+en frío. El presupuesto se puede ajustar con IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.abspath(os.path.join(current_dir, '..'))
+
+IMPORT_BUDGET_MS = float(os.environ.get("IMPORT_BUDGET_MS", "150"))
+
+
+def import_times(*args):
+    """Ejecutar python -X importtime y devolver {módulo: (acumulado µs, nivel superior)}."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=parent_dir,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, raw_name = line[len("import time:"):].split("|")
+        top_level = not raw_name[1:].startswith(" ")
+        times[raw_name.strip()] = (int(cumulative), top_level)
+    return times
+
+
+class TestStartup:
+    def test_package_import_is_lazy(self):
+        times = import_times("-c", "import src")
+        assert "src" in times
+        for heavy in ("src.data_utils", "src.parallel", "numpy", "matplotlib"):
+            assert heavy not in times, f"❌ `import src` no debería importar {heavy}"
+
+    def test_fit_does_not_import_matplotlib(self, tmp_path):
+        csv_file = tmp_path / "cars.csv"
+        csv_file.write_text("km,price\n" + "\n".join(f"{i * 1000},{9000 - i}" for i in range(20)) + "\n")
+        times = import_times("main.py", str(csv_file), "--workers", "1", "--quiet")
+        assert "matplotlib" not in times
+        assert "matplotlib.pyplot" not in times
+
+    def test_main_import_budget(self):
+        times = import_times("main.py")
+        total_ms = sum(cumulative for cumulative, top_level in times.values() if top_level) / 1000
+        print(f"⏱️  Imports de main.py: {total_ms:.1f} ms (presupuesto {IMPORT_BUDGET_MS:.0f} ms)")
+        assert total_ms < IMPORT_BUDGET_MS